@@ -6,11 +6,17 @@ Optimized for CPU execution on server environments
 
 import os
 import json
+import hashlib
 import logging
 import time
+import threading
 from typing import List, Dict, Any, Optional, Tuple
 from django.utils import timezone
 from django.conf import settings
+from backend.model_preloader import model_preloader
+from backend.model_registry import model_registry, select_device
+from ai_cover_letters.generation_cache import generation_cache, make_cache_key
+from .topic_classifier import TOPIC_LABELS, get_topic_engine, topic_classifier
 
 # Hugging Face imports
 try:
@@ -26,6 +32,38 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# topics kept per chat
+MAX_TOPICS = 10
+
+
+def messages_digest(messages: List[Dict[str, Any]]) -> str:
+    """Content hash of chat messages (only the text; scraped timestamps are often relative)"""
+    digest = hashlib.sha256()
+    for msg in messages:
+        digest.update((msg.get('content') or '').strip().encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def combine_messages(messages: List[Dict[str, Any]]) -> str:
+    """Text the topic classifiers see: the last 10 messages, skipping very short ones"""
+    combined_text = ""
+    for msg in messages[-10:]:  # Last 10 messages for context
+        content = msg.get('content', '').strip()
+        if content and len(content) > 10:  # Skip very short messages
+            combined_text += f" {content}"
+    return combined_text
+
+
+def merge_topics(new_topics: List[str], previous_topics: List[str]) -> List[str]:
+    """Newest topics first, then the stored ones not repeated (case-insensitive), capped at MAX_TOPICS"""
+    merged, seen = [], set()
+    for topic in list(new_topics) + list(previous_topics):
+        if topic.lower() not in seen:
+            seen.add(topic.lower())
+            merged.append(topic)
+    return merged[:MAX_TOPICS]
+
 class AIInterviewEngine:
     """
     Main AI engine for interview question generation and response analysis
@@ -37,7 +75,8 @@ class AIInterviewEngine:
         self.tokenizers = {}
         self.pipelines = {}
         self.model_configs = {}
-        self.is_initialized = False
+        # one load at a time (preloader thread vs. explicit initialize calls)
+        self._init_lock = threading.Lock()
         
         # Default model configurations (CPU-optimized)
         self.default_configs = {
@@ -67,6 +106,10 @@ class AIInterviewEngine:
         """
         Initialize all AI models for CPU execution
         """
+        with self._init_lock:
+            return self._initialize_models(force_reload)
+    
+    def _initialize_models(self, force_reload: bool) -> bool:
         if self.is_initialized and not force_reload:
             logger.info("✅ AI Interview Engine already initialized")
             return True
@@ -79,23 +122,24 @@ class AIInterviewEngine:
             logger.info("🤖 Initializing AI Interview Engine...")
             start_time = time.time()
             
-            # Set to CPU-only mode
-            device = torch.device('cpu')
-            
+            # Models load from their AIModelConfig rows via backend/model_registry.py
             # Initialize question generator (GPT-2)
             logger.info("📝 Loading question generator (GPT-2)...")
-            self._load_question_generator(device)
+            if not model_registry.load('question_generator', force=force_reload):
+                return False
             
-            # Initialize sentiment/analysis pipeline
+            # Initialize sentiment/analysis pipelines (optional: basic analysis is the fallback)
             logger.info("🔍 Loading response analyzer...")
-            self._load_response_analyzer()
+            model_registry.load('response_analyzer', force=force_reload)
             
-            # Initialize topic extractor
-            logger.info("🏷️ Loading topic extractor...")
-            self._load_topic_extractor(device)
+            # Embedding topic engine: embed the candidate labels once, up front
+            if get_topic_engine() == 'embedding':
+                try:
+                    topic_classifier.load()
+                except Exception as e:
+                    logger.warning(f"⚠️ Embedding topic classifier unavailable, using keywords: {e}")
             
             load_time = time.time() - start_time
-            self.is_initialized = True
             
             logger.info(f"✅ AI Interview Engine initialized in {load_time:.2f}s")
             return True
@@ -104,75 +148,90 @@ class AIInterviewEngine:
             logger.error(f"❌ Failed to initialize AI models: {str(e)}")
             return False
     
-    def _load_question_generator(self, device):
-        """Load GPT-2 model for question generation"""
-        model_name = self.default_configs['question_generator']['model_name']
-        
+    @property
+    def is_initialized(self) -> bool:
+        """GPT-2 is the required model; the analyzer pipelines are optional"""
+        return model_registry.is_loaded('question_generator')
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Loaded models / pipelines; a method so it runs where the models live (model server)"""
+        return {
+            'is_initialized': self.is_initialized,
+            'models_loaded': list(self.models.keys()),
+            'pipelines_available': list(self.pipelines.keys()),
+            'transformers_available': TRANSFORMERS_AVAILABLE,
+        }
+    
+    def load_question_generator(self, config):
+        """Registry loader: GPT-2 for question generation (also used for topic extraction)"""
         try:
-            self.tokenizers['question_generator'] = GPT2Tokenizer.from_pretrained(model_name)
-            self.models['question_generator'] = GPT2LMHeadModel.from_pretrained(model_name)
+            device = select_device(config)
+            tokenizer = GPT2Tokenizer.from_pretrained(config.model_path)
+            model = GPT2LMHeadModel.from_pretrained(config.model_path)
             
-            # Move to CPU and set to eval mode
-            self.models['question_generator'].to(device)
-            self.models['question_generator'].eval()
+            # Move to device and set to eval mode
+            model.to(device)
+            model.eval()
             
             # Set pad token if not exists
-            if self.tokenizers['question_generator'].pad_token is None:
-                self.tokenizers['question_generator'].pad_token = self.tokenizers['question_generator'].eos_token
+            if tokenizer.pad_token is None:
+                tokenizer.pad_token = tokenizer.eos_token
+            # batched decoder-only generation needs the padding on the left
+            tokenizer.padding_side = 'left'
             
-            logger.info(f"✅ Question generator loaded: {model_name}")
+            self.tokenizers['question_generator'] = self.tokenizers['topic_extractor'] = tokenizer
+            self.models['question_generator'] = self.models['topic_extractor'] = model
+            logger.info(f"✅ Question generator loaded: {config.model_path} (topic extractor shares it)")
+            return tokenizer, model
             
         except Exception as e:
             logger.error(f"❌ Failed to load question generator: {str(e)}")
             raise
     
-    def _load_response_analyzer(self):
-        """Load pipeline for response analysis"""
+    def unload_question_generator(self, handle=None):
+        for key in ('question_generator', 'topic_extractor'):
+            self.tokenizers.pop(key, None)
+            self.models.pop(key, None)
+    
+    def load_response_analyzer(self, config):
+        """Registry loader: sentiment + zero-shot classification pipelines"""
+        device = 0 if select_device(config) == 'cuda' else -1
         try:
             # Use sentiment analysis pipeline (lightweight)
             self.pipelines['sentiment'] = pipeline(
                 "sentiment-analysis",
                 model="distilbert-base-uncased-finetuned-sst-2-english",
-                device=-1  # Force CPU
+                device=device
             )
             
             # Use text classification for topic analysis
             self.pipelines['classifier'] = pipeline(
                 "zero-shot-classification",
-                model="facebook/bart-large-mnli",
-                device=-1  # Force CPU
+                model=config.model_path,
+                device=device
             )
             
             logger.info("✅ Response analyzer pipelines loaded")
+            return dict(self.pipelines)
             
         except Exception as e:
             logger.error(f"❌ Failed to load response analyzer: {str(e)}")
             # Fall back to basic analysis if advanced pipelines fail
-            self.pipelines['sentiment'] = None
-            self.pipelines['classifier'] = None
-    
-    def _load_topic_extractor(self, device):
-        """Load model for extracting topics from chat content"""
-        model_name = self.default_configs['topic_extractor']['model_name']
-        
-        try:
-            # Reuse GPT-2 tokenizer and model for topic extraction
-            self.tokenizers['topic_extractor'] = self.tokenizers['question_generator']
-            self.models['topic_extractor'] = self.models['question_generator']
-            
-            logger.info("✅ Topic extractor configured (shared GPT-2)")
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to configure topic extractor: {str(e)}")
+            self.unload_response_analyzer()
             raise
     
+    def unload_response_analyzer(self, handle=None):
+        self.pipelines['sentiment'] = None
+        self.pipelines['classifier'] = None
+    
     def extract_topics_from_chat(self, chat_data: Dict[str, Any]) -> List[str]:
         """
         Extract key topics and skills from chat conversation
         """
         try:
             if not self.is_initialized:
-                self.initialize_models()
+                # never load inline: start a background load and use the fallbacks meanwhile
+                model_preloader.ensure('interview')
             
             # Handle both dict and list input
             if isinstance(chat_data, list):
@@ -185,34 +244,76 @@ class AIInterviewEngine:
                 logger.error(f"Invalid chat_data type: {type(chat_data)}")
                 return []
             
-            if not messages:
-                return []
-            
-            # Combine message content
-            combined_text = ""
-            for msg in messages[-10:]:  # Last 10 messages for context
-                content = msg.get('content', '').strip()
-                if content and len(content) > 10:  # Skip very short messages
-                    combined_text += f" {content}"
-            
-            if not combined_text.strip():
-                return []
-            
-            # Extract topics using keyword matching and simple NLP
-            topics = self._extract_keywords(combined_text)
+            topics, _ = self._extract_topics(messages)
+            return topics
             
-            # Use AI classifier if available
-            if self.pipelines.get('classifier'):
-                ai_topics = self._classify_topics_ai(combined_text)
-                topics.extend(ai_topics)
+        except Exception as e:
+            logger.error(f"Error extracting topics: {str(e)}")
+            return []
+    
+    def extract_topics_incremental(self, messages: List[Dict[str, Any]], previous_topics: Optional[List[str]] = None,
+                                   classified_count: int = 0, classified_hash: str = '') -> Tuple[List[str], int, str]:
+        """
+        Topics for a re-ingested chat, classifying only the messages added since the last ingest.
+
+        ``classified_count`` / ``classified_hash`` come from the stored ChatContext: when the
+        first ``classified_count`` messages still hash to ``classified_hash`` only the rest are
+        classified and merged into ``previous_topics``; otherwise the chat is extracted from
+        scratch. Returns (topics, classified_count, classified_hash) to store; the hash stays
+        empty while the zero-shot classifier is not loaded, so those messages are classified later.
+        """
+        try:
+            if not self.is_initialized:
+                model_preloader.ensure('interview')
+            messages = list(messages or [])
+            previous_topics = list(previous_topics or [])
             
-            # Remove duplicates and return top topics
-            unique_topics = list(set(topics))
-            return unique_topics[:10]  # Top 10 topics
+            unchanged_prefix = (
+                classified_hash and 0 < classified_count <= len(messages)
+                and messages_digest(messages[:classified_count]) == classified_hash
+            )
+            if unchanged_prefix:
+                new_messages = messages[classified_count:]
+                if not new_messages:
+                    return previous_topics, classified_count, classified_hash
+                topics, used_ai = self._extract_topics(new_messages)
+                merged = merge_topics(topics, previous_topics)
+                if not used_ai:
+                    # keep the old mark: the new messages get classified once the model is loaded
+                    return merged, classified_count, classified_hash
+                return merged, len(messages), messages_digest(messages)
+            
+            topics, used_ai = self._extract_topics(messages)
+            if not used_ai:
+                return topics, 0, ''
+            return topics, len(messages), messages_digest(messages)
             
         except Exception as e:
             logger.error(f"Error extracting topics: {str(e)}")
-            return []
+            return list(previous_topics or []), 0, ''
+    
+    def _extract_topics(self, messages: List[Dict[str, Any]]) -> Tuple[List[str], bool]:
+        """(topics, classified_with_ai) for the last 10 messages"""
+        if not messages:
+            return [], False
+        
+        combined_text = combine_messages(messages)
+        
+        # Use AI classifier if available
+        used_ai = self._topic_classifier_ready()
+        if not combined_text.strip():
+            return [], used_ai
+        
+        # Extract topics using keyword matching and simple NLP
+        topics = self._extract_keywords(combined_text)
+        
+        if used_ai:
+            ai_topics = self._classify_topics_ai(combined_text)
+            topics.extend(ai_topics)
+        
+        # Remove duplicates and return top topics
+        unique_topics = list(dict.fromkeys(topics))
+        return unique_topics[:MAX_TOPICS], used_ai  # Top 10 topics
     
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract keywords using simple pattern matching"""
@@ -233,23 +334,39 @@ class AIInterviewEngine:
         
         return found_topics
     
+    def _topic_classifier_ready(self) -> bool:
+        """Whether the configured topic engine (INTERVIEW_TOPIC_ENGINE) can classify right now"""
+        if get_topic_engine() == 'embedding':
+            if not topic_classifier.is_loaded:
+                topic_classifier.load_async()
+            return topic_classifier.is_loaded
+        return bool((model_registry.get('response_analyzer') or {}).get('classifier'))
+    
     def _classify_topics_ai(self, text: str) -> List[str]:
         """Use AI classifier to identify topics"""
         try:
-            if not self.pipelines.get('classifier'):
+            if get_topic_engine() == 'embedding':
+                # one MiniLM pass against the pre-embedded labels (AI_interview_chat/topic_classifier.py)
+                return topic_classifier.classify(text)
+            
+            classifier = (model_registry.get('response_analyzer') or {}).get('classifier')
+            if not classifier:
                 return []
             
-            candidate_labels = [
-                "software development", "web development", "mobile development",
-                "data science", "machine learning", "project management",
-                "frontend", "backend", "database", "api development",
-                "testing", "deployment", "cloud computing", "security"
-            ]
+            candidate_labels = TOPIC_LABELS
+            
+            # zero-shot BART is the most expensive call here: identical text reuses the stored labels
+            key = make_cache_key('chat_topics', text[:512], labels=candidate_labels)
+            cached = generation_cache.get(key)
+            if cached is not None:
+                return json.loads(cached)
             
-            result = self.pipelines['classifier'](text[:512], candidate_labels)
+            result = classifier(text[:512], candidate_labels)
             
             # Return high-confidence topics
-            return [label for label, score in zip(result['labels'], result['scores']) if score > 0.3]
+            labels = [label for label, score in zip(result['labels'], result['scores']) if score > 0.3]
+            generation_cache.set(key, json.dumps(labels), namespace='chat_topics')
+            return labels
             
         except Exception as e:
             logger.error(f"Error in AI topic classification: {str(e)}")
@@ -261,92 +378,117 @@ class AIInterviewEngine:
         """
         Generate interview questions based on chat context
         """
+        return self.generate_questions_bulk([{
+            'chat_context': chat_context,
+            'question_type': question_type,
+            'num_questions': num_questions,
+        }])[0]
+    
+    def generate_questions_bulk(self, requests: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Questions for several chats at once: every topic prompt of every request goes through
+        GPT-2 in shared left-padded batches. ``requests`` items hold chat_context (dict or
+        message list), question_type and num_questions; one question list is returned per item.
+        """
         try:
             if not self.is_initialized:
-                self.initialize_models()
-            
-            topics = self.extract_topics_from_chat(chat_context)
-            
-            # Handle both dict and list input for messages
-            if isinstance(chat_context, list):
-                # If chat_context is a list, assume it's the messages directly
-                messages = chat_context
-                project_title = ''
-            elif isinstance(chat_context, dict):
-                # If chat_context is a dict, extract data properly
-                messages = chat_context.get('messages', [])
-                project_title = chat_context.get('projectTitle', '')
-            else:
-                logger.error(f"Invalid chat_context type: {type(chat_context)}")
-                messages = []
-                project_title = ''
-            
-            questions = []
-            
-            for i in range(num_questions):
-                if i < len(topics):
-                    topic = topics[i]
-                    question = self._generate_question_for_topic(topic, question_type, messages)
+                # never load inline: start a background load and use the fallbacks meanwhile
+                model_preloader.ensure('interview')
+            
+            plans = []
+            jobs = []  # (topic, question_type, messages) answered by GPT-2
+            for item in requests:
+                chat_context = item.get('chat_context')
+                question_type = item.get('question_type') or 'general'
+                topics = self.extract_topics_from_chat(chat_context)
+                
+                # Handle both dict and list input for messages
+                if isinstance(chat_context, list):
+                    messages = chat_context
+                elif isinstance(chat_context, dict):
+                    messages = chat_context.get('messages', [])
                 else:
-                    question = self._generate_general_question(question_type)
+                    logger.error(f"Invalid chat_context type: {type(chat_context)}")
+                    messages = []
                 
-                if question:
-                    questions.append({
-                        'question_text': question,
-                        'question_type': question_type,
-                        'related_topics': [topics[i]] if i < len(topics) else [],
-                        'difficulty': 'medium',
-                        'generated_by_model': 'gpt2',
-                        'generation_confidence': 0.8
-                    })
-            
-            return questions
+                plan = []
+                for i in range(item.get('num_questions', 3)):
+                    if i < len(topics):
+                        plan.append((topics[i], len(jobs)))
+                        jobs.append((topics[i], question_type, messages))
+                    else:
+                        plan.append((None, None))
+                plans.append((question_type, plan))
+            
+            generated = self._generate_questions_for_topics(jobs)
+            
+            results = []
+            for question_type, plan in plans:
+                questions = []
+                for topic, job_index in plan:
+                    if topic is not None:
+                        question = generated[job_index]
+                    else:
+                        question = self._generate_general_question(question_type)
+                    
+                    if question:
+                        questions.append({
+                            'question_text': question,
+                            'question_type': question_type,
+                            'related_topics': [topic] if topic is not None else [],
+                            'difficulty': 'medium',
+                            'generated_by_model': 'gpt2',
+                            'generation_confidence': 0.8
+                        })
+                results.append(questions)
+            return results
             
         except Exception as e:
             logger.error(f"Error generating interview questions: {str(e)}")
-            return []
+            return [[] for _ in requests]
     
-    def _generate_question_for_topic(self, topic: str, question_type: str, messages: List[Dict]) -> str:
-        """Generate a specific question for a given topic"""
-        try:
-            # Create context-aware prompt
-            prompt = self._create_question_prompt(topic, question_type, messages)
-            
-            # Generate using GPT-2
-            tokenizer = self.tokenizers.get('question_generator')
-            model = self.models.get('question_generator')
-            
-            if not tokenizer or not model:
-                return self._fallback_question_generation(topic, question_type)
-            
-            # Encode prompt
-            inputs = tokenizer.encode(prompt, return_tensors='pt', max_length=100, truncation=True)
-            
-            # Generate
-            with torch.no_grad():
-                config = self.default_configs['question_generator']
-                outputs = model.generate(
-                    inputs,
-                    max_length=inputs.shape[1] + 50,
-                    temperature=config['temperature'],
-                    top_p=config['top_p'],
-                    do_sample=config['do_sample'],
-                    pad_token_id=config['pad_token_id'],
-                    num_return_sequences=1
-                )
-            
-            # Decode and clean
-            generated_text = tokenizer.decode(outputs[0], skip_special_tokens=True)
-            question = generated_text[len(prompt):].strip()
-            
-            # Clean up the question
-            question = self._clean_generated_question(question)
-            
-            return question if question else self._fallback_question_generation(topic, question_type)
+    def _generate_questions_for_topics(self, jobs: List[Tuple[str, str, List[Dict]]]) -> List[str]:
+        """One question per (topic, question_type, messages), generated in left-padded GPT-2 batches"""
+        if not jobs:
+            return []
+        
+        with model_registry.use('question_generator') as handle:
+            if handle is None:
+                return [self._fallback_question_generation(topic, question_type) for topic, question_type, _ in jobs]
+            tokenizer, model = handle
             
-        except Exception as e:
-            logger.error(f"Error generating AI question: {str(e)}")
-            return self._fallback_question_generation(topic, question_type)
+            config = self.default_configs['question_generator']
+            batch_size = getattr(settings, 'INTERVIEW_QUESTION_BATCH_SIZE', 8)
+            questions = []
+            for start in range(0, len(jobs), batch_size):
+                chunk = jobs[start:start + batch_size]
+                prompts = [self._create_question_prompt(topic, question_type, messages)
+                           for topic, question_type, messages in chunk]
+                try:
+                    # left padding keeps every prompt flush against its generated tokens
+                    inputs = tokenizer(prompts, return_tensors='pt', padding=True,
+                                       max_length=100, truncation=True).to(model.device)
+                    with torch.no_grad():
+                        outputs = model.generate(
+                            **inputs,
+                            max_new_tokens=50,
+                            temperature=config['temperature'],
+                            top_p=config['top_p'],
+                            do_sample=config['do_sample'],
+                            pad_token_id=config['pad_token_id'],
+                            num_return_sequences=1
+                        )
+                    # decode only the new tokens of every row
+                    texts = tokenizer.batch_decode(outputs[:, inputs['input_ids'].shape[1]:], skip_special_tokens=True)
+                except Exception as e:
+                    logger.error(f"Error generating AI questions ({len(chunk)} prompts): {str(e)}")
+                    texts = [''] * len(chunk)
+                
+                for (topic, question_type, _), text in zip(chunk, texts):
+                    # Clean up the question
+                    question = self._clean_generated_question(text.strip())
+                    questions.append(question or self._fallback_question_generation(topic, question_type))
+            return questions
     
     def _create_question_prompt(self, topic: str, question_type: str, messages: List[Dict]) -> str:
         """Create a prompt for question generation"""
@@ -448,8 +590,9 @@ class AIInterviewEngine:
             analysis = {}
             
             # Sentiment analysis
-            if self.pipelines.get('sentiment'):
-                sentiment_result = self.pipelines['sentiment'](response[:512])
+            sentiment = (model_registry.get('response_analyzer') or {}).get('sentiment')
+            if sentiment:
+                sentiment_result = sentiment(response[:512])
                 sentiment_score = sentiment_result[0]['score']
                 if sentiment_result[0]['label'] == 'NEGATIVE':
                     sentiment_score = -sentiment_score
@@ -592,7 +735,8 @@ class AIInterviewEngine:
         """
         try:
             if not self.is_initialized:
-                self.initialize_models()
+                # never load inline: start a background load and use the fallbacks meanwhile
+                model_preloader.ensure('interview')
             
             # Handle both dict and list input
             if isinstance(chat_data, list):
@@ -660,7 +804,8 @@ class AIInterviewEngine:
             logger.info("Starting smart response generation from chat")
             
             if not self.is_initialized:
-                self.initialize_models()
+                # never load inline: start a background load and use the fallbacks meanwhile
+                model_preloader.ensure('interview')
             
             # Handle different input types
             if isinstance(chat_data, list):
@@ -822,22 +967,24 @@ class AIInterviewEngine:
             Generate a professional, relevant response (2-3 sentences):"""
             
             # Generate response using GPT-2
-            if self.models.get('question_generator') and self.tokenizers.get('question_generator'):
-                inputs = self.tokenizers['question_generator'].encode(prompt, return_tensors='pt', max_length=200, truncation=True)
+            handle = model_registry.get('question_generator')
+            if handle is not None:
+                tokenizer, model = handle
+                inputs = tokenizer.encode(prompt, return_tensors='pt', max_length=200, truncation=True).to(model.device)
                 
                 with torch.no_grad():
-                    outputs = self.models['question_generator'].generate(
+                    outputs = model.generate(
                         inputs,
                         max_new_tokens=50,
                         num_return_sequences=1,
                         temperature=0.8,
                         do_sample=True,
-                        pad_token_id=self.tokenizers['question_generator'].eos_token_id
+                        pad_token_id=tokenizer.eos_token_id
                     )
                 
-                response_text = self.tokenizers['question_generator'].decode(outputs[0], skip_special_tokens=True)
+                response_text = tokenizer.decode(outputs[0], skip_special_tokens=True)
                 # Extract generated part
-                input_text = self.tokenizers['question_generator'].decode(inputs[0], skip_special_tokens=True)
+                input_text = tokenizer.decode(inputs[0], skip_special_tokens=True)
                 generated_response = response_text[len(input_text):].strip()
                 
                 # Clean up the generated response
@@ -4,3 +4,34 @@ from django.apps import AppConfig
 class AiInterviewChatConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "AI_interview_chat"
+
+    def ready(self):
+        # GPT-2 / sentiment / zero-shot pipelines load in the background (backend/model_preloader.py)
+        # from their AIModelConfig rows, under the shared RAM budget (backend/model_registry.py)
+        from backend.model_preloader import model_preloader
+        from backend.model_registry import model_registry
+        from .ai_engine import ai_interview_engine
+
+        question_config = ai_interview_engine.default_configs['question_generator']
+        model_registry.register(
+            'question_generator',
+            ai_interview_engine.load_question_generator,
+            ai_interview_engine.unload_question_generator,
+            model_name=question_config['model_name'],
+            max_length=question_config['max_length'],
+            temperature=question_config['temperature'],
+            top_p=question_config['top_p'],
+        )
+        model_registry.register(
+            'response_analyzer',
+            ai_interview_engine.load_response_analyzer,
+            ai_interview_engine.unload_response_analyzer,
+            model_name='bart-large-mnli',
+            model_path='facebook/bart-large-mnli',
+        )
+
+        model_preloader.register(
+            'interview',
+            lambda force=False: ai_interview_engine.initialize_models(force_reload=force),
+            lambda: ai_interview_engine.is_initialized,
+        )
@@ -0,0 +1,156 @@
+"""
+Django Management Command: Benchmark Topic Engines
+Usage: python manage.py benchmark_topics [--samples 20] [--runs 3] [--engines zeroshot,embedding] [--json]
+
+Runs the zero-shot NLI pipeline and the embedding topic classifier over the same chat
+texts (recent ChatContext rows, or built-in samples) and reports load time, per-text
+latency and how often the embedding engine picks the same labels as zero-shot.
+"""
+import json
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from AI_interview_chat.ai_engine import combine_messages
+from AI_interview_chat.models import ChatContext
+from AI_interview_chat.topic_classifier import TOPIC_ENGINES, TOPIC_LABELS, EmbeddingTopicClassifier
+
+# same cut-off the engine applies to zero-shot scores
+ZEROSHOT_MIN_SCORE = 0.3
+
+SAMPLE_CHATS = [
+    "We need a Django REST backend with PostgreSQL and a React frontend for our booking app.",
+    "Can you set up CI/CD and deploy the service to AWS with Docker? Unit tests are required.",
+    "Looking for someone to train a machine learning model on our sales data and build dashboards.",
+    "Our iOS and Android apps need a new login flow and push notifications.",
+    "The API is slow and we suspect the database queries. Please profile and optimize them.",
+    "We had a security audit; please fix the XSS issues and add rate limiting to the endpoints.",
+    "I need a project manager to coordinate three developers and keep the sprint on schedule.",
+    "Migrate our on-premise servers to Google Cloud and set up monitoring.",
+]
+
+
+def _percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))] if values else None
+
+
+class Command(BaseCommand):
+    help = 'Compare zero-shot and embedding topic extraction (latency and label agreement)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--engines', type=str, default=','.join(TOPIC_ENGINES),
+                            help=f"Comma separated engines (default: {','.join(TOPIC_ENGINES)})")
+        parser.add_argument('--samples', type=int, default=20, help='Chat texts to classify')
+        parser.add_argument('--runs', type=int, default=3, help='Timed passes over the texts')
+        parser.add_argument('--zeroshot-model', type=str, default='facebook/bart-large-mnli',
+                            help='Zero-shot NLI model name or local path')
+        parser.add_argument('--json', action='store_true', help='Print results as JSON')
+
+    def handle(self, *args, **options):
+        engines = [name.strip() for name in options['engines'].split(',') if name.strip()]
+        unknown = [name for name in engines if name not in TOPIC_ENGINES]
+        if unknown:
+            raise CommandError(f"Unknown engines: {', '.join(unknown)} (choose from {', '.join(TOPIC_ENGINES)})")
+
+        texts = self._texts(max(1, options['samples']))
+        if not options['json']:
+            self.stdout.write(self.style.SUCCESS(f'⏱️ Benchmarking topic engines on {len(texts)} chat texts'))
+            self.stdout.write('=' * 50)
+
+        results, labels = {}, {}
+        for engine in engines:
+            if not options['json']:
+                self.stdout.write(f"▶️ {engine}...")
+            try:
+                results[engine], labels[engine] = getattr(self, f'_measure_{engine}')(texts, options)
+            except Exception as e:
+                results[engine] = {'engine': engine, 'error': str(e)}
+        agreement = self._agreement(labels) if len(labels) == 2 else None
+
+        if options['json']:
+            self.stdout.write(json.dumps({'results': list(results.values()), 'agreement': agreement}, indent=2))
+            return
+
+        self.stdout.write(f"{'engine':<10} {'load s':>8} {'p50 ms':>8} {'p95 ms':>8} {'texts/s':>8}")
+        for result in results.values():
+            if result.get('error'):
+                self.stdout.write(self.style.ERROR(f"{result['engine']:<10} ❌ {result['error']}"))
+                continue
+            self.stdout.write(
+                f"{result['engine']:<10} {result['load_seconds']:>8} {result['p50_ms']:>8} "
+                f"{result['p95_ms']:>8} {result['texts_per_second']:>8}"
+            )
+        if agreement:
+            speedup = results['zeroshot']['p50_ms'] / max(results['embedding']['p50_ms'], 1e-6)
+            self.stdout.write(
+                f"🤝 Agreement: top label {agreement['top1']:.0%}, mean Jaccard {agreement['jaccard']:.2f}; "
+                f"embedding is {speedup:.0f}x faster (p50)"
+            )
+
+    def _texts(self, samples):
+        """Combined recent messages of stored chats, topped up with the built-in samples"""
+        texts = []
+        for messages in ChatContext.objects.order_by('-extracted_at').values_list('messages', flat=True)[:samples]:
+            text = combine_messages(messages or []).strip()
+            if text:
+                texts.append(text)
+        while len(texts) < samples:
+            texts.append(SAMPLE_CHATS[len(texts) % len(SAMPLE_CHATS)])
+        return texts
+
+    @staticmethod
+    def _timings(classify, texts, runs):
+        latencies = []
+        outputs = None
+        for _ in range(max(1, runs)):
+            outputs = []
+            for text in texts:
+                started = time.perf_counter()
+                outputs.append(classify(text))
+                latencies.append(time.perf_counter() - started)
+        return {
+            'p50_ms': round(_percentile(latencies, 0.5) * 1000, 1),
+            'p95_ms': round(_percentile(latencies, 0.95) * 1000, 1),
+            'texts_per_second': round(len(latencies) / sum(latencies), 1),
+        }, outputs
+
+    def _measure_zeroshot(self, texts, options):
+        from transformers import pipeline
+
+        started = time.perf_counter()
+        classifier = pipeline('zero-shot-classification', model=options['zeroshot_model'], device=-1)
+        load_seconds = round(time.perf_counter() - started, 2)
+        classifier(texts[0][:512], TOPIC_LABELS)  # warm-up
+
+        def classify(text):
+            result = classifier(text[:512], TOPIC_LABELS)
+            return [label for label, score in zip(result['labels'], result['scores']) if score > ZEROSHOT_MIN_SCORE]
+
+        timings, outputs = self._timings(classify, texts, options['runs'])
+        return {'engine': 'zeroshot', 'model': options['zeroshot_model'], 'load_seconds': load_seconds, **timings}, outputs
+
+    def _measure_embedding(self, texts, options):
+        classifier = EmbeddingTopicClassifier()
+        started = time.perf_counter()
+        classifier.load()
+        load_seconds = round(time.perf_counter() - started, 2)
+        classifier.classify(texts[0])  # warm-up
+
+        def classify(text):
+            similarities = classifier.similarities([text])[0]
+            # keep the best label even under the threshold so top-1 agreement is comparable
+            return classifier._pick(similarities) or [TOPIC_LABELS[int(similarities.argmax())]]
+
+        timings, outputs = self._timings(classify, texts, options['runs'])
+        model_name = getattr(settings, 'EMBEDDING_MODEL_NAME', classifier.encoder.model_name)
+        return {'engine': 'embedding', 'model': model_name, 'load_seconds': load_seconds, **timings}, outputs
+
+    @staticmethod
+    def _agreement(labels):
+        pairs = list(zip(labels['zeroshot'], labels['embedding']))
+        top1 = [bool(a and b and a[0] == b[0]) for a, b in pairs]
+        jaccard = [len(set(a) & set(b)) / len(set(a) | set(b)) if set(a) | set(b) else 1.0 for a, b in pairs]
+        return {'top1': round(statistics.mean(top1), 3), 'jaccard': round(statistics.mean(jaccard), 3)}
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-16 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("AI_interview_chat", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="aimodelconfig",
+            name="model_type",
+            field=models.CharField(
+                choices=[
+                    ("question_generator", "Question Generator"),
+                    ("response_analyzer", "Response Analyzer"),
+                    ("follow_up_generator", "Follow-up Generator"),
+                    ("topic_extractor", "Topic Extractor"),
+                    ("cover_letter", "Cover Letter Generator"),
+                ],
+                max_length=50,
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-16 23:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("AI_interview_chat", "0002_aimodelconfig_cover_letter_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chatcontext",
+            name="topics_hash",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="chatcontext",
+            name="topics_message_count",
+            field=models.IntegerField(default=0),
+        ),
+    ]
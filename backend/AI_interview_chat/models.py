@@ -25,6 +25,10 @@ class ChatContext(models.Model):
     client_name = models.CharField(max_length=200, blank=True, null=True)
     project_type = models.CharField(max_length=200, blank=True, null=True)
     key_topics = models.JSONField(default=list)  # Extracted topics/skills mentioned
+    # Topic cache: messages[:topics_message_count] were classified and hash to topics_hash,
+    # so a re-ingest only classifies messages added after them (empty = not AI-classified yet)
+    topics_hash = models.CharField(max_length=64, blank=True, default='')
+    topics_message_count = models.IntegerField(default=0)
     
     # Metadata
     extracted_at = models.DateTimeField(default=timezone.now)
@@ -201,6 +205,7 @@ class AIModelConfig(models.Model):
         ('response_analyzer', 'Response Analyzer'),
         ('follow_up_generator', 'Follow-up Generator'),
         ('topic_extractor', 'Topic Extractor'),
+        ('cover_letter', 'Cover Letter Generator'),
     ])
     
     # Model configuration
@@ -0,0 +1,123 @@
+"""
+Embedding Topic Classifier
+Picks chat topics by cosine similarity to pre-embedded labels instead of zero-shot NLI
+
+The zero-shot pipeline (facebook/bart-large-mnli) runs one BART forward pass per candidate
+label for every call. Here the labels are embedded once (at engine startup) with the shared
+sentence encoder (projects/sentence_encoder.py), so classifying a chat costs one MiniLM pass
+plus a small matrix product. Concurrent callers share the encoder's batching queue with
+embedding match scoring.
+
+Enabled with INTERVIEW_TOPIC_ENGINE = 'embedding'; compare against the zero-shot pipeline
+with: python manage.py benchmark_topics
+"""
+import logging
+import threading
+import time
+from typing import List, Optional
+
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+TOPIC_ENGINES = ('zeroshot', 'embedding')
+
+# candidate labels shared by both engines
+TOPIC_LABELS = [
+    "software development", "web development", "mobile development",
+    "data science", "machine learning", "project management",
+    "frontend", "backend", "database", "api development",
+    "testing", "deployment", "cloud computing", "security"
+]
+
+# labels are embedded as short sentences, closer to how chat text reads than bare nouns
+LABEL_TEMPLATE = "This conversation is about {}."
+
+
+def get_topic_engine() -> str:
+    engine = getattr(settings, 'INTERVIEW_TOPIC_ENGINE', 'zeroshot')
+    if engine not in TOPIC_ENGINES:
+        raise ValueError(f"Unknown topic engine '{engine}' (expected one of {', '.join(TOPIC_ENGINES)})")
+    return engine
+
+
+class EmbeddingTopicClassifier:
+    """Cosine similarity between a text embedding and the label embeddings"""
+
+    def __init__(self, encoder=None, labels: Optional[List[str]] = None):
+        self._encoder = encoder
+        self.labels = list(labels or TOPIC_LABELS)
+        self.label_vectors = None
+        self._lock = threading.Lock()
+        self._loading = False
+        self._failed_at = 0.0
+
+    @property
+    def encoder(self):
+        if self._encoder is None:
+            from projects.sentence_encoder import get_sentence_encoder
+            self._encoder = get_sentence_encoder()
+        return self._encoder
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.label_vectors is not None
+
+    def load(self):
+        """Load the encoder and embed the label set (once)"""
+        if self.label_vectors is not None:
+            return
+        with self._lock:
+            if self.label_vectors is None:
+                self.label_vectors = self.encoder.encode([LABEL_TEMPLATE.format(label) for label in self.labels])
+                logger.info(f"✅ Topic labels embedded ({len(self.labels)} labels, {self.encoder.model_name})")
+
+    def load_async(self):
+        """Start ``load`` in the background (request paths never load inline)
+
+        A failed load is retried after AI_PRELOAD_FAILED_RETRY seconds, not on the next
+        request (offline, each attempt is a from_pretrained network round trip).
+        """
+        failed_retry = getattr(settings, 'AI_PRELOAD_FAILED_RETRY', 60)
+        with self._lock:
+            if self.label_vectors is not None or self._loading:
+                return
+            if self._failed_at and time.monotonic() - self._failed_at < failed_retry:
+                return
+            self._loading = True
+
+        def run():
+            try:
+                self.load()
+                self._failed_at = 0.0
+            except Exception as e:
+                logger.error(f"❌ Failed to load topic classifier: {e}")
+                self._failed_at = time.monotonic()
+            finally:
+                self._loading = False
+
+        threading.Thread(target=run, name='topic-classifier-load', daemon=True).start()
+
+    def _pick(self, similarities: np.ndarray) -> List[str]:
+        threshold = getattr(settings, 'TOPIC_EMBEDDING_THRESHOLD', 0.3)
+        top_k = getattr(settings, 'TOPIC_EMBEDDING_TOP_K', 3)
+        order = np.argsort(-similarities)[:top_k]
+        return [self.labels[i] for i in order if similarities[i] >= threshold]
+
+    def classify(self, text: str) -> List[str]:
+        """Labels above TOPIC_EMBEDDING_THRESHOLD, most similar first (at most TOPIC_EMBEDDING_TOP_K)"""
+        return self.classify_many([text])[0]
+
+    def classify_many(self, texts: List[str]) -> List[List[str]]:
+        return [self._pick(row) for row in self.similarities(texts)]
+
+    def similarities(self, texts: List[str]) -> np.ndarray:
+        """``(len(texts), len(labels))`` cosine similarities"""
+        self.load()
+        vectors = self.encoder.encode([text[:512] for text in texts])
+        return vectors @ self.label_vectors.T
+
+
+# process-wide classifier; labels are embedded when the interview engine initializes
+topic_classifier = EmbeddingTopicClassifier()
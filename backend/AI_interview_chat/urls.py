@@ -18,6 +18,7 @@ urlpatterns = [
     path('sessions/<uuid:session_id>/questions/', views.get_session_questions, name='get_session_questions'),
     path('sessions/<uuid:session_id>/suggest-answer/', views.suggest_answer_for_question, name='suggest_answer_for_question'),
     path('sessions/create/', views.create_interview_session, name='create_interview_session'),
+    path('sessions/generate-questions/', views.generate_questions_bulk, name='generate_questions_bulk'),
     path('sessions/<uuid:session_id>/start/', views.start_interview, name='start_interview'),
     path('sessions/<uuid:session_id>/complete/', views.complete_interview, name='complete_interview'),
     
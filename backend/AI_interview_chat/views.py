@@ -16,9 +16,19 @@ import uuid
 
 from .models import ChatContext, InterviewSession, InterviewQuestion, InterviewResponse, AIModelConfig
 from .ai_engine import ai_interview_engine
+from backend.model_preloader import model_preloader
+from backend.model_server import model_client, served_model
+from backend.listing import ListingError, cached_count, keyset_page
+
+# engine calls run on the model server when AI_MODEL_SERVER is set (backend/model_server.py)
+ai_interview_engine = served_model('interview', ai_interview_engine)
 
 logger = logging.getLogger(__name__)
 
+# sessions / questions per session accepted by the bulk question endpoint
+BULK_SESSIONS_MAX = 20
+BULK_QUESTIONS_MAX = 10
+
 # ========= 📥 Data Ingestion from active_chat_scraper.js =========
 
 @api_view(['POST'])
@@ -29,11 +39,9 @@ def ingest_chat_context(request):
     This data will be used as context for AI interview generation
     """
     try:
-        # Initialize AI models if not already loaded
-        try:
-            ai_interview_engine.initialize_models()
-        except Exception as ai_error:
-            logger.warning(f"AI models initialization warning: {ai_error}")
+        # Never wait for the models here: the context is stored either way and topics fall
+        # back to keyword matching until the background load finishes
+        model_preloader.ensure('interview')
         
         chat_data = request.data
         
@@ -54,13 +62,6 @@ def ingest_chat_context(request):
                 'error': 'No messages found in chat data'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Extract topics using AI
-        try:
-            topics = ai_interview_engine.extract_topics_from_chat(chat_data)
-        except Exception as topic_error:
-            logger.warning(f"Topic extraction failed: {topic_error}")
-            topics = []  # Use empty list if extraction fails
-        
         # Determine client name from participants or messages
         participants = chat_data.get('participants', [])
         client_name = None
@@ -68,26 +69,42 @@ def ingest_chat_context(request):
             # Assume first participant is client
             client_name = participants[0] if len(participants) > 0 else None
         
-        # Create or update ChatContext
-        context, created = ChatContext.objects.get_or_create(
-            url=chat_data.get('url', ''),
-            defaults={
-                'project_title': chat_data.get('projectTitle', ''),
-                'chat_title': chat_data.get('chatTitle', ''),
-                'participants': participants,
-                'messages': messages,
-                'total_messages': len(messages),
-                'client_name': client_name,
-                'key_topics': topics,
-                'extracted_at': timezone.now()
-            }
-        )
+        context = ChatContext.objects.filter(url=chat_data.get('url', '')).first()
         
-        if not created:
+        # Extract topics using AI: a re-ingest only classifies messages added since the last one
+        try:
+            if context is None:
+                topics, classified_count, classified_hash = ai_interview_engine.extract_topics_incremental(messages)
+            else:
+                topics, classified_count, classified_hash = ai_interview_engine.extract_topics_incremental(
+                    messages, context.key_topics, context.topics_message_count, context.topics_hash
+                )
+        except Exception as topic_error:
+            logger.warning(f"Topic extraction failed: {topic_error}")
+            topics, classified_count, classified_hash = [], 0, ''  # Use empty list if extraction fails
+        
+        created = context is None
+        if created:
+            context = ChatContext.objects.create(
+                url=chat_data.get('url', ''),
+                project_title=chat_data.get('projectTitle', ''),
+                chat_title=chat_data.get('chatTitle', ''),
+                participants=participants,
+                messages=messages,
+                total_messages=len(messages),
+                client_name=client_name,
+                key_topics=topics,
+                topics_message_count=classified_count,
+                topics_hash=classified_hash,
+                extracted_at=timezone.now()
+            )
+        else:
             # Update existing context with new data
             context.messages = messages
             context.total_messages = len(messages)
             context.key_topics = topics
+            context.topics_message_count = classified_count
+            context.topics_hash = classified_hash
             context.extracted_at = timezone.now()
             context.save()
         
@@ -136,6 +153,10 @@ def create_interview_session(request):
                 'error': 'Chat context not found'
             }, status=status.HTTP_404_NOT_FOUND)
         
+        # AI engine loads in the background; 503 + Retry-After (before creating the session) until ready
+        if not model_preloader.ensure('interview'):
+            return model_preloader.unavailable_response('interview')
+        
         # Get interview configuration from request
         interview_config = request.data.get('config', {})
         interview_type = interview_config.get('type', 'general')
@@ -151,10 +172,6 @@ def create_interview_session(request):
             difficulty_level=difficulty_level
         )
         
-        # Initialize AI models if not already loaded
-        if not ai_interview_engine.is_initialized:
-            ai_interview_engine.initialize_models()
-        
         # Generate initial questions
         num_questions = interview_config.get('num_questions', 3)
         questions_data = ai_interview_engine.generate_interview_questions(
@@ -214,14 +231,118 @@ def create_interview_session(request):
             'error': f'Failed to create interview session: {str(e)}'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def generate_questions_bulk(request):
+    """
+    Generate questions for several interview sessions in one batched GPT-2 pass
+    Body: { session_ids: [...], num_questions?: 3, question_type?: <defaults to each session's type> }
+    """
+    try:
+        session_ids = request.data.get('session_ids') or []
+        if not isinstance(session_ids, list) or not session_ids or len(session_ids) > BULK_SESSIONS_MAX:
+            return Response({
+                'success': False,
+                'error': f'session_ids must list 1-{BULK_SESSIONS_MAX} sessions'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            num_questions = max(1, min(int(request.data.get('num_questions', 3)), BULK_QUESTIONS_MAX))
+        except (TypeError, ValueError):
+            return Response({
+                'success': False,
+                'error': 'num_questions must be an integer'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        question_type = request.data.get('question_type')
+        
+        try:
+            wanted = list(dict.fromkeys(uuid.UUID(str(sid)) for sid in session_ids))
+        except ValueError:
+            return Response({
+                'success': False,
+                'error': 'session_ids must be UUIDs'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # AI engine loads in the background; 503 + Retry-After until ready
+        if not model_preloader.ensure('interview'):
+            return model_preloader.unavailable_response('interview')
+        
+        by_id = InterviewSession.objects.select_related('chat_context').in_bulk(wanted, field_name='session_id')
+        sessions = [by_id[sid] for sid in wanted if sid in by_id]
+        
+        questions_per_session = ai_interview_engine.generate_questions_bulk([
+            {
+                'chat_context': session.chat_context.messages,
+                'question_type': question_type or session.interview_type,
+                'num_questions': num_questions,
+            }
+            for session in sessions
+        ])
+        
+        # Save generated questions
+        results = []
+        for session, questions_data in zip(sessions, questions_per_session):
+            questions = InterviewQuestion.objects.bulk_create([
+                InterviewQuestion(
+                    session=session,
+                    question_text=q_data['question_text'],
+                    question_type=q_data.get('question_type', 'general'),
+                    related_topics=q_data.get('related_topics', []),
+                    difficulty=q_data.get('difficulty', 'medium'),
+                    generated_by_model=q_data.get('generated_by_model', 'gpt2'),
+                    generation_confidence=q_data.get('generation_confidence', 0.8)
+                )
+                for q_data in questions_data
+            ])
+            InterviewSession.objects.filter(pk=session.pk).update(
+                total_questions=models.F('total_questions') + len(questions)
+            )
+            results.append({
+                'session_id': str(session.session_id),
+                'questions': [
+                    {
+                        'question_id': str(q.question_id),
+                        'question_text': q.question_text,
+                        'question_type': q.question_type,
+                        'related_topics': q.related_topics,
+                        'difficulty': q.difficulty
+                    }
+                    for q in questions
+                ]
+            })
+        
+        logger.info(f"✅ Generated questions for {len(results)} sessions in one batch")
+        
+        return Response({
+            'success': True,
+            'message': f'Generated questions for {len(results)} sessions',
+            'data': {
+                'sessions': results,
+                'missing_session_ids': [str(sid) for sid in wanted if sid not in by_id]
+            }
+        }, status=status.HTTP_201_CREATED)
+        
+    except Exception as e:
+        logger.error(f"Error generating bulk questions: {str(e)}")
+        return Response({
+            'success': False,
+            'error': f'Failed to generate questions: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_interview_sessions(request):
     """
-    Get list of all interview sessions
+    Get list of interview sessions, newest first (?limit=, ?cursor= or ?offset=)
     """
     try:
-        sessions = InterviewSession.objects.all()
+        sessions_query = InterviewSession.objects.all()
+        # chat context joined in the same query, without its message history JSON
+        sessions, next_cursor, limit, offset = keyset_page(
+            sessions_query.select_related('chat_context').defer(
+                'chat_context__messages', 'chat_context__participants'
+            ),
+            request, 'created_at'
+        )
         
         sessions_data = []
         for session in sessions:
@@ -244,9 +365,17 @@ def get_interview_sessions(request):
         return Response({
             'success': True,
             'sessions': sessions_data,
-            'total_sessions': len(sessions_data)
+            'total_sessions': cached_count(sessions_query),
+            'limit': limit,
+            'offset': offset,
+            'next_cursor': next_cursor
         })
         
+    except ListingError as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         logger.error(f"Error fetching interview sessions: {str(e)}")
         return Response({
@@ -344,8 +473,9 @@ def get_session_questions(request, session_id):
         
         if request.method == 'POST':
             # Generate new questions for this session
+            if not model_preloader.ensure('interview'):
+                return model_preloader.unavailable_response('interview')
             try:
-                ai_interview_engine.initialize_models()
                 questions = ai_interview_engine.generate_interview_questions(session.chat_context.messages)
                 
                 # Save questions to database
@@ -454,14 +584,9 @@ def generate_smart_responses(request):
                 'error': 'No valid messages found in chat data'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Initialize AI engine
-        try:
-            ai_interview_engine.initialize_models()
-        except Exception as ai_error:
-            logger.error(f"AI engine initialization failed: {str(ai_error)}")
-            return Response({
-                'error': f'AI service temporarily unavailable: {str(ai_error)}'
-            }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        # AI engine loads in the background; 503 + Retry-After until it is ready
+        if not model_preloader.ensure('interview'):
+            return model_preloader.unavailable_response('interview')
         
         # Generate smart responses using AI engine
         smart_responses = ai_interview_engine.generate_smart_responses_from_chat(
@@ -542,11 +667,9 @@ def suggest_answer_for_question(request, session_id):
             'key_topics': session.chat_context.key_topics
         }
         
-        # Initialize AI engine
-        try:
-            ai_interview_engine.initialize_models()
-        except Exception as ai_error:
-            logger.warning(f"AI models initialization warning: {ai_error}")
+        # AI engine loads in the background; 503 + Retry-After until it is ready
+        if not model_preloader.ensure('interview'):
+            return model_preloader.unavailable_response('interview')
         
         # Generate answer suggestion
         suggestion = ai_interview_engine.suggest_answer_from_chat(question_text, chat_data)
@@ -650,9 +773,9 @@ def submit_response(request, question_id):
                 'error': 'Response text is required'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Initialize AI if needed
-        if not ai_interview_engine.is_initialized:
-            ai_interview_engine.initialize_models()
+        # AI engine loads in the background; 503 + Retry-After until it is ready
+        if not model_preloader.ensure('interview'):
+            return model_preloader.unavailable_response('interview')
         
         # Analyze response using AI
         analysis = ai_interview_engine.analyze_response(
@@ -873,14 +996,18 @@ def get_ai_status(request):
     Get AI engine status and model information
     """
     try:
+        # get_status() is forwarded to the model server; the engine's attributes are not
+        engine_status = ai_interview_engine.get_status()
         return Response({
             'success': True,
             'ai_engine': {
-                'is_initialized': ai_interview_engine.is_initialized,
-                'models_loaded': list(ai_interview_engine.models.keys()),
-                'pipelines_available': list(ai_interview_engine.pipelines.keys()),
+                'is_initialized': engine_status['is_initialized'],
+                'preload': model_preloader.get_status('interview'),
+                'models_loaded': engine_status['models_loaded'],
+                'pipelines_available': engine_status['pipelines_available'],
                 'cpu_mode': True,  # Always CPU for server deployment
-                'transformers_available': hasattr(ai_interview_engine, 'TRANSFORMERS_AVAILABLE')
+                'transformers_available': engine_status['transformers_available'],
+                'model_server': model_client.address if model_client.enabled else None
             },
             'statistics': {
                 'total_contexts': ChatContext.objects.count(),
@@ -905,19 +1032,21 @@ def initialize_ai_engine(request):
     """
     try:
         force_reload = request.data.get('force_reload', False)
-        success = ai_interview_engine.initialize_models(force_reload=force_reload)
-        
-        if success:
+        engine_status = ai_interview_engine.get_status()
+        if engine_status['is_initialized'] and not force_reload:
             return Response({
                 'success': True,
                 'message': 'AI engine initialized successfully',
-                'models_loaded': list(ai_interview_engine.models.keys())
+                'models_loaded': engine_status['models_loaded']
             })
-        else:
-            return Response({
-                'success': False,
-                'message': 'Failed to initialize AI engine'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+        # load in the background; progress via GET /api/ai/models/ready/
+        model_preloader.start(['interview'], force=bool(force_reload))
+        return Response({
+            'success': True,
+            'message': 'AI engine loading in the background',
+            'preload': model_preloader.get_status('interview')
+        }, status=status.HTTP_202_ACCEPTED)
             
     except Exception as e:
         logger.error(f"Error initializing AI engine: {str(e)}")
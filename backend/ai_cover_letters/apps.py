@@ -4,3 +4,26 @@ from django.apps import AppConfig
 class AiCoverLettersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "ai_cover_letters"
+
+    def ready(self):
+        # T5 cover letter model loads in the background (backend/model_preloader.py)
+        # from its AIModelConfig row, under the shared RAM budget (backend/model_registry.py)
+        from django.conf import settings
+        from backend.model_preloader import model_preloader
+        from backend.model_registry import model_registry
+        from .models import MODEL_NAME, ai_manager
+
+        model_registry.register(
+            'cover_letter',
+            ai_manager.load_from_config,
+            ai_manager.unload,
+            model_name='cover-letter-t5-base',
+            model_path=MODEL_NAME,
+            max_length=512,
+            batch_size=getattr(settings, 'AI_BATCH_MAX_SIZE', 8),
+        )
+        model_preloader.register(
+            'cover_letter',
+            lambda force=False: ai_manager.load_model(force=force),
+            lambda: ai_manager.model_loaded,
+        )
@@ -0,0 +1,153 @@
+"""
+Inference Batching
+Micro-batching scheduler in front of AIModelManager.generate_batch
+
+Requests arriving within AI_BATCH_WINDOW_MS of each other are grouped (same
+generation settings only) into one padded model.generate call of up to
+AI_BATCH_MAX_SIZE prompts; each caller blocks on its own future and gets its own
+text back. A single worker thread owns the model, so concurrent HTTP requests no
+longer fight over it. When AI_BATCH_MAX_QUEUE requests are already waiting,
+submit() raises InferenceQueueFull and the views answer 503.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, List
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceQueueFull(Exception):
+    """Too many generation requests waiting"""
+
+
+class InferenceBatcher:
+    """Collects generate requests into batches for one worker thread"""
+
+    def __init__(self, generate_batch: Callable[[List[str], int, float], List[str]],
+                 max_batch_size=None, window_ms=None, max_queue=None):
+        self._generate_batch = generate_batch
+        self.max_batch_size = max_batch_size or getattr(settings, 'AI_BATCH_MAX_SIZE', 8)
+        self.window = (window_ms if window_ms is not None else getattr(settings, 'AI_BATCH_WINDOW_MS', 25)) / 1000.0
+        self.max_queue = max_queue or getattr(settings, 'AI_BATCH_MAX_QUEUE', 64)
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._worker = None
+        # counters for ai_status
+        self.batches_run = 0
+        self.requests_served = 0
+        self.largest_batch = 0
+
+    # ---- submission ----
+
+    def submit(self, prompt: str, max_new_tokens: int, temperature: float) -> Future:
+        """Queue one prompt; the returned future resolves to the generated text"""
+        future = Future()
+        key = (int(max_new_tokens), round(float(temperature), 3))
+        with self._cond:
+            if len(self._pending) >= self.max_queue:
+                raise InferenceQueueFull(f'{len(self._pending)} generation requests already queued')
+            self._pending.append((key, prompt, future))
+            self._ensure_worker()
+            self._cond.notify()
+        return future
+
+    def submit_many(self, prompts: List[str], max_new_tokens: int, temperature: float) -> List[Future]:
+        """Queue several prompts all-or-nothing: InferenceQueueFull leaves none of them queued"""
+        futures = [Future() for _ in prompts]
+        key = (int(max_new_tokens), round(float(temperature), 3))
+        with self._cond:
+            if len(self._pending) + len(prompts) > self.max_queue:
+                raise InferenceQueueFull(
+                    f'{len(self._pending)} generation requests already queued, no room for {len(prompts)} more'
+                )
+            self._pending.extend((key, prompt, future) for prompt, future in zip(prompts, futures))
+            self._ensure_worker()
+            self._cond.notify()
+        return futures
+
+    def generate(self, prompt: str, max_new_tokens: int, temperature: float, timeout=None) -> str:
+        """Submit and wait for the result (raises InferenceQueueFull / generation errors)"""
+        timeout = timeout or getattr(settings, 'AI_BATCH_TIMEOUT', 300)
+        return self.submit(prompt, max_new_tokens, temperature).result(timeout=timeout)
+
+    @property
+    def queue_depth(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def get_stats(self):
+        return {
+            'queue_depth': self.queue_depth,
+            'max_queue': self.max_queue,
+            'max_batch_size': self.max_batch_size,
+            'window_ms': int(self.window * 1000),
+            'batches_run': self.batches_run,
+            'requests_served': self.requests_served,
+            'largest_batch': self.largest_batch,
+        }
+
+    # ---- worker ----
+
+    def _ensure_worker(self):
+        """Start the worker thread on first use (caller holds the condition)"""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name='ai-inference-batcher', daemon=True)
+            self._worker.start()
+
+    def _take_batch(self):
+        """Block for the first request, wait out the window, then take one compatible batch"""
+        with self._cond:
+            while not self._pending:
+                self._cond.wait()
+            deadline = time.monotonic() + self.window
+            while len(self._pending) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(timeout=remaining)
+            key = self._pending[0][0]
+            batch, rest = [], deque()
+            while self._pending:
+                item = self._pending.popleft()
+                if item[0] == key and len(batch) < self.max_batch_size:
+                    batch.append(item)
+                else:
+                    rest.append(item)
+            # requests with other settings keep their place for the next round
+            self._pending = rest
+            return key, batch
+
+    def _run(self):
+        while True:
+            key, batch = self._take_batch()
+            max_new_tokens, temperature = key
+            live = [(prompt, future) for _, prompt, future in batch if future.set_running_or_notify_cancel()]
+            if not live:
+                continue
+            prompts = [prompt for prompt, _ in live]
+            futures = [future for _, future in live]
+            started = time.monotonic()
+            try:
+                results = self._generate_batch(prompts, max_new_tokens, temperature)
+            except Exception as e:
+                logger.error(f"❌ Batched generation failed ({len(prompts)} prompts): {e}")
+                for future in futures:
+                    future.set_exception(e)
+                continue
+            if len(results) != len(futures):
+                error = RuntimeError(f"Batched generation returned {len(results)} results for {len(prompts)} prompts")
+                logger.error(f"❌ {error}")
+                for future in futures:
+                    future.set_exception(error)
+                continue
+            for future, text in zip(futures, results):
+                future.set_result(text)
+            self.batches_run += 1
+            self.requests_served += len(prompts)
+            self.largest_batch = max(self.largest_batch, len(prompts))
+            logger.info(f"🧮 Generated batch of {len(prompts)} in {time.monotonic() - started:.2f}s")
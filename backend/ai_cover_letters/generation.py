@@ -0,0 +1,22 @@
+"""
+Cover Letter Generation Settings
+Prompt format, sampling settings and the (possibly served) model manager shared by the
+cover letter views and by code outside this app (projects/hedged_router.py, benchmarks)
+"""
+from backend.model_server import served_model
+
+from .models import AIModelManager
+
+# Import from .models.py the AIModelManager instance
+# (calls run on the model server when AI_MODEL_SERVER is set, see backend/model_server.py)
+ai_manager = served_model('cover_letter', AIModelManager())
+
+# generation settings shared by the single, streamed and batch cover letter paths
+# (identical settings -> identical cache keys, so a batch-generated letter is a cache hit later)
+COVER_MAX_TOKENS = 400  # Good balance for quality and server constraints
+COVER_TEMPERATURE = 0.7  # Standard temperature for creativity
+
+
+def build_cover_prompt(job_title, company_name, skills):
+    """Prompt in the format expected by the cover-letter-t5-base model"""
+    return f"""coverletter name: Content Writer job: {job_title} at {company_name} background: Senior Content Writer with 3+ years experience experiences: I created engaging content that increased organic traffic by 45%. I managed 20+ client accounts and developed content strategies across various industries. I have expertise in {skills}, SEO optimization, WordPress management, and email marketing campaigns. I am passionate about creating compelling content that drives results and engagement."""
@@ -0,0 +1,189 @@
+"""
+Generation Cache
+Content-addressed cache for generated cover letters / prompt responses
+
+Keys are a sha256 of the normalized prompt (whitespace collapsed) plus everything
+that changes the output: model, max tokens, temperature, backend. Lookups check an
+in-process LRU first, then the GenerationCacheEntry table, so a repeat click for the
+same job skips several seconds of CPU inference. Callers pass ``bypass=True`` for an
+explicit "regenerate": the model runs again and the new text replaces the cached one.
+
+Settings:
+    AI_GENERATION_CACHE_TTL          - seconds an entry stays valid (default 7 days)
+    AI_GENERATION_CACHE_MEMORY_SIZE  - entries kept in the in-memory LRU (default 256)
+    AI_GENERATION_CACHE_DB_SIZE      - rows kept in the DB tier (default 5000)
+"""
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from .models import GenerationCacheEntry
+
+logger = logging.getLogger(__name__)
+
+# prune the DB tier every N writes instead of on every write
+PRUNE_EVERY = 50
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_prompt(prompt: str) -> str:
+    return _WHITESPACE_RE.sub(' ', prompt or '').strip()
+
+
+def make_cache_key(namespace: str, prompt: str, **params) -> str:
+    """sha256 over namespace, normalized prompt and generation settings"""
+    payload = json.dumps(
+        {'ns': namespace, 'prompt': normalize_prompt(prompt), 'params': params},
+        sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def wants_regenerate(data) -> bool:
+    """'regenerate': true skips the generation cache (a fresh sample replaces the cached one)
+
+    Request flags arrive as JSON booleans or form / query strings, so "false" and "0" mean no.
+    """
+    return str(data.get('regenerate', '')).lower() in ('1', 'true', 'yes')
+
+
+class GenerationCache:
+    """Two-tier (memory LRU + DB) cache of generated texts"""
+
+    def __init__(self, memory_size=None, db_size=None, ttl=None):
+        self._memory_size = memory_size
+        self._db_size = db_size
+        self._ttl = ttl
+        self._memory = OrderedDict()  # key -> (text, expires_at)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.bypasses = 0
+
+    @property
+    def memory_size(self):
+        return self._memory_size or getattr(settings, 'AI_GENERATION_CACHE_MEMORY_SIZE', 256)
+
+    @property
+    def db_size(self):
+        return self._db_size or getattr(settings, 'AI_GENERATION_CACHE_DB_SIZE', 5000)
+
+    @property
+    def ttl(self):
+        return self._ttl or getattr(settings, 'AI_GENERATION_CACHE_TTL', 7 * 24 * 3600)
+
+    # ---- memory tier ----
+
+    def _memory_get(self, key, now):
+        with self._lock:
+            item = self._memory.get(key)
+            if item is None:
+                return None
+            text, expires_at = item
+            if expires_at <= now:
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return text
+
+    def _memory_set(self, key, text, expires_at):
+        with self._lock:
+            self._memory[key] = (text, expires_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _count(self, counter: str) -> int:
+        """Increment a stats counter (request threads and the batcher share this cache)"""
+        with self._lock:
+            value = getattr(self, counter) + 1
+            setattr(self, counter, value)
+            return value
+
+    # ---- public API ----
+
+    def get(self, key: str, bypass: bool = False) -> Optional[str]:
+        """Cached text or None; ``bypass`` (regenerate) always misses"""
+        if bypass:
+            self._count('bypasses')
+            return None
+        now = timezone.now()
+        text = self._memory_get(key, now)
+        if text is not None:
+            self._count('memory_hits')
+            return text
+        try:
+            entry = GenerationCacheEntry.objects.filter(key=key, expires_at__gt=now).only('text', 'expires_at').first()
+            if entry is not None:
+                GenerationCacheEntry.objects.filter(pk=entry.pk).update(hits=F('hits') + 1, last_used_at=now)
+                self._memory_set(key, entry.text, entry.expires_at)
+                self._count('db_hits')
+                return entry.text
+        except Exception as e:
+            logger.warning(f"⚠️ Generation cache lookup failed: {e}")
+        self._count('misses')
+        return None
+
+    def set(self, key: str, text: str, namespace: str = 'default'):
+        now = timezone.now()
+        expires_at = now + timedelta(seconds=self.ttl)
+        self._memory_set(key, text, expires_at)
+        try:
+            GenerationCacheEntry.objects.update_or_create(
+                key=key,
+                defaults={'namespace': namespace, 'text': text, 'expires_at': expires_at, 'last_used_at': now}
+            )
+            if self._count('_writes') % PRUNE_EVERY == 0:
+                self.prune()
+        except Exception as e:
+            logger.warning(f"⚠️ Generation cache write failed: {e}")
+
+    def prune(self) -> int:
+        """Delete expired rows and the least recently used ones beyond AI_GENERATION_CACHE_DB_SIZE"""
+        deleted, _ = GenerationCacheEntry.objects.filter(expires_at__lte=timezone.now()).delete()
+        stale_ids = list(
+            GenerationCacheEntry.objects.order_by('-last_used_at').values_list('pk', flat=True)[self.db_size:]
+        )
+        if stale_ids:
+            deleted += GenerationCacheEntry.objects.filter(pk__in=stale_ids).delete()[0]
+        if deleted:
+            logger.info(f"🧹 Pruned {deleted} generation cache entries")
+        return deleted
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        GenerationCacheEntry.objects.all().delete()
+
+    def get_stats(self):
+        with self._lock:
+            memory_entries = len(self._memory)
+            memory_hits, db_hits, misses, bypasses = self.memory_hits, self.db_hits, self.misses, self.bypasses
+        lookups = memory_hits + db_hits + misses
+        return {
+            'memory_hits': memory_hits,
+            'db_hits': db_hits,
+            'misses': misses,
+            'bypasses': bypasses,
+            'hit_rate': round((memory_hits + db_hits) / lookups, 3) if lookups else 0.0,
+            'memory_entries': memory_entries,
+            'memory_size': self.memory_size,
+            'db_size': self.db_size,
+            'ttl_seconds': self.ttl,
+        }
+
+
+# shared by ai_cover_letters views and projects.services
+generation_cache = GenerationCache()
@@ -0,0 +1,86 @@
+"""
+Inference Backends
+CPU execution options for the cover letter T5 model
+
+    fp32  - plain PyTorch float32 (baseline)
+    int8  - torch dynamic quantization of nn.Linear layers (weights int8, activations fp32)
+    onnx  - ONNX Runtime via optimum; the exported model is cached under AI_ONNX_CACHE_DIR
+            so the (slow) export runs once per model
+
+Every backend returns an object with the transformers ``generate()`` API, so batching,
+streaming and the benchmark command use them interchangeably. Pick one with
+AI_INFERENCE_BACKEND after comparing them with ``python manage.py benchmark_inference``.
+"""
+import logging
+import os
+import re
+
+import torch
+from django.conf import settings
+from transformers import AutoModelForSeq2SeqLM
+
+# ONNX Runtime backend is optional (pip install optimum[onnxruntime])
+try:
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    ONNX_AVAILABLE = True
+except ImportError:
+    ORTModelForSeq2SeqLM = None
+    ONNX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('fp32', 'int8', 'onnx')
+DEFAULT_BACKEND = 'fp32'
+
+
+def get_backend_name(name=None):
+    """Validated backend name (default: settings.AI_INFERENCE_BACKEND)"""
+    name = (name or getattr(settings, 'AI_INFERENCE_BACKEND', DEFAULT_BACKEND)).lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown inference backend '{name}' (choose from {', '.join(BACKENDS)})")
+    return name
+
+
+def onnx_cache_path(model_name):
+    """Directory holding the exported ONNX files for ``model_name``"""
+    cache_dir = getattr(settings, 'AI_ONNX_CACHE_DIR', os.path.join(settings.BASE_DIR, 'cache', 'onnx'))
+    return os.path.join(str(cache_dir), re.sub(r'[^A-Za-z0-9_.-]+', '--', model_name))
+
+
+def _load_fp32(model_name):
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name, low_cpu_mem_usage=True)
+    return model.float().eval()
+
+
+def _load_int8(model_name):
+    model = _load_fp32(model_name)
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _load_onnx(model_name):
+    if not ONNX_AVAILABLE:
+        raise RuntimeError("ONNX backend needs optimum with onnxruntime: pip install optimum[onnxruntime]")
+    path = onnx_cache_path(model_name)
+    if os.path.isdir(path) and any(f.endswith('.onnx') for f in os.listdir(path)):
+        logger.info(f"📦 Using cached ONNX export: {path}")
+        return ORTModelForSeq2SeqLM.from_pretrained(path)
+    logger.info(f"📦 Exporting {model_name} to ONNX (first run only)...")
+    model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True)
+    os.makedirs(path, exist_ok=True)
+    model.save_pretrained(path)
+    logger.info(f"✅ ONNX export cached at {path}")
+    return model
+
+
+_LOADERS = {
+    'fp32': _load_fp32,
+    'int8': _load_int8,
+    'onnx': _load_onnx,
+}
+
+
+def load_seq2seq_model(model_name, backend=None):
+    """Load ``model_name`` for CPU inference with the given (or configured) backend"""
+    backend = get_backend_name(backend)
+    logger.info(f"🔧 Loading {model_name} with '{backend}' inference backend")
+    return _LOADERS[backend](model_name)
@@ -0,0 +1,159 @@
+"""
+Django Management Command: Benchmark Inference Backends
+Usage: python manage.py benchmark_inference [--backends fp32,int8,onnx] [--runs 3] [--batch-size 4]
+
+Each backend is measured in its own subprocess so peak RSS is not inflated by a
+previously loaded model. Reports load time, tokens/sec and peak RSS per backend.
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+import torch
+from django.core.management.base import BaseCommand, CommandError
+from transformers import AutoTokenizer
+
+from ai_cover_letters.inference_backends import BACKENDS, get_backend_name, load_seq2seq_model
+from ai_cover_letters.models import GENERATION_KWARGS, MAX_MODEL_LENGTH, MODEL_NAME
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+SAMPLE_JOBS = [
+    ('Senior Django Developer', 'Acme Corp', 'Python, Django, PostgreSQL, REST APIs'),
+    ('React Frontend Engineer', 'Brightly', 'React, TypeScript, Vite, CSS'),
+    ('Data Scraping Specialist', 'MarketPulse', 'Python, Selenium, BeautifulSoup'),
+    ('Machine Learning Engineer', 'NovaAI', 'PyTorch, Transformers, NLP'),
+]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None if unavailable)"""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # bytes on macOS, kilobytes on Linux
+        return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        return round(getattr(info, 'peak_wset', info.rss) / (1024 * 1024), 1)
+    return None
+
+
+class Command(BaseCommand):
+    help = 'Compare cover letter model inference backends (tokens/sec and peak RSS)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--backends',
+            type=str,
+            default=','.join(BACKENDS),
+            help=f"Comma separated backends to compare (default: {','.join(BACKENDS)})",
+        )
+        parser.add_argument('--model', type=str, default=MODEL_NAME, help='Model name or local path')
+        parser.add_argument('--runs', type=int, default=3, help='Timed generate() calls per backend')
+        parser.add_argument('--batch-size', type=int, default=1, help='Prompts per generate() call')
+        parser.add_argument('--max-tokens', type=int, default=128, help='max_new_tokens per prompt')
+        parser.add_argument('--json', action='store_true', help='Print results as JSON')
+        parser.add_argument('--only', type=str, help=('Measure a single backend in this process '
+                                                      '(used internally for the per-backend subprocess)'))
+
+    def handle(self, *args, **options):
+        if options['only']:
+            result = self._measure(get_backend_name(options['only']), options)
+            self.stdout.write(json.dumps(result))
+            return
+
+        try:
+            backends = [get_backend_name(name.strip()) for name in options['backends'].split(',') if name.strip()]
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if not options['json']:
+            self.stdout.write(self.style.SUCCESS('⏱️ Benchmarking cover letter inference backends'))
+            self.stdout.write('=' * 50)
+
+        results = [self._run_isolated(backend, options) for backend in backends]
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        self.stdout.write(f"{'backend':<8} {'load s':>8} {'tok/s':>8} {'latency s':>10} {'peak RSS MB':>12}")
+        for result in results:
+            if result.get('error'):
+                self.stdout.write(self.style.ERROR(f"{result['backend']:<8} ❌ {result['error']}"))
+                continue
+            self.stdout.write(
+                f"{result['backend']:<8} {result['load_seconds']:>8} {result['tokens_per_second']:>8} "
+                f"{result['mean_latency_seconds']:>10} {str(result['peak_rss_mb']):>12}"
+            )
+
+    def _run_isolated(self, backend, options):
+        """Run ``--only <backend>`` in a fresh interpreter and parse its JSON line"""
+        command = [
+            sys.executable, sys.argv[0], 'benchmark_inference',
+            '--only', backend,
+            '--model', options['model'],
+            '--runs', str(options['runs']),
+            '--batch-size', str(options['batch_size']),
+            '--max-tokens', str(options['max_tokens']),
+        ]
+        if not options['json']:
+            self.stdout.write(f"▶️ {backend}...")
+        proc = subprocess.run(command, capture_output=True, text=True, env=os.environ.copy())
+        lines = [line for line in proc.stdout.splitlines() if line.startswith('{')]
+        if proc.returncode != 0 or not lines:
+            error = (proc.stderr.strip().splitlines() or ['benchmark subprocess failed'])[-1]
+            return {'backend': backend, 'error': error}
+        return json.loads(lines[-1])
+
+    def _measure(self, backend, options):
+        from ai_cover_letters.generation import build_cover_prompt
+
+        model_name = options['model']
+        batch_size = max(1, options['batch_size'])
+        prompts = [build_cover_prompt(*SAMPLE_JOBS[i % len(SAMPLE_JOBS)]) for i in range(batch_size)]
+
+        try:
+            started = time.perf_counter()
+            tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True, model_max_length=MAX_MODEL_LENGTH)
+            model = load_seq2seq_model(model_name, backend)
+            load_seconds = time.perf_counter() - started
+
+            inputs = tokenizer(prompts, return_tensors='pt', padding=True, truncation=True,
+                               max_length=MAX_MODEL_LENGTH)
+            generate_kwargs = dict(GENERATION_KWARGS, max_new_tokens=options['max_tokens'], temperature=0.7)
+
+            with torch.inference_mode():
+                model.generate(**inputs, **dict(generate_kwargs, max_new_tokens=8))  # warm-up
+
+                tokens = 0
+                latencies = []
+                for _ in range(max(1, options['runs'])):
+                    started = time.perf_counter()
+                    output_ids = model.generate(**inputs, **generate_kwargs)
+                    latencies.append(time.perf_counter() - started)
+                    tokens += int((output_ids != tokenizer.pad_token_id).sum())
+        except Exception as e:
+            return {'backend': backend, 'error': str(e)}
+
+        return {
+            'backend': backend,
+            'model': model_name,
+            'batch_size': batch_size,
+            'runs': len(latencies),
+            'load_seconds': round(load_seconds, 2),
+            'generated_tokens': tokens,
+            'tokens_per_second': round(tokens / sum(latencies), 1) if sum(latencies) else 0.0,
+            'mean_latency_seconds': round(sum(latencies) / len(latencies), 3),
+            'peak_rss_mb': peak_rss_mb(),
+        }
@@ -0,0 +1,45 @@
+"""
+Django Management Command: Run Model Server
+Usage: python manage.py run_model_server [--address /tmp/upworkai-models.sock] [--models cover_letter,interview]
+
+Loads the AI models once and serves them to the web workers (see backend/model_server.py).
+Web workers use it when AI_MODEL_SERVER points at the same address.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.model_server import SERVED_MODELS, ModelServer
+
+
+class Command(BaseCommand):
+    help = 'Serve the AI models to Django workers over a local socket'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--address',
+            type=str,
+            help='Unix socket path or host:port (default: settings.AI_MODEL_SERVER)',
+        )
+        parser.add_argument(
+            '--models',
+            type=str,
+            default=','.join(SERVED_MODELS),
+            help=f"Comma separated models to serve (default: {','.join(SERVED_MODELS)})",
+        )
+
+    def handle(self, *args, **options):
+        models = [name.strip() for name in options['models'].split(',') if name.strip()]
+        unknown = [name for name in models if name not in SERVED_MODELS]
+        if unknown:
+            raise CommandError(f"Unknown models: {', '.join(unknown)} (choose from {', '.join(SERVED_MODELS)})")
+
+        try:
+            server = ModelServer(options['address'], models)
+        except ValueError as e:
+            raise CommandError(f"{e}: pass --address or set the AI_MODEL_SERVER env var")
+
+        self.stdout.write(self.style.SUCCESS(f"🖥️ Model server starting on {server.address}"))
+        self.stdout.write(f"📥 Loading in the background: {', '.join(models)}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self.stdout.write('🛑 Model server stopped')
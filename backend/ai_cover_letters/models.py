@@ -12,9 +12,18 @@ Handles loading and management of AI mode            # Create T5 text2text gener
 """
 
 import torch
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM, pipeline
+from transformers import AutoTokenizer, StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
 import logging
 import gc
+import threading
+from typing import Iterator, List
+
+from django.conf import settings
+from django.db import models
+
+from .batching import InferenceBatcher, InferenceQueueFull
+from .inference_backends import get_backend_name, load_seq2seq_model
+from backend.model_registry import model_registry, select_device
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +31,28 @@ logger = logging.getLogger(__name__)
 MODEL_NAME = "nouamanetazi/cover-letter-t5-base"  # Specialized model for cover letters
 MAX_MODEL_LENGTH = 512  
 DEVICE = "cpu"
+EMPTY_RESPONSE = "Unable to generate cover letter. Please try again."
+
+# sampling settings shared by single and batched generation
+GENERATION_KWARGS = {
+    'min_length': 50,
+    'do_sample': True,
+    'top_p': 0.8,  # More focused output
+    'repetition_penalty': 1.5,  # Higher penalty to prevent repetition
+    'early_stopping': True,
+    'num_return_sequences': 1,
+    'no_repeat_ngram_size': 3,  # Prevent 3-gram repetition
+}
+
+class _CancelledCriteria(StoppingCriteria):
+    """Stops generate() once the streaming client has gone away"""
+
+    def __init__(self, cancel_event: threading.Event):
+        self.cancel_event = cancel_event
+
+    def __call__(self, input_ids, scores, **kwargs):
+        return torch.full((input_ids.shape[0],), self.cancel_event.is_set(), dtype=torch.bool)
+
 
 class AIModelManager:
     """Singleton class to manage AI model loading and inference"""
@@ -38,107 +69,201 @@ class AIModelManager:
         if not self.initialized:
             self.tokenizer = None
             self.model = None
-            self.ai_pipeline = None
+            self.backend = None
             self.model_loaded = False
+            # micro-batching queue in front of generate_batch (worker starts on first request)
+            self.batcher = InferenceBatcher(self.generate_batch)
+            # streamed generations run outside the batcher; cap how many run at once
+            self.stream_slots = threading.BoundedSemaphore(getattr(settings, 'AI_MAX_STREAMS', 2))
+            self.device = DEVICE
             self.initialized = True
     
-    def load_model(self):
-        """Load specialized cover letter T5 model"""
-        if self.model_loaded:
-            logger.info("Model already loaded")
-            return True
+    def load_model(self, force: bool = False):
+        """Load specialized cover letter T5 model (through backend/model_registry.py)"""
+        return model_registry.load('cover_letter', force=force)
+    
+    def load_from_config(self, config):
+        """Registry loader: build tokenizer + model from the 'cover_letter' AIModelConfig row"""
+        logger.info(f"🤖 Loading specialized cover letter model: {config.model_path}")
+        self.device = select_device(config)
+        logger.info(f"🔧 Using device: {self.device}")
+        logger.info("⏳ Loading cover letter T5 model...")
         
-        try:
-            logger.info(f"🤖 Loading specialized cover letter model: {MODEL_NAME}")
-            logger.info(f"🔧 Using device: {DEVICE}")
-            logger.info("⏳ Loading cover letter T5 model...")
-            
-            # Clear any existing memory
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-            gc.collect()
-            
-            # Load tokenizer for cover letter model
-            self.tokenizer = AutoTokenizer.from_pretrained(
-                MODEL_NAME, 
-                use_fast=True,
-                model_max_length=MAX_MODEL_LENGTH
-            )
-            
-            # Load specialized cover letter model
-            logger.info("Loading cover-letter-t5-base model...")
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(
-                MODEL_NAME,
-                low_cpu_mem_usage=True
-                # Remove dtype parameter - not supported by T5
-            )
-            logger.info("✅ Cover letter T5 model loaded successfully!")
+        # Clear any existing memory
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        gc.collect()
+        
+        # Load tokenizer for cover letter model
+        self.tokenizer = AutoTokenizer.from_pretrained(
+            config.model_path,
+            use_fast=True,
+            model_max_length=MAX_MODEL_LENGTH
+        )
+        
+        # Load specialized cover letter model with the configured CPU backend
+        # (fp32 / int8 / onnx - see inference_backends.py and benchmark_inference)
+        self.backend = get_backend_name()
+        logger.info(f"Loading cover-letter-t5-base model ({self.backend})...")
+        self.model = load_seq2seq_model(config.model_path, self.backend)
+        if self.device != DEVICE and self.backend != 'onnx':
+            self.model = self.model.to(self.device)
+        
+        # requests merged into one generate() call
+        self.batcher.max_batch_size = max(1, config.batch_size)
+        
+        self.model_loaded = True
+        logger.info("✅ Cover letter T5 model loaded successfully in Django!")
+        return self.model
+    
+    def unload(self, handle=None):
+        """Registry unloader: drop the model so its memory can be reclaimed"""
+        self.model_loaded = False
+        self.model = None
+        self.tokenizer = None
+    
+    def generate_batch(self, prompts: List[str], max_tokens: int = 400, temperature: float = 0.7) -> List[str]:
+        """Generate one cover letter per prompt with a single padded model.generate call"""
+        # pinned in the registry so the model is not evicted mid-batch
+        with model_registry.use('cover_letter') as model:
+            if model is None or self.tokenizer is None:
+                raise RuntimeError("AI model is not loaded")
             
-            # Convert to half precision after loading for memory efficiency
+            inputs = self.tokenizer(
+                prompts,
+                return_tensors="pt",
+                padding=True,
+                truncation=True,
+                max_length=MAX_MODEL_LENGTH
+            ).to(self.device)
+            with torch.inference_mode():
+                output_ids = model.generate(
+                    **inputs,
+                    max_new_tokens=min(max_tokens, MAX_MODEL_LENGTH // 2),
+                    temperature=temperature,
+                    **GENERATION_KWARGS
+                )
+            texts = self.tokenizer.batch_decode(output_ids, skip_special_tokens=True)
+        return [text.strip() or EMPTY_RESPONSE for text in texts]
+    
+    def stream_generate(self, prompt: str, max_tokens: int = 400, temperature: float = 0.7) -> Iterator[str]:
+        """Iterator of text pieces, yielded as the decoder produces them.
+
+        generate() runs in a helper thread feeding a TextIteratorStreamer. Closing the
+        iterator (client disconnected) stops generation at the next token. Raises
+        InferenceQueueFull when AI_MAX_STREAMS generations are already streaming.
+        """
+        if not self.model_loaded or self.model is None:
+            raise RuntimeError("AI model is not loaded")
+        inputs = self.tokenizer(prompt, return_tensors="pt", truncation=True, max_length=MAX_MODEL_LENGTH).to(self.device)
+        if not self.stream_slots.acquire(blocking=False):
+            raise InferenceQueueFull('Too many streaming generations in progress')
+        
+        cancel_event = threading.Event()
+        errors = []
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        
+        def run():
             try:
-                self.model = self.model.half()
-                logger.info("✅ Model converted to float16 for memory efficiency")
+                with model_registry.use('cover_letter') as model, torch.inference_mode():
+                    if model is None:
+                        raise RuntimeError("AI model is not loaded")
+                    model.generate(
+                        **inputs,
+                        max_new_tokens=min(max_tokens, MAX_MODEL_LENGTH // 2),
+                        temperature=temperature,
+                        streamer=streamer,
+                        stopping_criteria=StoppingCriteriaList([_CancelledCriteria(cancel_event)]),
+                        **GENERATION_KWARGS
+                    )
             except Exception as e:
-                logger.warning(f"Could not convert to float16: {e}, using float32")
-            
-            # Optimize model for inference
-            self.model.eval()
-            
-            # Use pipeline for cover letter model
-            from transformers import pipeline
-            self.ai_pipeline = pipeline(
-                "text2text-generation",
-                model=self.model,
-                tokenizer=self.tokenizer
-            )
-            
-            self.model_loaded = True
-            logger.info("✅ Cover letter T5 model loaded successfully in Django!")
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to load cover letter model: {e}")
-            self.model_loaded = False
-            return False
+                errors.append(e)
+                streamer.end()  # unblock the consumer
+            finally:
+                self.stream_slots.release()
+        
+        threading.Thread(target=run, name='ai-stream-generate', daemon=True).start()
+        return self._iter_stream(streamer, cancel_event, errors)
+    
+    @staticmethod
+    def _iter_stream(streamer, cancel_event, errors):
+        try:
+            for piece in streamer:
+                if piece:
+                    yield piece
+            if errors:
+                raise errors[0]
+        finally:
+            # GeneratorExit on client disconnect lands here
+            cancel_event.set()
+    
+    def generate(self, prompt: str, max_tokens: int = 400, temperature: float = 0.7) -> str:
+        """Generate through the batching queue; errors raise instead of coming back as text"""
+        if not self.model_loaded or self.model is None:
+            raise RuntimeError("AI model is not loaded")
+        return self.batcher.generate(prompt, max_tokens, temperature)
     
     def generate_response(self, prompt: str, max_tokens: int = 400, temperature: float = 0.7) -> str:
-        """Generate AI response using t5-small model with pipeline"""
-        if not self.model_loaded or self.ai_pipeline is None:
+        """Generate AI response through the batching queue
+
+        Raises InferenceQueueFull when too many requests are waiting (views answer 503).
+        """
+        if not self.model_loaded or self.model is None:
             return "AI model is not loaded. Please wait for initialization or check logs for errors."
         
         try:
-            # Use pipeline for t5-small generation
-            response = self.ai_pipeline(
-                prompt,
-                max_new_tokens=min(max_tokens, MAX_MODEL_LENGTH // 2),  # Use max_new_tokens instead of max_length
-                min_length=50,
-                temperature=temperature,
-                do_sample=True,
-                top_p=0.8,  # More focused output
-                repetition_penalty=1.5,  # Higher penalty to prevent repetition
-                early_stopping=True,
-                num_return_sequences=1,
-                no_repeat_ngram_size=3  # Prevent 3-gram repetition
-            )
-            
-            if isinstance(response, list) and len(response) > 0:
-                ai_response = response[0]['generated_text'].strip()
-                return ai_response if ai_response else "Unable to generate cover letter. Please try again."
-            else:
-                return "Unable to generate cover letter. Please try again."
-                
+            return self.batcher.generate(prompt, max_tokens, temperature)
+        except InferenceQueueFull:
+            raise
         except Exception as e:
             logger.error(f"❌ Error generating response: {e}")
             return f"Error generating cover letter: {str(e)}"
     
+    def generate_many(self, prompts: List[str], max_tokens: int = 400, temperature: float = 0.7) -> List[str]:
+        """Generate for many prompts, feeding the queue one full batch at a time (bulk regeneration)
+
+        Each chunk is queued all-or-nothing, so InferenceQueueFull never leaves part of a
+        chunk generating for a caller that has already given up.
+        """
+        results = []
+        step = self.batcher.max_batch_size
+        for start in range(0, len(prompts), step):
+            futures = self.batcher.submit_many(prompts[start:start + step], max_tokens, temperature)
+            try:
+                results.extend(future.result() for future in futures)
+            except BaseException:
+                for future in futures:
+                    future.cancel()  # not started yet: the worker skips it
+                raise
+        return results
+    
     def get_model_status(self):
         """Get current model status"""
         return {
             "model_name": MODEL_NAME,
             "model_loaded": self.model_loaded,
-            "device": DEVICE,
-            "max_length": MAX_MODEL_LENGTH
+            "device": self.device,
+            "backend": self.backend or get_backend_name(),
+            "max_length": MAX_MODEL_LENGTH,
+            "batching": self.batcher.get_stats()
         }
 
 # Global instance
 ai_manager = AIModelManager()
+
+
+class GenerationCacheEntry(models.Model):
+    """Persisted tier of the generation cache (ai_cover_letters/generation_cache.py)"""
+    key = models.CharField(max_length=64, unique=True)  # sha256 of normalized prompt + settings
+    namespace = models.CharField(max_length=50)  # e.g. cover_letter, prompt, project_cover
+    text = models.TextField()
+    hits = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+    last_used_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        ordering = ['-last_used_at']
+
+    def __str__(self):
+        return f"{self.namespace}:{self.key[:12]}"
@@ -7,6 +7,9 @@ from . import views
 
 urlpatterns = [
     path('generate-cover-letter/', views.generate_cover_letter, name='generate_cover_letter'),
+    path('generate-cover-letter/stream/', views.generate_cover_letter_stream, name='generate_cover_letter_stream'),
     path('prompt/', views.direct_prompt, name='direct_prompt'),
+    path('prompt/stream/', views.direct_prompt_stream, name='direct_prompt_stream'),
     path('status/', views.ai_status, name='ai_status'),
+    path('models/ready/', views.model_readiness, name='model_readiness'),
 ]
\ No newline at end of file
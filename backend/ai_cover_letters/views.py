@@ -11,15 +11,26 @@ from rest_framework.response import Response
 # library for HTTP status codes
 from rest_framework import status
 # Django HTTP response
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 # Django CSRF exemption decorator
 from django.views.decorators.csrf import csrf_exempt
+# Django method restriction for the plain (streaming) views
+from django.views.decorators.http import require_POST
 # Django method decorator
 from django.utils.decorators import method_decorator
 # AI Model Manager from our models
-from .models import AIModelManager
+from .models import EMPTY_RESPONSE, MODEL_NAME
+# shared model manager, prompt format and sampling settings
+from .generation import COVER_MAX_TOKENS, COVER_TEMPERATURE, ai_manager, build_cover_prompt
+from .batching import InferenceQueueFull
+from .generation_cache import generation_cache, make_cache_key, wants_regenerate
+from .inference_backends import get_backend_name
+from backend.model_preloader import model_preloader
+from backend.model_registry import model_registry
+from backend.model_server import model_client
 # logging for debugging
 import logging
+import json
 
 def create_resume_for_job(job_title, skills):
     """Create resume content optimized for Content Writer and related roles"""
@@ -68,11 +79,67 @@ ACHIEVEMENTS:
     else:
         return content_writer_resume
 
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Import from .models.py the AIModelManager instance
-ai_manager = AIModelManager()
+# seconds clients are told to wait when the generation queue is full
+QUEUE_FULL_RETRY_AFTER = 5
+
+
+def _queue_full_response(e, text_key):
+    logger.warning(f"⏳ Generation queue full: {e}")
+    response = Response({
+        text_key: '',
+        'success': False,
+        'error': 'AI model is busy, please retry shortly'
+    }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+    response['Retry-After'] = str(QUEUE_FULL_RETRY_AFTER)
+    return response
+
+
+def _cached_generate(namespace, prompt, max_tokens, temperature, regenerate):
+    """Return (text, cached, error_response) - cache first, model only on a miss"""
+    key = make_cache_key(namespace, prompt, model=MODEL_NAME, backend=get_backend_name(), max_tokens=max_tokens, temperature=temperature)
+    text = generation_cache.get(key, bypass=regenerate)
+    if text is not None:
+        return text, True, None
+
+    # model loads in the background; answer 503 + Retry-After instead of blocking this worker
+    if not model_preloader.ensure('cover_letter'):
+        return None, False, model_preloader.unavailable_response('cover_letter')
+
+    # generation errors raise here (handled by the view) instead of being cached as text
+    text = ai_manager.generate(prompt, max_tokens, temperature)
+    if text != EMPTY_RESPONSE:
+        generation_cache.set(key, text, namespace)
+    return text, False, None
+
+
+def generate_cover_letters(jobs, regenerate=False):
+    """Cover letters for many ``(job_title, company_name, skills)`` tuples in one batched pass.
+
+    Cached letters are reused unless ``regenerate``; the misses go through
+    ai_manager.generate_many. Returns a list of ``(text, cached)`` in input order, with
+    text None where the model produced nothing usable. Queue/model errors raise.
+    """
+    prompts = [build_cover_prompt(*job) for job in jobs]
+    keys = [
+        make_cache_key('cover_letter', prompt, model=MODEL_NAME, backend=get_backend_name(),
+                       max_tokens=COVER_MAX_TOKENS, temperature=COVER_TEMPERATURE)
+        for prompt in prompts
+    ]
+    results = [(generation_cache.get(key, bypass=regenerate), True) for key in keys]
+    missing = [i for i, (text, _) in enumerate(results) if text is None]
+    if missing:
+        texts = ai_manager.generate_many([prompts[i] for i in missing], COVER_MAX_TOKENS, COVER_TEMPERATURE)
+        for i, text in zip(missing, texts):
+            if text == EMPTY_RESPONSE:
+                results[i] = (None, False)
+                continue
+            generation_cache.set(keys[i], text, 'cover_letter')
+            results[i] = (text, False)
+    return results
 
 # dont need csrf for API endpoints
 @csrf_exempt
@@ -90,6 +157,7 @@ def generate_cover_letter(request):
         job_title = data.get('job_title', '') # job title for the cover letter
         company_name = data.get('company_name', '') # company name for the cover letter
         skills = data.get('skills', 'Python, Django, React') # skills for the cover letter
+        regenerate = wants_regenerate(data) # skip the cache and sample a new letter
         # if job_title is missing, return error response
         if not job_title:
             return Response({
@@ -99,36 +167,33 @@ def generate_cover_letter(request):
         # log the request details
         logger.info(f"📝 Generating cover letter for: {job_title}")
     #======== get request data =======
-
-        # Load model if not already loaded
-        if not ai_manager.model_loaded:
-            logger.info("Loading AI model...")
-            success = ai_manager.load_model()
-            if not success:
-                return Response({
-                    'success': False,
-                    'error': 'Failed to load AI model'
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         
         # Create detailed resume based on job type
         resume_content = create_resume_for_job(job_title, skills)
         
         # Create prompt in format expected by cover-letter-t5-base model
-        cover_prompt = f"""coverletter name: Content Writer job: {job_title} at {company_name} background: Senior Content Writer with 3+ years experience experiences: I created engaging content that increased organic traffic by 45%. I managed 20+ client accounts and developed content strategies across various industries. I have expertise in {skills}, SEO optimization, WordPress management, and email marketing campaigns. I am passionate about creating compelling content that drives results and engagement."""
+        cover_prompt = build_cover_prompt(job_title, company_name, skills)
         
-        # Generate cover letter with optimized prompt
-        ai_response = ai_manager.generate_response(
-            prompt=cover_prompt,
-            max_tokens=400,  # Good balance for quality and server constraints
-            temperature=0.7  # Standard temperature for creativity
+        # Generate cover letter with optimized prompt (same prompt + settings are served from cache)
+        ai_response, cached, error_response = _cached_generate(
+            'cover_letter',
+            cover_prompt,
+            max_tokens=COVER_MAX_TOKENS,
+            temperature=COVER_TEMPERATURE,
+            regenerate=regenerate
         )
+        if error_response is not None:
+            return error_response
         
         return Response({
             'cover_letter': ai_response,
+            'cached': cached,
             'success': True,
             'error': None
         })
         
+    except InferenceQueueFull as e:
+        return _queue_full_response(e, 'cover_letter')
     except Exception as e:
         logger.error(f"Error generating cover letter: {e}")
         return Response({
@@ -147,8 +212,15 @@ def direct_prompt(request):
     try:
         data = request.data
         prompt = data.get('prompt', '')
-        max_tokens = data.get('max_tokens', 300)
-        temperature = data.get('temperature', 0.7)
+        regenerate = wants_regenerate(data)
+        try:
+            max_tokens = int(data.get('max_tokens', 300))
+            temperature = float(data.get('temperature', 0.7))
+        except (TypeError, ValueError):
+            return Response({
+                'success': False,
+                'error': 'max_tokens and temperature must be numbers'
+            }, status=status.HTTP_400_BAD_REQUEST)
         
         if not prompt:
             return Response({
@@ -158,29 +230,26 @@ def direct_prompt(request):
         
         logger.info(f"🧠 Processing prompt: {prompt[:100]}...")
         
-        # Load model if not already loaded
-        if not ai_manager.model_loaded:
-            logger.info("Loading AI model...")
-            success = ai_manager.load_model()
-            if not success:
-                return Response({
-                    'success': False,
-                    'error': 'Failed to load AI model'
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
-        # Generate AI response
-        ai_response = ai_manager.generate_response(
-            prompt, 
-            max_tokens=max_tokens, 
-            temperature=temperature
+        # Generate AI response (cached per prompt + settings)
+        ai_response, cached, error_response = _cached_generate(
+            'prompt',
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            regenerate=regenerate
         )
+        if error_response is not None:
+            return error_response
         
         return Response({
             'response': ai_response,
+            'cached': cached,
             'success': True,
             'error': None
         })
         
+    except InferenceQueueFull as e:
+        return _queue_full_response(e, 'response')
     except Exception as e:
         logger.error(f"Error in direct_prompt: {e}")
         return Response({
@@ -189,6 +258,140 @@ def direct_prompt(request):
             'error': f'Prompt processing error: {str(e)}'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+# ========================== 📡 streamed generation (SSE) ==========================
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _generation_events(namespace, key, pieces, text_key):
+    """SSE events: 'token' per decoded piece, then 'done' with the full text (or 'error').
+
+    ``pieces`` is a started ai_manager.stream_generate iterator. Closing this generator
+    (client gone) closes ``pieces``, which cancels generate() at the next token.
+    """
+    text = []
+    try:
+        for piece in pieces:
+            text.append(piece)
+            yield _sse('token', {'text': piece})
+    except Exception as e:
+        logger.error(f"❌ Streamed generation failed: {e}")
+        yield _sse('error', {'error': str(e)})
+        return
+    finally:
+        pieces.close()
+    
+    full_text = ''.join(text).strip() or EMPTY_RESPONSE
+    if full_text != EMPTY_RESPONSE:
+        generation_cache.set(key, full_text, namespace)
+    yield _sse('done', {text_key: full_text, 'cached': False})
+
+
+def _cached_events(text, text_key):
+    yield _sse('token', {'text': text})
+    yield _sse('done', {text_key: text, 'cached': True})
+
+
+def _stream_generation(namespace, prompt, max_tokens, temperature, regenerate, text_key):
+    """StreamingHttpResponse for one generation (cache hit -> single token event)"""
+    key = make_cache_key(namespace, prompt, model=MODEL_NAME, backend=get_backend_name(), max_tokens=max_tokens, temperature=temperature)
+    text = generation_cache.get(key, bypass=regenerate)
+    if text is not None:
+        events = _cached_events(text, text_key)
+    else:
+        if not model_preloader.ensure('cover_letter'):
+            response = JsonResponse(model_preloader.loading_payload('cover_letter'), status=503)
+            response['Retry-After'] = str(model_preloader.retry_after())
+            return response
+        try:
+            pieces = ai_manager.stream_generate(prompt, max_tokens, temperature)
+        except InferenceQueueFull as e:
+            logger.warning(f"⏳ Generation queue full: {e}")
+            response = JsonResponse({
+                text_key: '',
+                'success': False,
+                'error': 'AI model is busy, please retry shortly'
+            }, status=503)
+            response['Retry-After'] = str(QUEUE_FULL_RETRY_AFTER)
+            return response
+        events = _generation_events(namespace, key, pieces, text_key)
+    
+    response = StreamingHttpResponse(events, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def _json_body(request):
+    try:
+        return json.loads(request.body or b'{}'), None
+    except ValueError:
+        return None, JsonResponse({'success': False, 'error': 'Invalid JSON body'}, status=400)
+
+
+@csrf_exempt
+@require_POST
+def generate_cover_letter_stream(request):
+    """Same input as generate_cover_letter; the letter arrives as SSE 'token' events"""
+    data, error_response = _json_body(request)
+    if error_response is not None:
+        return error_response
+    job_title = data.get('job_title', '')
+    if not job_title:
+        return JsonResponse({'success': False, 'error': 'job_title is required'}, status=400)
+    company_name = data.get('company_name', '')
+    skills = data.get('skills', 'Python, Django, React')
+    logger.info(f"📝 Streaming cover letter for: {job_title}")
+    return _stream_generation(
+        'cover_letter',
+        build_cover_prompt(job_title, company_name, skills),
+        max_tokens=COVER_MAX_TOKENS,
+        temperature=COVER_TEMPERATURE,
+        regenerate=wants_regenerate(data),
+        text_key='cover_letter'
+    )
+
+
+@csrf_exempt
+@require_POST
+def direct_prompt_stream(request):
+    """Same input as direct_prompt; the response arrives as SSE 'token' events"""
+    data, error_response = _json_body(request)
+    if error_response is not None:
+        return error_response
+    prompt = data.get('prompt', '')
+    if not prompt:
+        return JsonResponse({'success': False, 'error': 'prompt is required'}, status=400)
+    try:
+        max_tokens = int(data.get('max_tokens', 300))
+        temperature = float(data.get('temperature', 0.7))
+    except (TypeError, ValueError):
+        return JsonResponse({'success': False, 'error': 'max_tokens and temperature must be numbers'}, status=400)
+    logger.info(f"🧠 Streaming prompt: {prompt[:100]}...")
+    return _stream_generation(
+        'prompt', prompt, max_tokens, temperature, regenerate=wants_regenerate(data), text_key='response'
+    )
+# ========================== 📡 streamed generation (SSE) ==========================
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def model_readiness(request):
+    """
+    Per-model preload status; 200 when every preloaded model is ready, else 503 with Retry-After
+    """
+    models_status = model_preloader.get_status()
+    ready = all(
+        models_status.get(name, {}).get('status') == 'ready'
+        for name in model_preloader.configured_names()
+    )
+    response = Response({
+        'ready': ready,
+        'models': models_status
+    }, status=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE)
+    if not ready:
+        response['Retry-After'] = str(model_preloader.retry_after())
+    return response
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def ai_status(request):
@@ -197,6 +400,10 @@ def ai_status(request):
     """
     try:
         status_info = ai_manager.get_model_status()
+        status_info['cache'] = generation_cache.get_stats()
+        status_info['preload'] = model_preloader.get_status('cover_letter')
+        # the web process holds no models when AI_MODEL_SERVER is set: ask the server's registry
+        status_info['registry'] = model_client.registry_status() if model_client.enabled else model_registry.get_status()
         status_info.update({
             'hardware_optimization': 'CPU optimized for Django integration',
             'model_type': 'LoRA fine-tuned for cover letters',
@@ -0,0 +1,9 @@
+import os
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+# serving process: start background model preloading (backend/model_preloader.py)
+os.environ.setdefault('AI_PRELOAD_ON_STARTUP', '1')
+# async views (e.g. projects.views.generate_covers_async) run on the event loop here,
+# e.g.: uvicorn backend.asgi:application
+application = get_asgi_application()
@@ -0,0 +1,141 @@
+"""
+Shared listing helpers for the list endpoints (notifications, jobs, messages, interviews)
+
+- keyset pagination: ``?cursor=`` continues after the last row of the previous page
+  with a ``(field, id) < (value, pk)`` filter, so deep pages cost the same as the first
+  (``?offset=`` is still accepted for existing clients)
+- cached total counts: ``COUNT(*)`` results are cached per query for
+  ``LIST_COUNT_CACHE_TTL`` seconds and invalidated when rows of the model change
+
+Callers pass querysets that already use ``select_related``/``only()`` for the fields
+their serializer reads, so a page is one query plus (at most) one cached count.
+"""
+import base64
+import hashlib
+import json
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.utils.dateparse import parse_datetime
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+class ListingError(ValueError):
+    """Invalid pagination parameters (respond with 400)"""
+
+
+# ---- cursors ----
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict) and 'dt' in value:
+        return parse_datetime(value['dt'])
+    return value
+
+
+def encode_cursor(obj, field):
+    payload = [_encode_value(getattr(obj, field)), obj.pk]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        value, pk = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return _decode_value(value), pk
+    except (ValueError, TypeError):
+        raise ListingError('Invalid cursor')
+
+
+# ---- request parsing ----
+
+def parse_limit(request, default=DEFAULT_LIMIT, maximum=MAX_LIMIT):
+    try:
+        limit = int(request.GET.get('limit', default))
+    except ValueError:
+        raise ListingError('limit must be an integer')
+    return max(1, min(limit, maximum))
+
+
+def parse_offset(request):
+    try:
+        return max(0, int(request.GET.get('offset', 0)))
+    except ValueError:
+        raise ListingError('offset must be an integer')
+
+
+# ---- pagination ----
+
+def keyset_page(queryset, request, order_field, descending=True, default_limit=DEFAULT_LIMIT, max_limit=MAX_LIMIT):
+    """Return ``(rows, next_cursor, limit, offset)`` for one page of ``queryset``.
+
+    Rows are ordered by ``order_field`` then ``pk`` (both descending by default). With
+    ``?cursor=`` the page starts after that row; otherwise ``?offset=`` is applied.
+    """
+    limit = parse_limit(request, default_limit, max_limit)
+    prefix = '-' if descending else ''
+    queryset = queryset.order_by(f'{prefix}{order_field}', f'{prefix}pk')
+    cursor = request.GET.get('cursor')
+    offset = 0
+    if cursor:
+        value, pk = decode_cursor(cursor)
+        op = 'lt' if descending else 'gt'
+        queryset = queryset.filter(Q(**{f'{order_field}__{op}': value}) | Q(**{order_field: value, f'pk__{op}': pk}))
+        rows = list(queryset[:limit + 1])
+    else:
+        offset = parse_offset(request)
+        rows = list(queryset[offset:offset + limit + 1])
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1], order_field) if has_next and rows else None
+    return rows, next_cursor, limit, offset
+
+
+# ---- cached counts ----
+
+_invalidation_connected = set()
+
+
+def _version_key(model):
+    return f'listing:count-version:{model._meta.label_lower}'
+
+
+def invalidate_counts(*models):
+    """Drop cached counts for ``models`` (call after bulk writes, which skip signals)"""
+    for model in models:
+        try:
+            cache.incr(_version_key(model))
+        except ValueError:
+            cache.set(_version_key(model), 1, None)
+
+
+def _on_change(sender, **kwargs):
+    invalidate_counts(sender)
+
+
+def cached_count(queryset):
+    """``queryset.count()`` cached until the model changes or the TTL expires"""
+    model = queryset.model
+    if model not in _invalidation_connected:
+        post_save.connect(_on_change, sender=model, weak=False, dispatch_uid=f'listing-count-{model._meta.label_lower}-save')
+        post_delete.connect(_on_change, sender=model, weak=False, dispatch_uid=f'listing-count-{model._meta.label_lower}-delete')
+        _invalidation_connected.add(model)
+    version = cache.get(_version_key(model)) or 0
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.sha1(f'{sql}|{params}'.encode('utf-8')).hexdigest()
+    key = f'listing:count:{model._meta.label_lower}:{version}:{digest}'
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, getattr(settings, 'LIST_COUNT_CACHE_TTL', 30))
+    return count
@@ -0,0 +1,195 @@
+"""
+Model preloader: loads AI models in a background thread so requests never wait on a load
+
+Apps register their models from AppConfig.ready (``'cover_letter'`` in ai_cover_letters,
+``'interview'`` in AI_interview_chat). Names listed in AI_PRELOAD_MODELS are loaded one
+after another in a daemon thread when the server starts. Request paths call
+``ensure(name)``: it returns True when the model is ready, otherwise it makes sure a
+load is running and returns False so the view can answer 503 with ``Retry-After``.
+
+Settings:
+    AI_PRELOAD_MODELS       - model names loaded at startup (default: all registered)
+    AI_PRELOAD_RETRY_AFTER  - seconds suggested to clients while a model loads (default 10)
+    AI_PRELOAD_FAILED_RETRY - seconds before a failed load is attempted again (default 60)
+
+Loads start automatically only in server processes: ``manage.py runserver`` (the
+reloader child) or when AI_PRELOAD_ON_STARTUP=1 is set, as wsgi.py does. Other
+management commands and scripts never load models as a side effect of django.setup().
+
+With AI_MODEL_SERVER set (backend/model_server.py) web processes load nothing: start,
+ensure and get_status are answered by the model server, which runs this same preloader.
+"""
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from .model_server import model_client
+
+logger = logging.getLogger(__name__)
+
+STATUS_NOT_LOADED = 'not_loaded'
+STATUS_QUEUED = 'queued'
+STATUS_LOADING = 'loading'
+STATUS_READY = 'ready'
+STATUS_FAILED = 'failed'
+
+
+def is_server_process() -> bool:
+    """True in processes that serve requests (see module docstring)"""
+    if os.environ.get('AI_PRELOAD_ON_STARTUP') == '1':
+        return True
+    argv = sys.argv
+    if len(argv) > 1 and argv[1] == 'runserver':
+        # the autoreloader parent only watches files; RUN_MAIN marks the serving child
+        return os.environ.get('RUN_MAIN') == 'true' or '--noreload' in argv
+    return False
+
+
+class ModelPreloader:
+    """Registry of loadable models with per-model readiness and load timings"""
+
+    def __init__(self):
+        self._loaders: Dict[str, tuple] = {}
+        self._state: Dict[str, dict] = {}
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    # ---- registry ----
+
+    def register(self, name: str, load: Callable[[bool], bool], is_ready: Callable[[], bool]):
+        """Register ``load(force) -> bool`` / ``is_ready() -> bool``; preloads it if configured"""
+        with self._lock:
+            self._loaders[name] = (load, is_ready)
+            self._state.setdefault(name, {
+                'status': STATUS_NOT_LOADED,
+                'load_seconds': None,
+                'error': None,
+                'started_at': None,
+                'finished_at': None,
+            })
+        if name in self.configured_names() and is_server_process() and not model_client.enabled:
+            self.start([name])
+
+    def configured_names(self):
+        names = getattr(settings, 'AI_PRELOAD_MODELS', None)
+        return list(self._loaders) if names is None else list(names)
+
+    # ---- loading ----
+
+    def start(self, names: Optional[Iterable[str]] = None, force: bool = False):
+        """Queue background loads for ``names`` (default: configured models)"""
+        names = list(names) if names is not None else self.configured_names()
+        if model_client.enabled:
+            model_client.start(names, force=force)
+            return
+        with self._lock:
+            for name in names:
+                if name not in self._loaders:
+                    logger.warning(f"⚠️ Unknown model '{name}' in preload list")
+                    continue
+                state = self._state[name]
+                if state['status'] in (STATUS_QUEUED, STATUS_LOADING):
+                    continue
+                if state['status'] == STATUS_READY and not force:
+                    continue
+                state['status'] = STATUS_QUEUED
+                self._queue.append((name, force))
+            if self._queue and (self._worker is None or not self._worker.is_alive()):
+                self._worker = threading.Thread(target=self._run, name='model-preloader', daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._worker = None
+                    return
+                name, force = self._queue.popleft()
+                load, _ = self._loaders[name]
+                self._state[name].update(status=STATUS_LOADING, error=None, started_at=timezone.now().isoformat())
+            logger.info(f"⏳ Preloading model '{name}'...")
+            started = time.monotonic()
+            try:
+                ok = load(force)
+                error = None if ok else 'Loader reported failure'
+            except Exception as e:
+                ok, error = False, str(e)
+            elapsed = round(time.monotonic() - started, 2)
+            with self._lock:
+                self._state[name].update(
+                    status=STATUS_READY if ok else STATUS_FAILED,
+                    load_seconds=elapsed,
+                    error=error,
+                    finished_at=timezone.now().isoformat(),
+                )
+            if ok:
+                logger.info(f"✅ Model '{name}' ready in {elapsed}s")
+            else:
+                logger.error(f"❌ Model '{name}' failed to load after {elapsed}s: {error}")
+
+    # ---- readiness ----
+
+    def ensure(self, name: str) -> bool:
+        """True if ``name`` is ready; otherwise start (or keep) a background load and return False"""
+        if model_client.enabled:
+            return model_client.ensure(name)
+        entry = self._loaders.get(name)
+        if entry is None:
+            return False
+        _, is_ready = entry
+        with self._lock:
+            state = self._state[name]
+            if is_ready():
+                # loaded outside the preloader (e.g. a management command)
+                state['status'] = STATUS_READY
+                return True
+            if state['status'] in (STATUS_QUEUED, STATUS_LOADING):
+                return False
+            if state['status'] == STATUS_FAILED and state['finished_at']:
+                failed_retry = getattr(settings, 'AI_PRELOAD_FAILED_RETRY', 60)
+                finished = timezone.datetime.fromisoformat(state['finished_at'])
+                if (timezone.now() - finished).total_seconds() < failed_retry:
+                    return False
+        self.start([name])
+        return False
+
+    def get_status(self, name: Optional[str] = None):
+        if model_client.enabled:
+            return model_client.get_status(name)
+        with self._lock:
+            if name is not None:
+                return dict(self._state.get(name, {'status': STATUS_NOT_LOADED}))
+            return {model: dict(state) for model, state in self._state.items()}
+
+    def retry_after(self) -> int:
+        return getattr(settings, 'AI_PRELOAD_RETRY_AFTER', 10)
+
+    def loading_payload(self, name: str) -> dict:
+        state = self.get_status(name)
+        return {
+            'success': False,
+            'error': f"AI model '{name}' is {state['status'].replace('_', ' ')}, please retry shortly",
+            'model': name,
+            'model_status': state['status'],
+            'retry_after': self.retry_after(),
+        }
+
+    def unavailable_response(self, name: str, **extra) -> Response:
+        """DRF 503 response with Retry-After for a model that is not ready yet"""
+        response = Response(dict(extra, **self.loading_payload(name)), status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        response['Retry-After'] = str(self.retry_after())
+        return response
+
+
+# process-wide preloader; see ai_cover_letters.apps / AI_interview_chat.apps
+model_preloader = ModelPreloader()
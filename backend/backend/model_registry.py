@@ -0,0 +1,335 @@
+"""
+Model registry: loads every AI model from its AIModelConfig row and keeps them inside a RAM budget
+
+Apps register a loader per ``AIModelConfig.model_type`` from AppConfig.ready:
+
+    model_registry.register('cover_letter', load, unload, model_name=..., model_path=...)
+
+``load(config)`` builds the model from the active AIModelConfig row (model_path, use_cpu,
+batch_size) and returns a handle; ``unload(handle)`` drops the owner's references. A row
+is created from the registered defaults the first time a type loads, so the admin can
+change paths and settings afterwards.
+
+The resident size of each model is measured at load time (process RSS delta, or tensor
+bytes when larger). When AI_MODEL_RAM_BUDGET_MB would be exceeded, idle models are
+evicted least-recently-used first; models inside ``use()`` are never evicted. An evicted
+model is reloaded in the background on its next use (callers fall back meanwhile).
+``is_loaded``, ``load_time_seconds`` and ``last_used`` are written back to the rows.
+
+Settings:
+    AI_MODEL_RAM_BUDGET_MB   - total MB for loaded models; 0 = no limit (default)
+    AI_MODEL_LAST_USED_WRITE - min seconds between last_used writes per model (default 60)
+    AI_PRELOAD_FAILED_RETRY  - seconds before a failed background load is attempted again
+"""
+import gc
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils import timezone
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+def _rss_bytes() -> Optional[int]:
+    """Current resident set size of this process"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _tensor_bytes(obj, seen=None) -> int:
+    """Parameter + buffer bytes of the torch modules inside a handle (modules, pipelines, containers)"""
+    if torch is None or obj is None:
+        return 0
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, torch.nn.Module):
+        tensors = list(obj.parameters()) + list(obj.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+    if isinstance(obj, dict):
+        return sum(_tensor_bytes(value, seen) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(_tensor_bytes(value, seen) for value in obj)
+    # transformers pipelines keep the module on .model
+    return _tensor_bytes(getattr(obj, 'model', None), seen)
+
+
+def select_device(config) -> str:
+    """'cuda' only when the row asks for it (use_cpu=False) and a GPU exists"""
+    if torch is not None and not config.use_cpu and torch.cuda.is_available():
+        return 'cuda'
+    return 'cpu'
+
+
+class ModelRegistry:
+    """Loads, tracks and evicts the models of all apps under one RAM budget"""
+
+    def __init__(self):
+        self._specs: Dict[str, dict] = {}
+        self._entries: Dict[str, dict] = {}
+        self._lock = threading.RLock()
+        # loads run one at a time so the RSS delta belongs to a single model
+        self._load_lock = threading.Lock()
+        self._background = set()
+
+    # ---- registration / configuration ----
+
+    def register(self, model_type: str, load: Callable[[Any], Any], unload: Callable[[Any], None], **defaults):
+        """``defaults`` (model_name, model_path, batch_size, ...) seed the AIModelConfig row"""
+        defaults.setdefault('model_path', defaults.get('model_name', model_type))
+        with self._lock:
+            self._specs[model_type] = {'load': load, 'unload': unload, 'defaults': defaults}
+            self._entries.setdefault(model_type, {
+                'handle': None,
+                'bytes': None,
+                'in_use': 0,
+                'last_used': None,
+                'last_written': 0.0,
+                'load_seconds': None,
+                'error': None,
+                'failed_at': None,
+                'config_pk': None,
+            })
+
+    def budget_bytes(self) -> Optional[int]:
+        budget_mb = getattr(settings, 'AI_MODEL_RAM_BUDGET_MB', 0)
+        return int(budget_mb * MB) if budget_mb else None
+
+    def get_config(self, model_type: str):
+        """Active AIModelConfig row for ``model_type`` (created from defaults if the type has none).
+
+        Returns None when rows exist but all are inactive (disabled in the admin). Without a
+        usable database an unsaved row built from the defaults is returned.
+        """
+        AIModelConfig = apps.get_model('AI_interview_chat', 'AIModelConfig')
+        defaults = dict(self._specs[model_type]['defaults'])
+        try:
+            rows = AIModelConfig.objects.filter(model_type=model_type)
+            config = rows.filter(is_active=True).order_by('-updated_at').first()
+            if config is None and not rows.exists():
+                model_name = defaults.pop('model_name', model_type)
+                config, _ = AIModelConfig.objects.get_or_create(
+                    model_type=model_type, model_name=model_name, defaults=defaults
+                )
+            return config
+        except DatabaseError as e:
+            logger.warning(f"⚠️ Using default config for '{model_type}' (AIModelConfig unavailable: {e})")
+            return AIModelConfig(model_type=model_type, **defaults)
+
+    def _write_back(self, model_type: str, **fields):
+        pk = self._entries[model_type]['config_pk']
+        if pk is None:
+            return
+        try:
+            apps.get_model('AI_interview_chat', 'AIModelConfig').objects.filter(pk=pk).update(**fields)
+        except DatabaseError as e:
+            logger.warning(f"⚠️ Could not update AIModelConfig for '{model_type}': {e}")
+
+    # ---- loading / eviction ----
+
+    def is_loaded(self, model_type: str) -> bool:
+        entry = self._entries.get(model_type)
+        return entry is not None and entry['handle'] is not None
+
+    def load(self, model_type: str, force: bool = False) -> bool:
+        """Load ``model_type`` now (blocking), evicting idle models if the budget requires it"""
+        if model_type not in self._specs:
+            raise ValueError(f"Unknown model type '{model_type}'")
+        with self._load_lock:
+            if self.is_loaded(model_type):
+                if not force:
+                    self.touch(model_type)
+                    return True
+                if not self.evict(model_type):
+                    logger.warning(f"⚠️ '{model_type}' is in use; keeping the loaded copy")
+                    return True
+
+            config = self.get_config(model_type)
+            entry = self._entries[model_type]
+            if config is None:
+                logger.warning(f"⚠️ Model '{model_type}' is disabled (no active AIModelConfig)")
+                # back off like a failed load: get()/use() would otherwise re-query the config each call
+                entry.update(error='disabled', failed_at=time.monotonic())
+                return False
+            entry['config_pk'] = config.pk
+
+            # make room up front when the size is known from an earlier load
+            if entry['bytes']:
+                self._make_room(entry['bytes'], exclude=model_type)
+
+            logger.info(f"📥 Loading '{model_type}' from {config.model_path}")
+            rss_before = _rss_bytes()
+            started = time.monotonic()
+            try:
+                handle = self._specs[model_type]['load'](config)
+            except Exception as e:
+                logger.error(f"❌ Failed to load '{model_type}': {e}")
+                entry.update(error=str(e), failed_at=time.monotonic())
+                self._write_back(model_type, is_loaded=False)
+                return False
+            load_seconds = round(time.monotonic() - started, 2)
+
+            rss_after = _rss_bytes()
+            rss_delta = rss_after - rss_before if rss_before is not None and rss_after is not None else 0
+            size = max(rss_delta, _tensor_bytes(handle))
+            with self._lock:
+                entry.update(handle=handle, bytes=size, load_seconds=load_seconds, error=None,
+                             failed_at=None, last_used=time.monotonic(), last_written=time.monotonic())
+            self._write_back(model_type, is_loaded=True, load_time_seconds=load_seconds, last_used=timezone.now())
+            logger.info(f"✅ '{model_type}' loaded in {load_seconds}s (~{size / MB:.0f} MB)")
+
+            self._make_room(0, exclude=model_type)
+            return True
+
+    def load_async(self, model_type: str):
+        """Reload an evicted model in the background (failed loads wait AI_PRELOAD_FAILED_RETRY)"""
+        entry = self._entries.get(model_type)
+        if entry is None or entry['handle'] is not None:
+            return
+        failed_retry = getattr(settings, 'AI_PRELOAD_FAILED_RETRY', 60)
+        if entry['failed_at'] and time.monotonic() - entry['failed_at'] < failed_retry:
+            return
+        with self._lock:
+            if model_type in self._background:
+                return
+            self._background.add(model_type)
+
+        def run():
+            try:
+                self.load(model_type)
+            finally:
+                with self._lock:
+                    self._background.discard(model_type)
+
+        threading.Thread(target=run, name=f'model-registry-{model_type}', daemon=True).start()
+
+    def evict(self, model_type: str) -> bool:
+        """Unload an idle model; returns False if it is in use or not loaded"""
+        with self._lock:
+            entry = self._entries.get(model_type)
+            if entry is None or entry['handle'] is None or entry['in_use']:
+                return False
+            handle, entry['handle'] = entry['handle'], None
+        self._specs[model_type]['unload'](handle)
+        del handle
+        gc.collect()
+        self._write_back(model_type, is_loaded=False)
+        logger.info(f"♻️ Evicted '{model_type}' (~{(entry['bytes'] or 0) / MB:.0f} MB)")
+        return True
+
+    def used_bytes(self) -> int:
+        with self._lock:
+            return sum(entry['bytes'] or 0 for entry in self._entries.values() if entry['handle'] is not None)
+
+    def _make_room(self, needed: int, exclude: Optional[str] = None):
+        budget = self.budget_bytes()
+        if budget is None:
+            return
+        while self.used_bytes() + needed > budget:
+            with self._lock:
+                idle = [(entry['last_used'] or 0, name) for name, entry in self._entries.items()
+                        if name != exclude and entry['handle'] is not None and not entry['in_use']]
+            if not idle:
+                logger.warning(f"⚠️ Model RAM budget exceeded ({(self.used_bytes() + needed) / MB:.0f} MB "
+                               f"> {budget / MB:.0f} MB) and nothing idle to evict")
+                return
+            self.evict(min(idle)[1])
+
+    # ---- usage ----
+
+    def touch(self, model_type: str):
+        """Mark a model as used (LRU order, throttled last_used write-back)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(model_type)
+            if entry is None:
+                return
+            entry['last_used'] = now
+            write = now - entry['last_written'] >= getattr(settings, 'AI_MODEL_LAST_USED_WRITE', 60)
+            if write:
+                entry['last_written'] = now
+        if write:
+            self._write_back(model_type, last_used=timezone.now())
+
+    def get(self, model_type: str):
+        """Loaded handle (marked used) or None, in which case a background reload starts.
+
+        Not pinned: an eviction during the call only frees the memory once the caller's
+        references go away. Use ``use()`` around long work that must keep its slot.
+        """
+        entry = self._entries.get(model_type)
+        handle = entry['handle'] if entry else None
+        if handle is None:
+            self.load_async(model_type)
+        else:
+            self.touch(model_type)
+        return handle
+
+    @contextmanager
+    def use(self, model_type: str):
+        """Yield the loaded handle (pinned against eviction) or None while it is not loaded"""
+        with self._lock:
+            entry = self._entries.get(model_type)
+            handle = entry['handle'] if entry else None
+            if handle is not None:
+                entry['in_use'] += 1
+        if handle is None:
+            self.load_async(model_type)
+            yield None
+            return
+        try:
+            self.touch(model_type)
+            yield handle
+        finally:
+            with self._lock:
+                entry['in_use'] -= 1
+
+    def get_status(self):
+        now = time.monotonic()
+        budget = self.budget_bytes()
+        with self._lock:
+            models = {
+                name: {
+                    'loaded': entry['handle'] is not None,
+                    'memory_mb': round(entry['bytes'] / MB, 1) if entry['bytes'] else None,
+                    'in_use': entry['in_use'],
+                    'idle_seconds': round(now - entry['last_used'], 1) if entry['last_used'] else None,
+                    'load_seconds': entry['load_seconds'],
+                    'error': entry['error'],
+                }
+                for name, entry in self._entries.items()
+            }
+        return {
+            'budget_mb': round(budget / MB) if budget else None,
+            'used_mb': round(self.used_bytes() / MB, 1),
+            'models': models,
+        }
+
+
+# process-wide registry; loaders are registered in the apps' AppConfig.ready
+model_registry = ModelRegistry()
@@ -0,0 +1,366 @@
+"""
+Model server: one process holds the AI model weights, web workers call it over a local socket
+
+Without it every Django worker that touches ``ai_manager`` or ``ai_interview_engine`` loads
+its own copy of T5 / GPT-2 / bart-large-mnli. With AI_MODEL_SERVER set, start the models once:
+
+    python manage.py run_model_server
+
+and the web workers keep no weights at all: views wrap the singletons with
+``served_model(name, local)``, which forwards public method calls to the server, and the
+model preloader asks the server for readiness instead of loading locally. Leaving
+AI_MODEL_SERVER unset keeps the old in-process behaviour.
+
+Protocol: one JSON object per line in each direction, connections are reused.
+
+    -> {"op": "call", "model": "cover_letter", "method": "generate", "args": [...], "kwargs": {...}}
+    <- {"ok": true, "result": ...}  or  {"ok": false, "error": "...", "error_type": "InferenceQueueFull"}
+
+``op`` is one of ping / status / registry / ensure / start / call / stream. A stream answers
+{"ok": true} once the generator is created, then {"chunk": "..."} lines and a final
+{"ok": true, "done": true}; closing the connection cancels the generation.
+
+Settings:
+    AI_MODEL_SERVER         - unix socket path (e.g. /tmp/upworkai-models.sock) or host:port
+    AI_MODEL_SERVER_TIMEOUT - seconds a client waits for a reply (default 120)
+"""
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from functools import partial
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# model name (as used by the preloader) -> singleton holding the weights
+SERVED_MODELS = {
+    'cover_letter': 'ai_cover_letters.models.ai_manager',
+    'interview': 'AI_interview_chat.ai_engine.ai_interview_engine',
+}
+
+# methods returning iterators of text pieces
+STREAM_METHODS = {
+    'cover_letter': {'stream_generate'},
+}
+
+# exceptions re-raised on the client side with their original type
+REMOTE_EXCEPTIONS = {
+    'InferenceQueueFull': 'ai_cover_letters.batching.InferenceQueueFull',
+    'ValueError': ValueError,
+    'TypeError': TypeError,
+}
+
+
+class ModelServerUnavailable(ConnectionError):
+    """The model server could not be reached"""
+
+
+class ModelServerError(RuntimeError):
+    """The model server raised an error without a client-side equivalent"""
+
+
+def _json_default(value):
+    # numpy / torch scalars from the pipelines
+    if hasattr(value, 'item'):
+        return value.item()
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    return str(value)
+
+
+def _encode(message) -> bytes:
+    return (json.dumps(message, default=_json_default) + '\n').encode('utf-8')
+
+
+def _parse_address(address):
+    """``host:port`` -> (AF_INET, (host, port)); anything else is a unix socket path"""
+    host, sep, port = str(address).rpartition(':')
+    if sep and port.isdigit() and '/' not in host and '\\' not in host:
+        return socket.AF_INET, (host or '127.0.0.1', int(port))
+    return socket.AF_UNIX, str(address)
+
+
+# ========= 📡 Client (web workers) =========
+
+class ModelClient:
+    """Thin client used by web workers; one persistent connection per thread"""
+
+    def __init__(self):
+        self._local = threading.local()
+        # set by run_model_server: the server itself always runs models locally
+        self.in_server = False
+
+    @property
+    def address(self):
+        return getattr(settings, 'AI_MODEL_SERVER', None)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.address) and not self.in_server
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'AI_MODEL_SERVER_TIMEOUT', 120)
+
+    def _connect(self):
+        family, target = _parse_address(self.address)
+        try:
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(target)
+        except OSError as e:
+            raise ModelServerUnavailable(f"Model server at {self.address} is not reachable: {e}") from e
+        return sock, sock.makefile('rb')
+
+    def _close(self, conn):
+        sock, reader = conn
+        for closable in (reader, sock):
+            try:
+                closable.close()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _read(conn):
+        line = conn[1].readline()
+        if not line:
+            raise ModelServerUnavailable('Model server closed the connection')
+        return json.loads(line)
+
+    @staticmethod
+    def _raise_for(reply):
+        if reply.get('ok'):
+            return reply
+        error_type = REMOTE_EXCEPTIONS.get(reply.get('error_type'))
+        if isinstance(error_type, str):
+            error_type = import_string(error_type)
+        raise (error_type or ModelServerError)(reply.get('error', 'Model server error'))
+
+    def request(self, payload):
+        """Send one request on this thread's connection and return the reply"""
+        for attempt in (1, 2):
+            conn = getattr(self._local, 'conn', None)
+            fresh = conn is None
+            if fresh:
+                conn = self._local.conn = self._connect()
+            try:
+                conn[0].sendall(_encode(payload))
+                return self._raise_for(self._read(conn))
+            except TimeoutError as e:
+                self._drop(conn)
+                raise ModelServerUnavailable(f"Model server did not answer within {self.timeout}s") from e
+            except (OSError, ModelServerUnavailable) as e:
+                self._drop(conn)
+                # a reused connection may have gone stale (server restarted); retry once
+                if fresh or attempt == 2:
+                    if isinstance(e, ModelServerUnavailable):
+                        raise
+                    raise ModelServerUnavailable(str(e)) from e
+
+    def _drop(self, conn):
+        self._close(conn)
+        self._local.conn = None
+
+    def call(self, model, method, *args, **kwargs):
+        return self.request({'op': 'call', 'model': model, 'method': method,
+                             'args': list(args), 'kwargs': kwargs})['result']
+
+    def stream(self, model, method, *args, **kwargs):
+        """Start a streamed call; errors raised while starting surface here, not on first next()"""
+        conn = self._connect()
+        try:
+            conn[0].sendall(_encode({'op': 'stream', 'model': model, 'method': method,
+                                     'args': list(args), 'kwargs': kwargs}))
+            self._raise_for(self._read(conn))
+        except Exception:
+            self._close(conn)
+            raise
+        return self._iter_stream(conn)
+
+    def _iter_stream(self, conn):
+        try:
+            while True:
+                reply = self._read(conn)
+                if 'chunk' in reply:
+                    yield reply['chunk']
+                    continue
+                self._raise_for(reply)
+                return
+        finally:
+            # closing the socket makes the server cancel the generation
+            self._close(conn)
+
+    def ensure(self, name) -> bool:
+        try:
+            return bool(self.request({'op': 'ensure', 'model': name})['result'])
+        except ModelServerUnavailable as e:
+            logger.warning(f"⚠️ {e}")
+            return False
+
+    def start(self, names, force=False):
+        self.request({'op': 'start', 'models': list(names), 'force': force})
+
+    def get_status(self, name=None):
+        try:
+            return self.request({'op': 'status', 'model': name})['result']
+        except ModelServerUnavailable as e:
+            state = {'status': 'unavailable', 'error': str(e)}
+            return state if name is not None else {model: dict(state) for model in SERVED_MODELS}
+
+    def registry_status(self):
+        """model_registry.get_status() of the server process (the web workers hold no models)"""
+        try:
+            return self.request({'op': 'registry'})['result']
+        except ModelServerUnavailable as e:
+            return {'status': 'unavailable', 'error': str(e)}
+
+
+class ServedModel:
+    """Stands in for a model singleton; public methods run on the model server when one is configured"""
+
+    def __init__(self, name, local):
+        self._name = name
+        self._local = local
+
+    def __getattr__(self, attr):
+        value = getattr(self._local, attr)
+        if not model_client.enabled or attr.startswith('_') or not callable(value):
+            return value
+        if attr in STREAM_METHODS.get(self._name, ()):
+            return partial(model_client.stream, self._name, attr)
+        return partial(model_client.call, self._name, attr)
+
+
+def served_model(name, local):
+    return ServedModel(name, local)
+
+
+# ========= 🖥️ Server (run_model_server) =========
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                self.server.model_server.handle_request(json.loads(line), self._send)
+            except (BrokenPipeError, ConnectionResetError):
+                return
+
+    def _send(self, message):
+        self.wfile.write(_encode(message))
+        self.wfile.flush()
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, 'ThreadingUnixStreamServer'):
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+else:  # Windows: use host:port
+    _UnixServer = None
+
+
+class ModelServer:
+    """Loads the served models once and answers client requests"""
+
+    def __init__(self, address=None, models=None):
+        self.address = address or getattr(settings, 'AI_MODEL_SERVER', None)
+        if not self.address:
+            raise ValueError('AI_MODEL_SERVER is not set')
+        self.models = list(models or SERVED_MODELS)
+        self._server = None
+
+    def _method(self, model, method):
+        if model not in self.models or not method or method.startswith('_'):
+            raise ValueError(f"'{model}.{method}' is not served")
+        fn = getattr(import_string(SERVED_MODELS[model]), method, None)
+        if not callable(fn):
+            raise ValueError(f"'{model}.{method}' is not served")
+        return fn
+
+    def handle_request(self, request, send):
+        from .model_preloader import model_preloader
+
+        op = request.get('op')
+        try:
+            if op == 'ping':
+                send({'ok': True, 'result': 'pong'})
+            elif op == 'status':
+                send({'ok': True, 'result': model_preloader.get_status(request.get('model'))})
+            elif op == 'registry':
+                from .model_registry import model_registry
+                send({'ok': True, 'result': model_registry.get_status()})
+            elif op == 'ensure':
+                send({'ok': True, 'result': model_preloader.ensure(request['model'])})
+            elif op == 'start':
+                model_preloader.start(request.get('models'), force=bool(request.get('force')))
+                send({'ok': True, 'result': None})
+            elif op in ('call', 'stream'):
+                fn = self._method(request.get('model'), request.get('method'))
+                result = fn(*request.get('args', []), **request.get('kwargs', {}))
+                if op == 'call':
+                    send({'ok': True, 'result': result})
+                else:
+                    self._send_stream(result, send)
+            else:
+                raise ValueError(f"Unknown op '{op}'")
+        except (BrokenPipeError, ConnectionResetError):
+            raise
+        except Exception as e:
+            logger.error(f"❌ Model server {op} {request.get('model')}.{request.get('method', '')} failed: {e}")
+            send({'ok': False, 'error': str(e), 'error_type': type(e).__name__})
+
+    @staticmethod
+    def _send_stream(pieces, send):
+        try:
+            send({'ok': True})
+            for piece in pieces:
+                send({'chunk': piece})
+            send({'ok': True, 'done': True})
+        finally:
+            # client gone (BrokenPipe) or finished: closing stops generate()
+            close = getattr(pieces, 'close', None)
+            if close:
+                close()
+
+    def serve_forever(self):
+        from .model_preloader import model_preloader
+
+        model_client.in_server = True
+        family, target = _parse_address(self.address)
+        if family == socket.AF_UNIX:
+            if _UnixServer is None:
+                raise RuntimeError('Unix sockets are not available here; set AI_MODEL_SERVER to host:port')
+            if os.path.exists(target):
+                os.unlink(target)  # stale socket from a previous run
+            self._server = _UnixServer(target, _RequestHandler)
+            os.chmod(target, 0o660)
+        else:
+            self._server = _TCPServer(target, _RequestHandler)
+        self._server.model_server = self
+
+        model_preloader.start(self.models)
+        logger.info(f"🖥️ Model server listening on {self.address} (models: {', '.join(self.models)})")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if family == socket.AF_UNIX and os.path.exists(target):
+                os.unlink(target)
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+
+
+# process-wide client; see served_model() and backend/model_preloader.py
+model_client = ModelClient()
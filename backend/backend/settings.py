@@ -27,6 +27,7 @@ INSTALLED_APPS = [
     'notification_push',  # NotificationPushBrowser app (Django integration)
     'upwork_messages',  # New Upwork messages/chat app
     'AI_interview_chat',  # AI Interview Chat system with Hugging Face models
+    'task_queue',  # Persisted background tasks (scrapes, extraction, chat analysis)
 ]
 
 MIDDLEWARE = [
@@ -88,6 +89,7 @@ CSRF_TRUSTED_ORIGINS = [
 ] 
 
 WSGI_APPLICATION = 'backend.wsgi.application'
+ASGI_APPLICATION = 'backend.asgi.application'
 
 DATABASES = {
     'default': {
@@ -120,3 +122,73 @@ FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 
 # Custom timeout for scraping operations
 SCRAPING_TIMEOUT = 300  # 5 minutes
+
+# Persistent node scraper worker (frontend/src/scraper/scraper_worker.js), local socket
+SCRAPER_WORKER_PORT = int(os.environ.get('SCRAPER_WORKER_PORT', 9333))
+
+# Background task executor (task_queue app)
+TASK_QUEUE_MAX_WORKERS = 2
+
+# Background model preloading (backend/model_preloader.py): 'cover_letter', 'interview'
+# Comma separated AI_PRELOAD_MODELS env var; empty disables startup loading (models then load on first use)
+AI_PRELOAD_MODELS = [name for name in os.environ.get('AI_PRELOAD_MODELS', 'cover_letter,interview').split(',') if name]
+AI_PRELOAD_RETRY_AFTER = 10  # Retry-After seconds on 503 while a model is loading
+
+# Dedicated model server (backend/model_server.py, started with: python manage.py run_model_server)
+# Unix socket path or host:port; unset = every worker loads its own models in-process
+AI_MODEL_SERVER = os.environ.get('AI_MODEL_SERVER') or None
+AI_MODEL_SERVER_TIMEOUT = 120  # seconds a web worker waits for a model server reply
+
+# Model registry (backend/model_registry.py): models load from AIModelConfig rows; idle ones are
+# evicted least-recently-used first when loaded models would exceed this many MB (0 = no limit)
+AI_MODEL_RAM_BUDGET_MB = int(os.environ.get('AI_MODEL_RAM_BUDGET_MB', '0'))
+AI_MODEL_LAST_USED_WRITE = 60  # min seconds between AIModelConfig.last_used updates per model
+
+# Cover letter generation queue (ai_cover_letters/batching.py)
+AI_BATCH_MAX_SIZE = 8  # prompts per model.generate call
+AI_BATCH_WINDOW_MS = 25  # how long the first request waits for others to join
+AI_BATCH_MAX_QUEUE = 64  # waiting requests before new ones get 503
+AI_MAX_STREAMS = 2  # concurrent token-streamed generations (/stream/ endpoints)
+
+# Cover letter model CPU backend (ai_cover_letters/inference_backends.py): fp32 | int8 | onnx
+# Compare them with: python manage.py benchmark_inference
+AI_INFERENCE_BACKEND = os.environ.get('AI_INFERENCE_BACKEND', 'fp32')
+AI_ONNX_CACHE_DIR = BASE_DIR / 'cache' / 'onnx'  # exported ONNX models, reused across restarts
+
+# Generated text cache (ai_cover_letters/generation_cache.py); 'regenerate': true bypasses it
+AI_GENERATION_CACHE_TTL = 7 * 24 * 3600
+AI_GENERATION_CACHE_MEMORY_SIZE = 256
+AI_GENERATION_CACHE_DB_SIZE = 5000
+
+# Async cover letters (projects/async_cover_client.py, POST /api/generate-covers-async/ under ASGI: backend/asgi.py)
+# Remote backends tried in order: 'tgi' (DEEPSEAK_LOCAL_URL), 'deepseak' (DEEPSEAK_API_URL/KEY), 'zephyr'
+COVER_ASYNC_BACKENDS = [b.strip() for b in os.environ.get('COVER_ASYNC_BACKENDS', 'tgi,deepseak,zephyr').split(',') if b.strip()]
+COVER_ASYNC_CONCURRENCY = 8  # generations in flight per batch
+COVER_ASYNC_TIMEOUT = 30  # seconds per remote request
+ZEPHYR_API_URL = os.environ.get('ZEPHYR_API_URL', 'http://localhost:8002/api/generate-cover-letter')
+
+# Hedged cover letters (projects/hedged_router.py): mode 'hedged', or COVER_ROUTING=hedged for every request.
+# Each next backend starts when the previous one has not answered within its latency percentile.
+COVER_ROUTING = os.environ.get('COVER_ROUTING', 'template')
+COVER_HEDGE_BACKENDS = ['local', 'tgi', 'zephyr', 'template']
+COVER_HEDGE_PERCENTILE = 0.9
+COVER_HEDGE_DEFAULT_DELAY = 5.0  # seconds, until a backend has enough latency samples
+COVER_HEDGE_MIN_DELAY = 0.5
+COVER_HEDGE_MAX_DELAY = 30.0
+COVER_MIN_CHARS = 150  # shorter results do not count as a letter
+
+# List endpoints (backend/listing.py): seconds a COUNT(*) total stays cached
+LIST_COUNT_CACHE_TTL = 30
+
+# Project match scoring: 'keyword' (regex skill hits) or 'embedding' (sentence encoder cosine)
+MATCH_SCORE_ENGINE = os.environ.get('MATCH_SCORE_ENGINE', 'keyword')
+EMBEDDING_MODEL_NAME = 'sentence-transformers/all-MiniLM-L6-v2'
+EMBEDDING_CACHE_DIR = BASE_DIR / 'cache' / 'embeddings'
+EMBEDDING_BATCH_WINDOW_MS = 5  # small encode() calls wait this long to share a forward pass
+
+# Chat topic extraction (AI_interview_chat/topic_classifier.py): 'zeroshot' (bart-large-mnli, one
+# pass per label) or 'embedding' (sentence encoder vs. pre-embedded labels); compare: manage.py benchmark_topics
+INTERVIEW_TOPIC_ENGINE = os.environ.get('INTERVIEW_TOPIC_ENGINE', 'zeroshot')
+TOPIC_EMBEDDING_THRESHOLD = 0.3  # min cosine similarity for a label
+TOPIC_EMBEDDING_TOP_K = 3  # max labels per text
+INTERVIEW_QUESTION_BATCH_SIZE = 8  # GPT-2 question prompts per left-padded generate() call
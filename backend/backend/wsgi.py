@@ -2,4 +2,6 @@ import os
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+# serving process: start background model preloading (backend/model_preloader.py)
+os.environ.setdefault('AI_PRELOAD_ON_STARTUP', '1')
 application = get_wsgi_application()
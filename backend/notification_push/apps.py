@@ -3,4 +3,8 @@ from django.apps import AppConfig
 
 class NotificationPushConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'notification_push'
\ No newline at end of file
+    name = 'notification_push'
+
+    def ready(self):
+        # register task_queue handlers
+        from . import tasks  # noqa: F401
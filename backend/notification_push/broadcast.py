@@ -0,0 +1,72 @@
+"""
+Notification Broadcast Hub
+In-memory fan-out of new notifications/jobs to connected SSE and long-poll clients
+
+save_scraped_jobs_to_database publishes one event per scrape after its transaction
+commits; clients block on the hub (no DB queries while idle) and receive only the
+delta. Event ids are "<boot id>:<sequence>" so a client reconnecting with a
+Last-Event-ID from an older process, or one that fell out of the history window,
+gets a 'resync' event and refetches the lists once.
+"""
+import threading
+import uuid
+from collections import deque
+
+# events kept for reconnecting clients
+HISTORY_SIZE = 500
+
+
+class BroadcastHub:
+    """Thread-safe sequence of events that clients wait on"""
+
+    def __init__(self, history=HISTORY_SIZE):
+        self.boot_id = uuid.uuid4().hex[:8]
+        self._cond = threading.Condition()
+        self._events = deque(maxlen=history)
+        self._seq = 0
+
+    @property
+    def last_id(self):
+        with self._cond:
+            return f"{self.boot_id}:{self._seq}"
+
+    def publish(self, event_type, payload):
+        """Append an event and wake every waiting client; returns its id"""
+        with self._cond:
+            self._seq += 1
+            self._events.append((self._seq, event_type, payload))
+            self._cond.notify_all()
+            return f"{self.boot_id}:{self._seq}"
+
+    def _parse(self, last_event_id):
+        """Sequence number for a client-supplied id, or None if it needs a resync"""
+        if not last_event_id:
+            return self._seq
+        boot_id, _, seq = str(last_event_id).partition(':')
+        if boot_id != self.boot_id or not seq.isdigit():
+            return None
+        seq = int(seq)
+        oldest = self._events[0][0] if self._events else self._seq + 1
+        if seq > self._seq or seq < oldest - 1:
+            return None
+        return seq
+
+    def wait_for(self, last_event_id, timeout):
+        """Events after ``last_event_id`` as ``[(id, type, payload)]``, blocking up to ``timeout``.
+
+        Returns a single 'resync' event when the id cannot be continued.
+        """
+        with self._cond:
+            after = self._parse(last_event_id)
+            if after is None:
+                return [(f"{self.boot_id}:{self._seq}", 'resync', {})]
+            self._cond.wait_for(lambda: self._seq > after, timeout=timeout)
+            return [
+                (f"{self.boot_id}:{seq}", event_type, payload)
+                for seq, event_type, payload in self._events
+                if seq > after
+            ]
+
+
+# process-wide hub shared by the save path and the stream views
+notification_hub = BroadcastHub()
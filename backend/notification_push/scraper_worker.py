@@ -0,0 +1,232 @@
+"""
+Scraper Worker Client
+Talks to the long-lived node scraper worker (frontend/src/scraper/scraper_worker.js)
+
+The worker keeps one CDP connection to Chrome open and runs scrape jobs one at a time.
+Django sends JSON lines over a local TCP socket and gets a job id back immediately;
+progress/results come back on the same socket and are kept in memory. Views do not
+call this directly: task_queue handlers (notification_push/tasks.py,
+upwork_messages/tasks.py) use run() so request threads never wait on a scrape.
+"""
+import json
+import logging
+import os
+import socket
+import subprocess
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# finished jobs kept in memory for status lookups
+MAX_FINISHED_JOBS = 200
+
+
+class ScraperWorkerError(Exception):
+    """Worker could not be started or reached"""
+
+
+def scraper_dir():
+    """frontend/src/scraper next to the backend directory"""
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    return os.path.join(project_root, 'frontend', 'src', 'scraper')
+
+
+class ScraperWorkerClient:
+    """Submits scrape jobs to the node worker and tracks their status"""
+
+    def __init__(self, host='127.0.0.1', port=None):
+        self.host = host
+        self.port = port or getattr(settings, 'SCRAPER_WORKER_PORT', 9333)
+        self.start_timeout = getattr(settings, 'SCRAPER_WORKER_START_TIMEOUT', 15)
+        self._sock = None
+        self._process = None
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()
+
+    # ---- connection ----
+
+    def _try_connect(self):
+        try:
+            return socket.create_connection((self.host, self.port), timeout=1)
+        except OSError:
+            return None
+
+    def _spawn(self):
+        script = os.path.join(scraper_dir(), 'scraper_worker.js')
+        if not os.path.exists(script):
+            raise ScraperWorkerError(f'Scraper worker not found: {script}')
+        logger.info(f"🛸 Starting scraper worker on port {self.port}")
+        env = dict(os.environ, SCRAPER_WORKER_PORT=str(self.port))
+        try:
+            self._process = subprocess.Popen(
+                ['node', script],
+                cwd=scraper_dir(),
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=None,  # worker errors show up in the Django console
+            )
+        except OSError as e:
+            raise ScraperWorkerError(f'Failed to start scraper worker: {e}')
+
+    def _ensure_connected(self):
+        """Connect to a running worker, starting one if needed (caller holds the lock)"""
+        if self._sock is not None:
+            return self._sock
+        sock = self._try_connect()
+        if sock is None:
+            if self._process is None or self._process.poll() is not None:
+                self._spawn()
+            deadline = time.monotonic() + self.start_timeout
+            while sock is None and time.monotonic() < deadline:
+                if self._process.poll() is not None:
+                    raise ScraperWorkerError(f'Scraper worker exited with code {self._process.returncode}')
+                time.sleep(0.2)
+                sock = self._try_connect()
+            if sock is None:
+                raise ScraperWorkerError(f'Scraper worker did not start within {self.start_timeout}s')
+        sock.settimeout(None)
+        self._sock = sock
+        threading.Thread(target=self._read_loop, args=(sock,), name='scraper-worker-reader', daemon=True).start()
+        return sock
+
+    def _read_loop(self, sock):
+        reader = sock.makefile('r', encoding='utf-8', errors='replace')
+        try:
+            for line in reader:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self._handle_event(json.loads(line))
+                except ValueError:
+                    logger.warning(f"⚠️ Malformed scraper worker line: {line[:200]}")
+        except OSError as e:
+            logger.warning(f"⚠️ Scraper worker connection error: {e}")
+        finally:
+            self._connection_lost(sock)
+
+    def _connection_lost(self, sock):
+        with self._lock:
+            if self._sock is sock:
+                self._sock = None
+            lost = [job_id for job_id, job in self._jobs.items() if job['status'] in ('queued', 'running')]
+        for job_id in lost:
+            self._finish(job_id, error='Scraper worker connection lost')
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+    # ---- jobs ----
+
+    def submit(self, task, params=None):
+        """Queue a job on the worker and return its id without waiting"""
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = {
+                'id': job_id,
+                'task': task,
+                'params': params or {},
+                'status': 'queued',
+                'submitted_at': timezone.now().isoformat(),
+                'started_at': None,
+                'finished_at': None,
+                'result': None,
+                'error': None,
+            }
+            self._trim()
+            try:
+                sock = self._ensure_connected()
+                sock.sendall((json.dumps({'id': job_id, 'task': task, 'params': params or {}}) + '\n').encode('utf-8'))
+            except (OSError, ScraperWorkerError) as e:
+                self._jobs.pop(job_id, None)
+                if self._sock is not None:
+                    self._sock.close()
+                    self._sock = None
+                raise ScraperWorkerError(str(e))
+        logger.info(f"📬 Submitted scraper job {job_id} ({task})")
+        return job_id
+
+    def _handle_event(self, event):
+        job_id = event.get('id')
+        kind = event.get('event')
+        if kind == 'started':
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job:
+                    job['status'] = 'running'
+                    job['started_at'] = timezone.now().isoformat()
+        elif kind == 'done':
+            self._finish(job_id, result=event.get('result'))
+        elif kind == 'error':
+            self._finish(job_id, error=event.get('error') or 'Unknown scraper error')
+
+    def _finish(self, job_id, result=None, error=None):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job['status'] = 'failed' if error else 'completed'
+            job['result'] = result
+            job['error'] = error
+            job['finished_at'] = timezone.now().isoformat()
+        if error:
+            logger.error(f"❌ Scraper job {job_id} failed: {error}")
+        else:
+            logger.info(f"✅ Scraper job {job_id} completed")
+
+    def _trim(self):
+        finished = [k for k, j in self._jobs.items() if j['status'] in ('completed', 'failed')]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id):
+        """Snapshot of a job's status or None if unknown"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def wait(self, job_id, timeout=None):
+        """Block until the job finishes or timeout passes; returns the job snapshot"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job['status'] in ('completed', 'failed'):
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            time.sleep(0.1)
+
+    def run(self, task, params=None, timeout=None, on_status=None):
+        """Submit a job and block until it finishes; returns the worker result.
+
+        on_status(status) is called when the job moves to 'running'.
+        Raises ScraperWorkerError when the job fails or times out.
+        """
+        timeout = timeout or getattr(settings, 'SCRAPING_TIMEOUT', 300)
+        job_id = self.submit(task, params)
+        deadline = time.monotonic() + timeout
+        reported = 'queued'
+        while True:
+            job = self.wait(job_id, timeout=1)
+            if job is None:
+                raise ScraperWorkerError(f'Scraper job {job_id} disappeared')
+            if job['status'] != reported and on_status is not None:
+                reported = job['status']
+                on_status(reported)
+            if job['status'] == 'completed':
+                return job['result']
+            if job['status'] == 'failed':
+                raise ScraperWorkerError(job['error'])
+            if time.monotonic() >= deadline:
+                raise ScraperWorkerError(f'Scraper job timed out after {timeout}s')
+
+
+# shared client used by the notification_push and upwork_messages task handlers
+scraper_worker = ScraperWorkerClient()
@@ -0,0 +1,42 @@
+"""
+Notification Push Tasks
+task_queue handlers for job scrapes (run in the persistent scraper worker)
+"""
+import logging
+
+from task_queue.executor import task_handler
+
+from .models import ScrapingSession
+from .scraper_worker import scraper_worker
+
+logger = logging.getLogger(__name__)
+
+SCRAPE_TASK_KINDS = ('scrape_jobs',)
+
+
+@task_handler('scrape_jobs')
+def scrape_jobs(params, ctx):
+    """Scrape jobs in the given mode; the worker saves them via save_jobs_to_database_api"""
+    mode = params.get('mode', 'logged-in')
+    description = params.get('description', f'{mode} scrape')
+    ctx.update(5, 'Waiting for scraper worker')
+    result = scraper_worker.run(
+        'jobs', {'mode': mode},
+        on_status=lambda s: ctx.update(20, 'Scraping current page') if s == 'running' else None,
+    ) or {}
+
+    # the save API reports its own session id, so no time-window lookup is needed
+    session_id = result.get('session_id')
+    session = ScrapingSession.objects.filter(session_id=session_id).first() if session_id else None
+    jobs_extracted = result.get('jobs_found', 0)
+    saved_count = session.new_jobs_saved if session else result.get('saved_count', 0)
+    logger.info(f"✅ {description} completed - {jobs_extracted} found, {saved_count} saved")
+    return {
+        'success': True,
+        'message': f'{description} completed - extracted {jobs_extracted} items, saved {saved_count} new jobs to database',
+        'jobs_found': jobs_extracted,
+        'saved_to_db': saved_count,
+        'mode': mode,
+        'session_id': session_id,
+        'page_info': {'scraper_mode': mode, 'session_found': session is not None},
+    }
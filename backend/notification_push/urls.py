@@ -12,6 +12,8 @@ urlpatterns = [
     path('stop/', views.stop_monitoring, name='stop_monitoring'),
     path('refresh/', views.refresh_chrome_status, name='refresh_chrome_status'),
     path('notifications/', views.get_notifications, name='get_notifications'),
+    path('notifications/stream/', views.notification_stream, name='notification_stream'),  # SSE live notifications
+    path('notifications/poll/', views.poll_notifications, name='poll_notifications'),  # Long-poll fallback
     path('jobs/', views.get_jobs, name='get_jobs'),  # Latest session jobs for Captured Jobs
     path('jobs/all/', views.get_all_jobs, name='get_all_jobs'),  # All jobs with pagination for ProjectList
     path('jobs/batch/', views.batch_jobs, name='batch_jobs'),  # Batch job submission
@@ -16,12 +16,21 @@ import requests
 import time
 from datetime import datetime, timedelta
 from django.utils import timezone
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from projects.models import Project  # Import Project model for scraped jobs integration
 from .models import Job, ScrapingSession, Notification, ChromeSession  # Import new database models
+from .tasks import SCRAPE_TASK_KINDS
+from .broadcast import notification_hub
+from task_queue.executor import task_executor
+from backend.listing import ListingError, cached_count, invalidate_counts, keyset_page
 
 # Logger setup
 logger = logging.getLogger(__name__)
 
+# rows per INSERT when bulk saving scraped jobs/notifications
+BULK_BATCH_SIZE = 500
+
 # variable to hold important values that  browser monitoring needs to track
 monitoring_state = {
     'is_running': False,
@@ -178,54 +187,94 @@ def stop_monitoring(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 # ========== 🔄️🖥️ reset monitoring state ==========
 
+# ========== 🧾 serializers shared by list views and the notification stream ==========
+# columns the serializers read; list querysets load only these (no description-sized html_snippet)
+NOTIFICATION_LIST_FIELDS = (
+    'notification_id', 'title', 'message', 'type', 'source', 'is_read', 'is_dismissed',
+    'created_at', 'data', 'job__job_id', 'session__session_id',
+)
+JOB_LIST_FIELDS = (
+    'job_id', 'title', 'description', 'client_name', 'budget', 'hourly_rate', 'posted_date',
+    'job_url', 'location', 'job_type', 'is_applied', 'is_favorite', 'scraped_at',
+)
+
+
+def _notification_list_queryset():
+    return Notification.objects.select_related('job', 'session').only(*NOTIFICATION_LIST_FIELDS)
+
+
+def _job_list_queryset():
+    return Job.objects.only(*JOB_LIST_FIELDS)
+
+
+def _notification_to_dict(notif):
+    return {
+        'id': notif.notification_id,
+        'title': notif.title,
+        'message': notif.message,
+        'type': notif.type,
+        'source': notif.source,
+        'is_read': notif.is_read,
+        'is_dismissed': notif.is_dismissed,
+        'created_at': notif.created_at.isoformat() if notif.created_at else None,
+        'job_id': notif.job.job_id if notif.job_id else None,
+        'session_id': notif.session.session_id if notif.session_id else None,
+        'data': notif.data,
+    }
+
+
+def _job_to_dict(job):
+    return {
+        'id': job.job_id,
+        'title': job.title,
+        'description': job.description,
+        'client_name': job.client_name,
+        'budget': job.budget,
+        'hourly_rate': job.hourly_rate,
+        'posted_date': job.posted_date.isoformat() if job.posted_date else None,
+        'job_url': job.job_url,
+        'location': job.location,
+        'job_type': job.job_type,
+        'is_applied': job.is_applied,
+        'is_favorite': job.is_favorite,
+        'scraped_at': job.scraped_at.isoformat(),
+    }
+
 #========== 🗒️🖥️ notifications display  ==========
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_notifications(request):
-    
+    """
+    Notifications newest first; ?cursor= (next_cursor of the previous page) or ?offset=, ?limit=, ?unread_only=true
+    """
     try:
-        # set variables for GET rendering
-        # limit rendering to 50
-        limit = int(request.GET.get('limit', 50))
-        # starting point of jobs rendered
-        offset = int(request.GET.get('offset', 0))
         # show only unread
         unread_only = request.GET.get('unread_only', '').lower() == 'true'
         
-        # Get notifications from database models.Notification
-        notifications_query = Notification.objects.all()
+        # Get notifications from database models.Notification (job/session joined in the same query)
+        notifications_query = _notification_list_queryset()
         if unread_only:
             notifications_query = notifications_query.filter(is_read=False)
-        # Limit the number of notifications returned and starting point
-        notifications = notifications_query[offset:offset+limit]
-        # count total notifications for
-        total_count = notifications_query.count()
+        # one page, limit 50 by default
+        notifications, next_cursor, limit, offset = keyset_page(notifications_query, request, 'created_at')
 
         # cleaned notifications in array for rendering
-        notifications_data = []
-        for notif in notifications:
-            notifications_data.append({
-                'id': notif.notification_id,
-                'title': notif.title,
-                'message': notif.message,
-                'type': notif.type,
-                'source': notif.source,
-                'is_read': notif.is_read,
-                'is_dismissed': notif.is_dismissed,
-                'created_at': notif.created_at.isoformat(),
-                'job_id': notif.job.job_id if notif.job else None,
-                'session_id': notif.session.session_id if notif.session else None,
-                'data': notif.data,
-            })
+        notifications_data = [_notification_to_dict(notif) for notif in notifications]
         # render response
         return Response({
             'success': True,
             'notifications': notifications_data,
-            'total_count': total_count,
-            'unread_count': Notification.objects.filter(is_read=False).count(),
+            'total_count': cached_count(notifications_query),
+            'unread_count': cached_count(Notification.objects.filter(is_read=False)),
             'limit': limit,
-            'offset': offset
+            'offset': offset,
+            'next_cursor': next_cursor
         })
+    except ListingError as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
     # or error
     except Exception as e:
         logger.error(f"Error getting notifications: {e}")
@@ -235,6 +284,55 @@ def get_notifications(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 # ================== 🗒️🖥️ notifications display ======================
 
+#========== 📡 live notification stream (SSE + long-poll) ==========
+# seconds a stream/poll waits on the hub before a keep-alive / empty reply
+STREAM_WAIT_SECONDS = 15
+MAX_POLL_SECONDS = 30
+
+
+def _sse_events(last_event_id):
+    if not last_event_id:
+        # first connect: tell the client where it is; after that only deltas are sent
+        last_event_id = notification_hub.last_id
+        yield f"id: {last_event_id}\nevent: hello\ndata: {{}}\n\n"
+    while True:
+        events = notification_hub.wait_for(last_event_id, timeout=STREAM_WAIT_SECONDS)
+        if not events:
+            yield ": keep-alive\n\n"
+            continue
+        for event_id, event_type, payload in events:
+            last_event_id = event_id
+            yield f"id: {event_id}\nevent: {event_type}\ndata: {json.dumps(payload)}\n\n"
+
+
+def notification_stream(request):
+    """Server-Sent Events stream of new notifications/jobs (EventSource reconnects with Last-Event-ID)"""
+    last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    response = StreamingHttpResponse(_sse_events(last_event_id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def poll_notifications(request):
+    """Long-poll fallback: events after ?after=<event id>, waiting up to ?timeout= seconds"""
+    try:
+        timeout = min(float(request.GET.get('timeout', 25)), MAX_POLL_SECONDS)
+    except ValueError:
+        return Response({'success': False, 'error': 'timeout must be a number'}, status=status.HTTP_400_BAD_REQUEST)
+    after = request.GET.get('after')
+    if not after:
+        return Response({'success': True, 'last_event_id': notification_hub.last_id, 'events': []})
+    events = notification_hub.wait_for(after, timeout=timeout)
+    return Response({
+        'success': True,
+        'last_event_id': events[-1][0] if events else after,
+        'events': [{'id': event_id, 'type': event_type, 'data': payload} for event_id, event_type, payload in events]
+    })
+#========== 📡 live notification stream (SSE + long-poll) ==========
+
 #========================= 🗒️🖥️ jobs display =========================
 @api_view(['GET'])
 @permission_classes([AllowAny])
@@ -256,31 +354,15 @@ def get_jobs(request):
         
         # Get all jobs from the latest session based on time window
         # Jobs scraped between session start and completion
-        session_jobs = Job.objects.filter(
+        session_jobs = list(_job_list_queryset().filter(
             scraped_at__gte=latest_session.started_at,
             scraped_at__lte=latest_session.completed_at or timezone.now()
-        ).order_by('-scraped_at')
+        ).order_by('-scraped_at'))
         
-        total_count = session_jobs.count()
+        total_count = len(session_jobs)
 
         # cleaned jobs data for rendering
-        jobs_data = []
-        for job in session_jobs:
-            jobs_data.append({
-                'id': job.job_id,
-                'title': job.title,
-                'description': job.description,
-                'client_name': job.client_name,
-                'budget': job.budget,
-                'hourly_rate': job.hourly_rate,
-                'posted_date': job.posted_date.isoformat() if job.posted_date else None,
-                'job_url': job.job_url,
-                'location': job.location,
-                'job_type': job.job_type,
-                'is_applied': job.is_applied,
-                'is_favorite': job.is_favorite,
-                'scraped_at': job.scraped_at.isoformat(),
-            })
+        jobs_data = [_job_to_dict(job) for job in session_jobs]
         # render response
         return Response({
             'success': True,
@@ -309,34 +391,14 @@ def get_all_jobs(request):
     Get all jobs from database with pagination for ProjectList
     """
     try:
-        # limit rendering to 20 for ProjectList
-        limit = int(request.GET.get('limit', 20))
-        # starting point of jobs rendered
-        offset = int(request.GET.get('offset', 0))
-
-        # Get all jobs from database models.Job
-        jobs = Job.objects.all().order_by('-scraped_at')[offset:offset+limit]
-        # set total_count for 
-        total_count = Job.objects.count()
+        # 20 per page for ProjectList; ?cursor= continues from next_cursor without an OFFSET scan
+        jobs_query = _job_list_queryset()
+        jobs, next_cursor, limit, offset = keyset_page(jobs_query, request, 'scraped_at', default_limit=20)
+        # set total_count for pagination (cached, invalidated on job saves)
+        total_count = cached_count(jobs_query)
 
         # cleaned jobs data for rendering
-        jobs_data = []
-        for job in jobs:
-            jobs_data.append({
-                'id': job.job_id,
-                'title': job.title,
-                'description': job.description,
-                'client_name': job.client_name,
-                'budget': job.budget,
-                'hourly_rate': job.hourly_rate,
-                'posted_date': job.posted_date.isoformat() if job.posted_date else None,
-                'job_url': job.job_url,
-                'location': job.location,
-                'job_type': job.job_type,
-                'is_applied': job.is_applied,
-                'is_favorite': job.is_favorite,
-                'scraped_at': job.scraped_at.isoformat(),
-            })
+        jobs_data = [_job_to_dict(job) for job in jobs]
         # render response
         return Response({
             'success': True,
@@ -344,9 +406,15 @@ def get_all_jobs(request):
             'total_count': total_count,
             'limit': limit,
             'offset': offset,
-            'has_next': (offset + limit) < total_count,
-            'has_previous': offset > 0
+            'next_cursor': next_cursor,
+            'has_next': next_cursor is not None,
+            'has_previous': offset > 0 or bool(request.GET.get('cursor'))
         })
+    except ListingError as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
     # or error
     except Exception as e:
         logger.error(f"Error getting all jobs: {e}")
@@ -398,50 +466,92 @@ def manual_scrape(request):
 
 # ========== 🛸💼 helper function for saving scraped jobs in db ==========
 # take jobs_data, scrape_mode and session as parameters
+def _parse_posted_date(job, now):
+    """Parse timePosted/time_posted, falling back to now"""
+    time_posted = job.get('timePosted') or job.get('time_posted')
+    if not time_posted:
+        return now
+    try:
+        # Try to parse various date formats
+        from dateutil import parser
+        return parser.parse(time_posted)
+    except Exception:
+        return now
+
+
+def _publish_new_jobs(jobs, notifications, session=None):
+    """Broadcast newly saved jobs/notifications to stream clients"""
+    try:
+        # job/session are cached on the unsaved Notification objects, so no extra queries
+        notification_hub.publish('notifications', {
+            'notifications': [_notification_to_dict(notif) for notif in notifications],
+            'unread_count': cached_count(Notification.objects.filter(is_read=False)),
+        })
+        notification_hub.publish('jobs', {
+            'jobs': [_job_to_dict(job) for job in jobs],
+            'session_id': session.session_id if session else None,
+        })
+    except Exception as e:
+        logger.error(f"❌ Error broadcasting new jobs: {e}")
+
+
 def save_scraped_jobs_to_database(jobs_data, scrape_mode='universal', session=None):
-    """Save scraped jobs to notification_push Job model"""
+    """Save scraped jobs to notification_push Job model
+
+    One job_id__in lookup for existing jobs, then bulk_create for Jobs and their
+    Notifications inside a single transaction. Duplicates (already stored or repeated
+    within the batch) are skipped. Returns the number of new jobs saved.
+    """
     try:
-        saved_count = 0
-        
-        # iterate through jobs_data
-        for job in jobs_data:
-            job_id = job.get('id') or job.get('url', f"job_{timezone.now().timestamp()}")
-            title = job.get('title', 'Untitled Job')
-            
-            # Skip if job with same job_id already exists
-            if not Job.objects.filter(job_id=job_id).exists():
-                
-                # Parse posted date
-                posted_date = timezone.now()
-                time_posted = job.get('timePosted') or job.get('time_posted')
-                if time_posted:
-                    try:
-                        # Try to parse various date formats
-                        from dateutil import parser
-                        posted_date = parser.parse(time_posted)
-                    except:
-                        posted_date = timezone.now()
-                
-                # Create new Job in notification_push model
-                new_job = Job.objects.create(
+        now = timezone.now()
+
+        # 🧱 Build unique jobs keyed by job_id (first occurrence wins)
+        candidates = {}
+        for index, job in enumerate(jobs_data):
+            # jobs without id / url get a fallback unique within the batch (``now`` is shared)
+            job_id = job.get('id') or job.get('url') or f"job_{now.timestamp()}_{index}"
+            candidates.setdefault(job_id, job)
+        if not candidates:
+            return 0
+
+        with transaction.atomic():
+            # Skip jobs with a job_id that already exists (single lookup)
+            existing = set(Job.objects.filter(job_id__in=list(candidates)).values_list('job_id', flat=True))
+
+            new_jobs = [
+                Job(
                     job_id=job_id,
-                    title=title,
+                    title=job.get('title', 'Untitled Job'),
                     description=job.get('description', 'No description available'),
                     client_name=job.get('client', 'Unknown Client'),
                     budget=job.get('budget', ''),
                     hourly_rate=job.get('hourly_rate', ''),
-                    posted_date=posted_date,
+                    posted_date=_parse_posted_date(job, now),
                     job_url=job.get('url', ''),
                     location=job.get('location', ''),
                     job_type=job.get('job_type', scrape_mode),
                     selector_used=job.get('selector_used', ''),
                     html_snippet=job.get('html', '')[:1000] if job.get('html') else ''
                 )
-                
-                # Create notification for new job
-                Notification.objects.create(
-                    notification_id=f"job_{new_job.id}_{timezone.now().timestamp()}",
-                    title=f"New Job Found: {title[:50]}",
+                for job_id, job in candidates.items()
+                if job_id not in existing
+            ]
+            if not new_jobs:
+                logger.info("💾 Saved 0 new jobs to notification_push database (all duplicates)")
+                return 0
+
+            # ignore_conflicts covers jobs inserted concurrently after the lookup
+            Job.objects.bulk_create(new_jobs, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+
+            # ignore_conflicts leaves pks unset - fetch the rows that were actually inserted
+            created = list(Job.objects.filter(job_id__in=[j.job_id for j in new_jobs], scraped_at__gte=now))
+
+            # Create notifications for new jobs
+            stamp = now.timestamp()
+            notifications = [
+                Notification(
+                    notification_id=f"job_{new_job.id}_{stamp}",
+                    title=f"New Job Found: {new_job.title[:50]}",
                     message=f"Found new job from {new_job.client_name}",
                     type='info',
                     source='scraper',
@@ -449,13 +559,19 @@ def save_scraped_jobs_to_database(jobs_data, scrape_mode='universal', session=No
                     session=session,
                     data={'scrape_mode': scrape_mode}
                 )
-                
-                saved_count += 1
-                logger.info(f"💾 Saved job to notification_push DB: {title}")
-                
-        logger.info(f"💾 Saved {saved_count} new jobs to notification_push database")
+                for new_job in created
+            ]
+            Notification.objects.bulk_create(notifications, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+
+            # bulk_create sends no post_save, so drop cached list counts explicitly
+            transaction.on_commit(lambda: invalidate_counts(Job, Notification))
+            # push the delta to connected clients once the rows are committed
+            transaction.on_commit(lambda: _publish_new_jobs(created, notifications, session))
+
+        saved_count = len(created)
+        logger.info(f"💾 Saved {saved_count} new jobs to notification_push database ({len(jobs_data) - saved_count} skipped)")
         return saved_count
-        
+
     except Exception as e:
         logger.error(f"❌ Error saving jobs to notification_push database: {e}")
         return 0
@@ -525,13 +641,8 @@ def _run_scraper(mode, description):
             )
             logger.warning(f"Marked {stale_count} stale running sessions as failed")
         
-        # 2. Check if there's already an active scraping session
-        active_sessions = ScrapingSession.objects.filter(
-            status='running',
-            started_at__gte=timezone.now() - timedelta(minutes=10)  # Last 10 minutes
-        )
-        
-        if active_sessions.exists():
+        # 2. Check if there's already an active scrape task
+        if task_executor.has_active(SCRAPE_TASK_KINDS):
             return Response({
                 'success': False,
                 'message': 'Another scraping session is already running. Please wait for it to complete or try again in a few minutes.'
@@ -557,109 +668,19 @@ def _run_scraper(mode, description):
             monitoring_state['status'] = 'connected'
         
         
-        try:
-            # 2. get path for
-            # root
-            current_dir = os.path.dirname(__file__)
-            # project root
-            project_root = os.path.abspath(os.path.join(current_dir, '..', '..'))
-            # scraper directory in frontend/src/scraper (moved from NotificationPushBrowser)
-            scraper_dir = os.path.join(project_root, 'frontend', 'src', 'scraper')
-            # extractor script in frontend/src/scraper/enhanced_extractor.js
-            extractor_script = os.path.join(scraper_dir, 'enhanced_extractor.js')
-            # if extractor script does not exist, return error
-            if not os.path.exists(extractor_script):
-                return Response({
-                    'success': False,
-                    'message': f'Enhanced extractor not found: {extractor_script}'
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            # log description and enhanced extractor script path from
-            # manual_scrape or universal_scrape
-            logger.info(f"🔍 Running {description} with: {extractor_script}")
-
-            # 3.  in variable cmd_args and run the scraper in subprocess
-            # put
-            # 1. node 
-            # 2. frontend/src/scraper/enhanced_extractor.js
-            # 3. mode (either 'logged-in' or 'universal')
-            cmd_args = ['node', extractor_script, mode]
-            # log everything
-            logger.info(f"🔍 Using enhanced extractor with mode: {extractor_script}")
-            
-            # in subprocess run frontend/src/scraper/enhanced_extractor.js
-            result = subprocess.run(
-                cmd_args, # cmd_args
-                cwd=scraper_dir,  # in cwd=scraper_dir (updated from browser_dir)
-                capture_output=True, # capture output
-                text=True, # text and not bytes
-                encoding='utf-8', # encoding utf-8
-                errors='replace',  # Replace problematic characters instead of crashing
-                timeout=60  # Increased timeout for API-based scraping (scraper + API call)
-            )
-            # if returncode is 0 return standard output message
-            if result.returncode == 0:
-                logger.info(f"✅ {description} completed successfully")
-                logger.info(f"Output: {result.stdout}")
-                
-                # Wait a moment for API call to complete
-                time.sleep(1)
-                
-                # Get recent scraping sessions from last 5 minutes only
-                # 🧱 Build
-                # in variable five_minutes_ago
-                # put timedelta(minutes=5)
-                five_minutes_ago = timezone.now() - timedelta(minutes=5)
-                
-                # in variable recent_sessions
-                # put ScrapingSession.objects.filter(
-                recent_sessions = ScrapingSession.objects.filter(
-                    session_id__startswith='api_session_',
-                    started_at__gte=five_minutes_ago  # Only sessions from last 5 minutes
-                ).order_by('-started_at')[:1]
-                
-                if recent_sessions.exists():
-                    session = recent_sessions.first()
-                    jobs_extracted = session.total_jobs_found
-                    saved_count = session.new_jobs_saved
-                    page_info = {'scraper_mode': mode, 'session_found': True}
-                else:
-                    # No recent session found - scraper might not have called API
-                    jobs_extracted = 0
-                    saved_count = 0
-                    page_info = {'scraper_mode': mode, 'session_found': False}
-                    logger.warning(f"No recent API session found for {mode} scraper - check if scraper is calling save API")
-                
-                # prepare response data
-                response_data = {
-                    'success': True,
-                    'message': f'{description} completed - extracted {jobs_extracted} items, saved {saved_count} new jobs to database',
-                    'jobs_found': jobs_extracted,
-                    'saved_to_db': saved_count,
-                    'mode': mode
-                }
-                
-                if page_info:
-                    response_data['page_info'] = page_info
-                
-                return Response(response_data)
-            else:
-                logger.error(f"{description} failed: {result.stderr}")
-                return Response({
-                    'success': False,
-                    'message': f'Scrape failed: {result.stderr}'
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        # Handle timeout
-        except subprocess.TimeoutExpired:
-            return Response({
-                'success': False,
-                'message': f'{description} timed out - try again'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        except Exception as proc_error:
-            logger.error(f"Error running {description}: {proc_error}")
-            return Response({
-                'success': False,
-                'message': f'Failed to run scraper: {str(proc_error)}'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        # 4. queue the scrape as a background task; it runs in the persistent node
+        # worker (warm process, reused CDP connection) and the task result carries the
+        # session id reported by save_jobs_to_database_api
+        task = task_executor.submit('scrape_jobs', {'mode': mode, 'description': description})
+        logger.info(f"🔍 {description} queued as task {task.task_id}")
+        return Response({
+            'success': True,
+            'message': f'{description} started',
+            'task_id': str(task.task_id),
+            'status': task.status,
+            'status_url': f'/api/tasks/{task.task_id}/',
+            'mode': mode
+        }, status=status.HTTP_202_ACCEPTED)
         # general exception
     except Exception as e:
         logger.error(f"Error triggering {description}: {e}")
@@ -902,6 +923,7 @@ def save_jobs_to_database_api(request):
             'message': f'Successfully saved {saved_count} jobs to database',
             'saved_count': saved_count,
             'total_found': len(jobs),
+            'skipped_count': len(jobs) - saved_count,
             'session_id': session.session_id
         })
         
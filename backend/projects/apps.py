@@ -3,3 +3,9 @@ from django.apps import AppConfig
 class ProjectsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'projects'
+
+    def ready(self):
+        # register signal handlers (skill index maintenance)
+        from . import signals  # noqa: F401
+        # register task_queue handlers
+        from . import tasks  # noqa: F401
@@ -0,0 +1,122 @@
+"""
+Async HTTP clients for the remote cover letter backends (local TGI, DeepSeak, Zephyr)
+
+Used by ``CoverGenerator.generate_async`` / ``generate_many_async``: one event loop drives
+many generations at once, each waiting on a socket instead of holding a worker thread.
+The DeepSeak client shares endpoint discovery and the circuit breakers with the sync
+``DeepSeakClient``, so an endpoint found (or found dead) by either is known to both.
+
+Requires httpx (pip install httpx); without it ``open_http_client`` raises RuntimeError.
+"""
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+from .deepseak_client import CONNECT_TIMEOUT, NEXT_URL, RETRY_SHAPE, DeepSeakClient, endpoint_health
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def open_http_client(max_connections: int = 20):
+    """``httpx.AsyncClient`` for one batch; use as ``async with open_http_client(n) as http``"""
+    if httpx is None:
+        raise RuntimeError('httpx is not installed (pip install httpx)')
+    return httpx.AsyncClient(limits=httpx.Limits(max_connections=max_connections,
+                                                 max_keepalive_connections=max_connections))
+
+
+class AsyncDeepSeakClient(DeepSeakClient):
+    """``DeepSeakClient.generate`` over httpx; ``endpoints`` = 'local' (TGI), 'remote' or 'all'"""
+
+    def __init__(self, endpoints: str = 'all', **kwargs):
+        super().__init__(**kwargs)
+        if endpoints == 'local':
+            base = (self.local_url or '').rstrip('/')
+            self.candidates = [c for c in self.candidates if base and c[0].startswith(base)]
+        elif endpoints == 'remote':
+            base = (self.local_url or '').rstrip('/')
+            self.candidates = [c for c in self.candidates if not base or not c[0].startswith(base)]
+
+    def _headers(self) -> Dict[str, str]:
+        return {'Authorization': f"Bearer {self.api_key}"} if self.api_key else {}
+
+    async def generate_async(self, http, prompt: str, max_tokens: int = 256, temperature: float = 0.7,
+                             extra: Optional[Dict[str, Any]] = None) -> str:
+        """Same endpoint / payload-shape fallback as ``generate``, awaiting each request"""
+        tried = []
+        last_error = None
+        timeout = httpx.Timeout(self.timeout, connect=CONNECT_TIMEOUT)
+        for url, shape in self._ordered_candidates():
+            health = self._health(url)
+            if not health.allow():
+                continue  # another request took the half-open trial
+            for attempt_shape in [shape, 'generic' if shape == 'tgi' else 'tgi']:
+                tried.append(url)
+                started = time.monotonic()
+                try:
+                    resp = await http.post(
+                        url, json=self._payload(attempt_shape, prompt, max_tokens, temperature, extra),
+                        headers=self._headers(), timeout=timeout
+                    )
+                except asyncio.CancelledError:
+                    health.release()  # hedged away / timed out by the caller: no verdict
+                    raise
+                except httpx.HTTPError as e:
+                    health.record_failure()
+                    last_error = e
+                    self.log.write(f"DeepSeak request to {url} failed: {e}")
+                    break  # endpoint unreachable: next url
+                latency = time.monotonic() - started
+
+                verdict, last_error = self._check_response(resp, url, shape, attempt_shape, tried)
+                if verdict == RETRY_SHAPE:
+                    continue
+                if verdict == NEXT_URL:
+                    break
+
+                health.record_success(latency)
+                self._remember(url, attempt_shape)
+                return self._extract_text(resp)
+
+        self._forget(tried)
+        raise RuntimeError(f"DeepSeak request failed: {last_error} (tried: {tried or 'all endpoints circuit-open'})")
+
+
+class AsyncZephyrClient:
+    """Zephyr cover letter API (the service on :8002, settings.ZEPHYR_API_URL)"""
+
+    def __init__(self, api_url: Optional[str] = None, timeout: Optional[float] = None):
+        self.api_url = api_url or getattr(settings, 'ZEPHYR_API_URL', 'http://localhost:8002/api/generate-cover-letter')
+        self.timeout = timeout or getattr(settings, 'COVER_ASYNC_TIMEOUT', 30)
+
+    async def generate_async(self, http, job_title: str, company_name: str, job_description: str, skills: str) -> str:
+        health = endpoint_health(self.api_url)
+        if not health.allow():
+            raise RuntimeError(f"Zephyr API at {self.api_url} is circuit-open")
+        started = time.monotonic()
+        try:
+            resp = await http.post(self.api_url, json={
+                'job_title': job_title,
+                'company_name': company_name,
+                'job_description': job_description,
+                'skills': skills,
+            }, timeout=httpx.Timeout(self.timeout, connect=CONNECT_TIMEOUT))
+            resp.raise_for_status()
+            data = resp.json()
+        except asyncio.CancelledError:
+            health.release()
+            raise
+        except (httpx.HTTPError, ValueError) as e:
+            health.record_failure()
+            raise RuntimeError(f"Zephyr API failed: {e}") from e
+        cover = data.get('cover_letter') if isinstance(data, dict) and data.get('success') else None
+        if not cover:
+            health.record_failure()
+            raise RuntimeError('Zephyr API returned no cover letter')
+        health.record_success(time.monotonic() - started)
+        return cover.strip()
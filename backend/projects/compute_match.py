@@ -1,19 +1,92 @@
 """Match scoring module."""
-from typing import List
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+import numpy as np
+from django.conf import settings
 
 
 class MatchScorer:
-    """Encapsulates match scoring logic. Replace with embeddings later."""
+    """Encapsulates keyword match scoring logic (see EmbeddingMatchScorer for semantic scoring)."""
 
     @staticmethod
     def _tokenize(skills: str) -> List[str]:
         return [s.strip().lower() for s in skills.split(',') if s.strip()]
 
-    def compute(self, project_text: str, skills: str) -> float:
+    def compute(self, project_text: str, skills: str, project_id: Optional[int] = None) -> float:
+        # project_id is accepted for interface parity with EmbeddingMatchScorer
         if not project_text or not skills:
             return 0.0
-        tokens = self._tokenize(skills)
-        text = project_text.lower()
-        hits = sum(text.count(t) for t in tokens)
-        score = min(1.0, hits / max(1, len(tokens)))
-        return float(score)
+        return float(_batch_scorer(skills).score(project_text))
+
+
+class BatchMatchScorer:
+    """Scores many descriptions against one skill list in a single pass each.
+
+    The skill list is compiled once into a single alternation regex (longest skill first)
+    with word-boundary guards, so "go" no longer matches inside "google" and each text is
+    scanned once regardless of how many skills there are. Scores use the MatchScorer
+    formula ``min(1, hits / number_of_skills)``.
+
+    Matches do not overlap: inside "machine learning" only the longer skill is counted
+    when both "machine learning" and "learning" are in the list.
+    """
+
+    def __init__(self, skills: str):
+        self.tokens = MatchScorer._tokenize(skills or '')
+        # duplicate skills count once per occurrence in the list, like the per-token count did
+        self._weights = Counter(' '.join(t.split()) for t in self.tokens)
+        alternatives = sorted(self._weights, key=len, reverse=True)
+        if alternatives:
+            body = '|'.join(r'\s+'.join(re.escape(w) for w in alt.split()) for alt in alternatives)
+            # (?<!\w)/(?!\w) instead of \b so skills like "c++" or ".net" still match
+            self.pattern = re.compile(rf'(?<!\w)(?:{body})(?!\w)', re.IGNORECASE)
+        else:
+            self.pattern = None
+
+    def hits(self, text: str) -> int:
+        """Weighted number of skill occurrences in ``text``."""
+        if not text or self.pattern is None:
+            return 0
+        weights = self._weights
+        return sum(weights.get(' '.join(m.group(0).lower().split()), 1) for m in self.pattern.finditer(text))
+
+    def score(self, text: str) -> float:
+        if not self.tokens:
+            return 0.0
+        return min(1.0, self.hits(text) / len(self.tokens))
+
+    def score_many(self, texts: Iterable[str]) -> np.ndarray:
+        """Score every text; returns a float64 array aligned with ``texts``."""
+        texts = list(texts)
+        if not self.tokens:
+            return np.zeros(len(texts), dtype=np.float64)
+        hits = np.fromiter((self.hits(t) for t in texts), dtype=np.float64, count=len(texts))
+        return np.minimum(1.0, hits / len(self.tokens))
+
+
+@lru_cache(maxsize=256)
+def _batch_scorer(skills: str) -> BatchMatchScorer:
+    """Compiled scorers are reused across calls with the same skill string."""
+    return BatchMatchScorer(skills)
+
+
+MATCH_ENGINES = ('keyword', 'embedding')
+
+_keyword_scorer = MatchScorer()
+
+
+def get_match_scorer(engine: Optional[str] = None):
+    """Return the scorer for ``engine`` ('keyword' or 'embedding').
+
+    Defaults to ``settings.MATCH_SCORE_ENGINE`` (keyword when unset).
+    """
+    engine = engine or getattr(settings, 'MATCH_SCORE_ENGINE', 'keyword')
+    if engine == 'embedding':
+        from .embedding_match import get_embedding_scorer
+        return get_embedding_scorer()
+    if engine != 'keyword':
+        raise ValueError(f"Unknown match engine '{engine}' (expected one of {', '.join(MATCH_ENGINES)})")
+    return _keyword_scorer
@@ -1,6 +1,15 @@
+import asyncio
+import logging
 import os
 import sys
-from typing import Optional
+from typing import List, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_PROVIDER = 'zephyr_template'
+HEDGED = 'hedged'
 
 
 class CoverGenerator:
@@ -68,17 +77,131 @@ P.S. I am committed to delivering exceptional results and building long-term pro
     ):
         """Generate a cover letter using your custom model ONLY.
         
-        Returns None until you integrate your model - NO FALLBACK.
+        ``only_backend='hedged'`` (or settings.COVER_ROUTING = 'hedged') races the ranked
+        backends, see projects/hedged_router.py. Otherwise the template is returned.
         """
+        if self._routing(only_backend) == HEDGED:
+            return asyncio.run(self.generate_async(project_description, skills, job_title, company_name,
+                                                   only_backend=HEDGED, return_provider=return_provider))
         # TODO: Replace with your actual model implementation
         # For now, using simple template to test the flow
         result = self._template(project_description, skills, job_title=job_title, company_name=company_name)
-        provider = 'zephyr_template'
+        provider = TEMPLATE_PROVIDER
+
+        if return_provider:
+            return (result, provider)
+        return result
+
+    @staticmethod
+    def _routing(only_backend: Optional[str]) -> Optional[str]:
+        return only_backend or (HEDGED if getattr(settings, 'COVER_ROUTING', None) == HEDGED else None)
+
+    # ========= ⚡ Async remote backends =========
+
+    @staticmethod
+    def _remote_prompt(project_description: str, skills: str, job_title: Optional[str] = None,
+                       company_name: Optional[str] = None) -> str:
+        title = f" for the {job_title} position" if job_title else ""
+        company = f" at {company_name}" if company_name else ""
+        return (f"Write a concise, professional Upwork cover letter{title}{company}.\n"
+                f"Project description: {project_description}\n"
+                f"My skills: {skills}\n"
+                f"Cover letter:")
+
+    @staticmethod
+    def async_backends(only_backend: Optional[str] = None) -> List[str]:
+        """Configured remote backends in settings.COVER_ASYNC_BACKENDS order (or just ``only_backend``)"""
+        names = [only_backend] if only_backend else getattr(settings, 'COVER_ASYNC_BACKENDS', ['tgi', 'deepseak', 'zephyr'])
+        available = {
+            'tgi': bool(os.environ.get('DEEPSEAK_LOCAL_URL')),
+            'deepseak': bool(os.environ.get('DEEPSEAK_API_URL') or os.environ.get('DEEPSEAK_API_KEY')),
+            'zephyr': True,
+        }
+        return [name for name in names if available.get(name)]
+
+    async def _generate_remote(self, http, backend: str, project_description: str, skills: str,
+                               job_title: Optional[str], company_name: Optional[str]) -> str:
+        from .async_cover_client import AsyncDeepSeakClient, AsyncZephyrClient
+
+        if backend == 'zephyr':
+            return await AsyncZephyrClient().generate_async(
+                http, job_title or '', company_name or '', project_description or '', skills
+            )
+        client = AsyncDeepSeakClient(endpoints='local' if backend == 'tgi' else 'remote',
+                                     timeout=getattr(settings, 'COVER_ASYNC_TIMEOUT', 30))
+        prompt = self._remote_prompt(project_description, skills, job_title, company_name)
+        return await client.generate_async(http, prompt, max_tokens=512, temperature=0.7)
+
+    async def generate_async(
+        self,
+        project_description: str,
+        skills: str,
+        job_title: Optional[str] = None,
+        company_name: Optional[str] = None,
+        only_backend: Optional[str] = None,
+        return_provider: bool = False,
+        http=None,
+    ):
+        """Try the remote backends in order without blocking the event loop; template if all fail.
 
+        ``http`` is a shared ``httpx.AsyncClient`` (see ``generate_many_async``); without one a
+        client is opened for this call. Without httpx installed the template is returned.
+        ``only_backend='hedged'`` races the ranked backends instead (projects/hedged_router.py).
+        """
+        from .async_cover_client import httpx, open_http_client
+
+        result, provider = None, TEMPLATE_PROVIDER
+        only_backend = self._routing(only_backend)
+        backends = self.async_backends(only_backend)
+        if http is None and httpx is not None and (backends or only_backend == HEDGED):
+            async with open_http_client() as own_http:
+                return await self.generate_async(project_description, skills, job_title, company_name,
+                                                 only_backend, return_provider, http=own_http)
+
+        if only_backend == HEDGED:
+            from .hedged_router import HedgedCoverRouter
+
+            job = {'project_description': project_description, 'skills': skills,
+                   'job_title': job_title, 'company_name': company_name}
+            result, provider = await HedgedCoverRouter(self).generate(job, http)
+            provider = TEMPLATE_PROVIDER if provider in (None, 'template') else provider
+        elif backends and httpx is not None:
+            for backend in backends:
+                try:
+                    result = await self._generate_remote(http, backend, project_description, skills,
+                                                         job_title, company_name)
+                except RuntimeError as e:
+                    logger.warning(f"⚠️ Cover backend '{backend}' failed: {e}")
+                    continue
+                if result:
+                    provider = backend
+                    break
+        elif backends:
+            logger.warning("⚠️ httpx is not installed; async cover letters use the template")
+
+        if not result:
+            result = self._template(project_description, skills, job_title=job_title, company_name=company_name)
         if return_provider:
             return (result, provider)
         return result
 
-    async def generate_async(self, project_description: str, skills: str, job_title: Optional[str] = None) -> str:
-        """Async version that just calls the sync version since no AI is involved"""
-        return self.generate(project_description, skills, job_title)
+    async def generate_many_async(self, jobs: List[dict], concurrency: Optional[int] = None,
+                                  only_backend: Optional[str] = None) -> List[tuple]:
+        """(text, provider) per job dict (generate_async kwargs), at most ``concurrency`` in flight.
+
+        All requests share one pooled HTTP client, so a batch reuses connections per backend.
+        """
+        from .async_cover_client import httpx, open_http_client
+
+        concurrency = max(1, concurrency or getattr(settings, 'COVER_ASYNC_CONCURRENCY', 8))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(job, http):
+            async with semaphore:
+                return await self.generate_async(only_backend=only_backend, return_provider=True, http=http, **job)
+
+        only_backend = self._routing(only_backend)
+        if httpx is None or (only_backend != HEDGED and not self.async_backends(only_backend)):
+            return list(await asyncio.gather(*(one(job, None) for job in jobs)))
+        async with open_http_client(concurrency) as http:
+            return list(await asyncio.gather(*(one(job, http) for job in jobs)))
@@ -1,31 +1,254 @@
+"""Client for a local cover letter model script.
+
+The script is started once as a long-lived worker (``script --serve``) that keeps the model
+loaded and exchanges JSON lines over stdin/stdout:
+
+    <- {"ready": true}                                     (once the model is loaded)
+    -> {"id": 1, "prompt": "...", "max_new_tokens": 512, "temperature": 0.7, "top_p": 0.9, "top_k": 50}
+    <- {"id": 1, "text": "..."}  or  {"id": 1, "error": "..."}
+
+Requests are pipelined: several can be written before the first reply arrives, and replies
+are matched by ``id`` (they may come back in any order). A worker that dies is restarted on
+the next request. Scripts without ``--serve`` support (exit before sending ``ready``) are run
+once per letter as before, parsing the ``--- Generated cover letter ---`` stdout markers.
+"""
+import atexit
+import itertools
+import json
+import logging
 import os
-import sys
 import subprocess
-from typing import Optional
+import sys
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# seconds a starting worker may take to load its model before it counts as failed
+WORKER_START_TIMEOUT = 300
+# seconds before a crashed worker is started again
+WORKER_RESTART_DELAY = 5
+
+GENERATION_ARGS = {'max_new_tokens': 512, 'temperature': 0.7, 'top_p': 0.9, 'top_k': 50}
+
+
+class WorkerUnsupported(RuntimeError):
+    """The script exited without entering worker mode"""
+
+
+class LocalWorker:
+    """One long-lived ``script --serve`` process with pipelined JSON-line requests"""
+
+    def __init__(self, python_executable: str, script_path: str):
+        self.cmd = [python_executable, script_path, '--serve']
+        self._proc = None
+        self._pending: Dict[int, Future] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._ready = threading.Event()
+        self._died_at = 0.0
+        self._was_ready = False
+        self.unsupported = False
+        self.restarts = 0
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _start(self):
+        """Start the process if needed (caller holds self._lock)"""
+        if self.alive:
+            return
+        wait = WORKER_RESTART_DELAY - (time.monotonic() - self._died_at)
+        if self._died_at and wait > 0:
+            raise RuntimeError(f"Local model worker crashed; restarting in {wait:.0f}s")
+        if self._died_at:
+            self.restarts += 1
+        logger.info(f"🚀 Starting local model worker: {' '.join(self.cmd)}")
+        self._ready.clear()
+        self._proc = subprocess.Popen(
+            self.cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=None,
+            text=True, encoding='utf-8', bufsize=1,
+        )
+        threading.Thread(target=self._read_replies, args=(self._proc,), name='local-model-worker', daemon=True).start()
+
+    def _read_replies(self, proc):
+        for line in proc.stdout:
+            try:
+                reply = json.loads(line)
+            except ValueError:
+                continue  # model / library chatter on stdout
+            if not isinstance(reply, dict):
+                continue  # chatter that happens to be valid JSON (a progress number, a list)
+            if reply.get('ready'):
+                self._was_ready = True
+                self._ready.set()
+                continue
+            future = self._pending.pop(reply.get('id'), None)
+            if future is None:
+                continue
+            if 'error' in reply:
+                future.set_exception(RuntimeError(f"Local model worker: {reply['error']}"))
+            else:
+                future.set_result(reply.get('text') or '')
+
+        # stdout closed: the worker exited
+        code = proc.wait()
+        pending = {}
+        with self._lock:
+            crashed = proc is self._proc  # not stop()ped
+            if crashed:
+                self._died_at = time.monotonic()
+                # never ready at all: the script does not know --serve
+                self.unsupported = not self._was_ready
+                # a stopped worker's requests may already belong to its replacement
+                pending, self._pending = self._pending, {}
+        if self.unsupported:
+            error = WorkerUnsupported(f"{self.cmd[1]} exited with {code} before entering worker mode")
+            logger.info(f"ℹ️ {self.cmd[1]} has no --serve mode; running it once per letter")
+        else:
+            error = RuntimeError(f"Local model worker exited with code {code}")
+            if crashed:
+                logger.error(f"❌ Local model worker exited with code {code}; {len(pending)} requests failed")
+        if crashed:
+            self._ready.set()  # wake callers waiting for startup
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def submit(self, prompt: str, **params) -> Future:
+        """Queue one request (returns immediately; several may be in flight at once)"""
+        with self._lock:
+            if self.unsupported:
+                raise WorkerUnsupported(f"{self.cmd[1]} does not support --serve")
+            self._start()
+            proc = self._proc
+            request_id = next(self._ids)
+            future = self._pending[request_id] = Future()
+            future.request_id = request_id
+        try:
+            with self._write_lock:
+                proc.stdin.write(json.dumps({'id': request_id, 'prompt': prompt, **params}) + '\n')
+                proc.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as e:
+            self._pending.pop(request_id, None)
+            if not future.done():
+                future.set_exception(RuntimeError(f"Local model worker is not accepting requests: {e}"))
+        return future
+
+    def generate(self, prompt: str, timeout: float = 120, **params) -> str:
+        future = self.submit(prompt, **params)
+        # model loading does not count against the generation timeout
+        if not self._ready.wait(WORKER_START_TIMEOUT):
+            self.stop()
+            raise RuntimeError(f"Local model worker did not become ready within {WORKER_START_TIMEOUT}s")
+        try:
+            return future.result(timeout)
+        except FutureTimeout:
+            self._pending.pop(future.request_id, None)
+            raise RuntimeError(f"Local model worker did not answer within {timeout}s")
+
+    def stop(self):
+        with self._lock:
+            proc, self._proc = self._proc, None
+            pending, self._pending = self._pending, {}
+            self._ready.set()  # wake callers still waiting for this worker's startup
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(RuntimeError("Local model worker was stopped"))
+        if proc is None or proc.poll() is not None:
+            return
+        try:
+            proc.stdin.close()  # EOF: the worker should exit after pending replies
+            proc.wait(5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
+
+def serve(generate, stdin=None, stdout=None):
+    """Worker side of the protocol, for model scripts: ``if args.serve: serve(my_generate)``.
+
+    ``generate(prompt, **params)`` returns the letter text; call this after loading the model.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+
+    def send(message):
+        stdout.write(json.dumps(message) + '\n')
+        stdout.flush()
+
+    send({'ready': True})
+    for line in stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        request_id = request.pop('id', None)
+        try:
+            send({'id': request_id, 'text': generate(request.pop('prompt'), **request)})
+        except Exception as e:
+            send({'id': request_id, 'error': str(e)})
+
+
+# process-wide workers: clients for the same script share one loaded model
+_workers: Dict[Tuple[str, str], LocalWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def get_worker(python_executable: str, script_path: str) -> LocalWorker:
+    with _workers_lock:
+        key = (python_executable, os.path.abspath(script_path))
+        worker = _workers.get(key)
+        if worker is None:
+            worker = _workers[key] = LocalWorker(python_executable, script_path)
+        return worker
+
+
+@atexit.register
+def stop_workers():
+    with _workers_lock:
+        workers = list(_workers.values())
+    for worker in workers:
+        worker.stop()
 
 
 class LocalClient:
-    def __init__(self, script_path: Optional[str] = None, python_executable: Optional[str] = None):
+    def __init__(self, script_path: Optional[str] = None, python_executable: Optional[str] = None,
+                 persistent: bool = True):
         self.script_path = script_path
         self.python_executable = python_executable or sys.executable
+        # False: always start the script per letter (scripts without --serve)
+        self.persistent = persistent
 
-    def generate(self, project_description: str, skills: str, job_title: Optional[str] = None, timeout: int = 120) -> Optional[str]:
+    @staticmethod
+    def build_prompt(project_description: str, skills: str, job_title: Optional[str] = None) -> str:
         jt = (f"Project title: {job_title}. " if job_title else "")
         user_text = f"{jt}Project description: {project_description} Skills: {skills}"
-        prompt = f"<start_of_turn>user {user_text} <end_of_turn>\n<start_of_turn>model"
+        return f"<start_of_turn>user {user_text} <end_of_turn>\n<start_of_turn>model"
 
+    def generate(self, project_description: str, skills: str, job_title: Optional[str] = None, timeout: int = 120) -> Optional[str]:
         if not self.script_path or not os.path.exists(self.script_path):
             return None
+        prompt = self.build_prompt(project_description, skills, job_title)
+
+        if self.persistent:
+            worker = get_worker(self.python_executable, self.script_path)
+            try:
+                return worker.generate(prompt, timeout=timeout, **GENERATION_ARGS).strip() or None
+            except WorkerUnsupported:
+                pass
+            except RuntimeError as e:
+                logger.error(f"❌ {e}")
+                return None
+        return self._generate_once(prompt, timeout)
 
-        cmd = [
-            self.python_executable,
-            self.script_path,
-            '--prompt', prompt,
-            '--max_new_tokens', '512',
-            '--temperature', '0.7',
-            '--top_p', '0.9',
-            '--top_k', '50',
-        ]
+    def _generate_once(self, prompt: str, timeout: int) -> Optional[str]:
+        """Run the script for a single letter and parse its stdout markers"""
+        cmd = [self.python_executable, self.script_path, '--prompt', prompt]
+        for name, value in GENERATION_ARGS.items():
+            cmd += [f'--{name}', str(value)]
         try:
             proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
             if proc.returncode != 0:
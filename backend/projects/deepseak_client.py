@@ -1,6 +1,225 @@
+import atexit
 import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, Any, List, Tuple
+
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+
+
+# seconds to wait for a TCP connect; a dead endpoint should fail fast and fall through to the next one
+CONNECT_TIMEOUT = 3.0
+
+# responses meaning "wrong endpoint guess" (try the next candidate) rather than a failure
+NOT_THIS_ENDPOINT = (404, 405)
+# responses meaning "endpoint exists but rejects this payload shape" (retry with the other shape)
+WRONG_SHAPE = (400, 422)
+
+# _check_response verdicts
+OK, RETRY_SHAPE, NEXT_URL = 'ok', 'retry_shape', 'next_url'
+
+DEFAULT_LOG_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'logs', 'ai_usage.log'))
+
+
+class BufferedLogWriter:
+    """Appends diagnostic lines to a file from a background thread.
+
+    ``write`` never blocks the request path: lines are queued and flushed in batches;
+    when the queue is full the line is dropped (diagnostics are best-effort).
+    """
+
+    def __init__(self, path: str, max_queue: int = 1000, flush_interval: float = 1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def write(self, line: str):
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(f"{time.strftime('%Y-%m-%d %H:%M:%S')} {line}")
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='ai-usage-log', daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _drain(self) -> List[str]:
+        lines = []
+        while True:
+            try:
+                lines.append(self._queue.get_nowait())
+            except queue.Empty:
+                return lines
+
+    def flush(self):
+        lines = self._drain()
+        if not lines:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as fh:
+                fh.write('\n'.join(lines) + '\n')
+        except Exception:
+            pass
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+
+class EndpointHealth:
+    """Latency / error tracking and a circuit breaker for one endpoint URL.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and the endpoint
+    is skipped for ``reset_timeout`` seconds; then one trial request is let through
+    (half-open) and its outcome closes or re-opens the circuit. ``allow()`` hands out that
+    trial, so call it only right before sending; a trial that ends without an outcome is
+    given back with ``release()`` (or expires after another ``reset_timeout``).
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0, window: int = 50):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)  # True = success
+        self.consecutive_failures = 0
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self.trial_at = 0.0
+        self._lock = threading.Lock()
+
+    def _trial_due(self, now: float) -> bool:
+        if self.state == self.OPEN:
+            return now - self.opened_at >= self.reset_timeout
+        # a half-open trial nobody resolved (crashed / cancelled caller) expires
+        return self.state == self.HALF_OPEN and now - self.trial_at >= self.reset_timeout
+
+    def available(self) -> bool:
+        """Whether ``allow()`` would let a request through (does not take the trial)"""
+        with self._lock:
+            return self.state == self.CLOSED or self._trial_due(time.monotonic())
+
+    def allow(self) -> bool:
+        """Permission to send one request now; in half-open state this takes the single trial"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if self._trial_due(now):
+                self.state = self.HALF_OPEN
+                self.trial_at = now
+                return True
+            return False
+
+    def release(self):
+        """Give back a half-open trial that ended without a success / failure verdict"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN  # opened_at is past reset_timeout: next allow() gets the trial
+
+    def record_success(self, latency: float):
+        with self._lock:
+            self.latencies.append(latency)
+            self.outcomes.append(True)
+            self.consecutive_failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self):
+        with self._lock:
+            self.outcomes.append(False)
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Latency at fraction ``p`` (0-1) of the recent successful requests, None without samples"""
+        with self._lock:
+            latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = sorted(self.latencies)
+            outcomes = list(self.outcomes)
+            state = self.state
+
+        def pct(p):
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 3) if latencies else None
+
+        return {
+            'state': state,
+            'requests': len(outcomes),
+            'error_rate': round(outcomes.count(False) / len(outcomes), 3) if outcomes else 0.0,
+            'p50_seconds': pct(0.5),
+            'p95_seconds': pct(0.95),
+            'consecutive_failures': self.consecutive_failures,
+        }
+
+
+# process-wide state shared by all client instances (clients are cheap to construct)
+_state_lock = threading.Lock()
+_discovered: Dict[Tuple[str, ...], Tuple[str, str]] = {}  # candidate list -> (url, payload shape)
+_health: Dict[str, EndpointHealth] = {}
+_sessions: Dict[Optional[str], requests.Session] = {}
+_log_writers: Dict[str, BufferedLogWriter] = {}
+
+
+def reset_client_state():
+    """Forget discovered endpoints, health and pooled sessions (tests / config changes)"""
+    with _state_lock:
+        _discovered.clear()
+        _health.clear()
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def endpoint_health(url: str, failure_threshold: int = 3, reset_timeout: float = 30.0) -> EndpointHealth:
+    """Process-wide circuit breaker / latency stats for ``url`` (shared by the sync and async clients)"""
+    with _state_lock:
+        health = _health.get(url)
+        if health is None:
+            health = _health[url] = EndpointHealth(failure_threshold, reset_timeout)
+        return health
+
+
+def _shared_session(api_key: Optional[str], pool_size: int = 10) -> requests.Session:
+    with _state_lock:
+        session = _sessions.get(api_key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers['Content-Type'] = 'application/json'
+            if api_key:
+                session.headers['Authorization'] = f"Bearer {api_key}"
+            _sessions[api_key] = session
+        return session
+
+
+def _log_writer(path: str) -> BufferedLogWriter:
+    with _state_lock:
+        writer = _log_writers.get(path)
+        if writer is None:
+            writer = _log_writers[path] = BufferedLogWriter(path)
+        return writer
 
 
 class DeepSeakClient:
@@ -12,100 +231,146 @@ class DeepSeakClient:
     It reads configuration from environment variables:
       - DEEPSEAK_API_URL: full URL to the generate endpoint (required)
       - DEEPSEAK_API_KEY: API key/token (optional; if missing, client will attempt unauthenticated calls)
+      - DEEPSEAK_LOCAL_URL: local Text-Generation-Inference server, tried first
+
+    Requests go through a pooled keep-alive ``requests.Session``. The first endpoint /
+    payload shape that answers is remembered and tried first afterwards; every endpoint
+    has an ``EndpointHealth`` circuit breaker, so a dead one is skipped instead of
+    costing a timeout per call. Diagnostics go to logs/ai_usage.log via a background
+    writer. Pass ``session`` / ``log_path`` to run it against a local stub server.
     """
 
-    def __init__(self, api_url: Optional[str] = None, api_key: Optional[str] = None, timeout: int = 30):
+    def __init__(self, api_url: Optional[str] = None, api_key: Optional[str] = None, timeout: int = 30,
+                 local_url: Optional[str] = None, session: Optional[requests.Session] = None,
+                 failure_threshold: int = 3, reset_timeout: float = 30.0, log_path: Optional[str] = None):
         # Prefer a local Text-Generation-Inference (TGI) endpoint if configured.
         # DEEPSEAK_LOCAL_URL can be e.g. http://127.0.0.1:8080
-        self.local_url = os.environ.get('DEEPSEAK_LOCAL_URL')
+        self.local_url = local_url or os.environ.get('DEEPSEAK_LOCAL_URL')
         # Remote API URL (legacy)
         self.api_url = api_url or os.environ.get('DEEPSEAK_API_URL') or "https://api.deepseek.com"
         self.api_key = api_key or os.environ.get('DEEPSEAK_API_KEY')
         self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.session = session or _shared_session(self.api_key)
+        self.log = _log_writer(log_path or DEFAULT_LOG_PATH)
+        self.candidates = self._build_candidates()
 
-    def generate(self, prompt: str, max_tokens: int = 256, temperature: float = 0.7, extra: Optional[Dict[str, Any]] = None) -> str:
-        """Send a generation request and return the result text.
-
-        The exact payload shape is intentionally generic; adjust per DeepSeak API docs.
-        """
-        # Build payloads for different endpoint shapes (TGI vs generic REST)
-        payload_tgi = {
-            "inputs": prompt,
-            "parameters": {
-                "max_new_tokens": max_tokens,
-                "temperature": temperature,
-            }
-        }
-        payload_generic = {
-            "prompt": prompt,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
-        if extra:
-            # Merge extras into both payload shapes if present
-            if isinstance(extra, dict):
-                payload_tgi.update(extra)
-                # for generic payload, merge shallow keys
-                payload_generic.update(extra)
-
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-
-        # Helper to record diagnostics to the ai_usage log (best-effort)
-        def _log_diag(line: str):
-            try:
-                logs_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'logs'))
-                os.makedirs(logs_dir, exist_ok=True)
-                with open(os.path.join(logs_dir, 'ai_usage.log'), 'a', encoding='utf-8') as fh:
-                    fh.write(line + "\n")
-            except Exception:
-                pass
-
-        # Candidate endpoints. Prefer local TGI if configured.
-        tried_urls = []
-        try_urls = []
+    def _build_candidates(self) -> List[Tuple[str, str]]:
+        """Candidate (url, payload shape) pairs, computed once per client"""
+        urls = []
         if self.local_url:
             # TGI REST endpoints
-            try_urls.extend([
-                self.local_url.rstrip('/') + '/generate',
-                self.local_url.rstrip('/') + '/api/predict',
-                self.local_url.rstrip('/') + '/v1/generate',
-            ])
+            base = self.local_url.rstrip('/')
+            urls.extend([base + '/generate', base + '/api/predict', base + '/v1/generate'])
         # Add remote/legacy endpoints
         if self.api_url:
-            try_urls.append(self.api_url)
+            urls.append(self.api_url)
             if '/' == self.api_url.rstrip('/').split('://', 1)[-1] or self.api_url.rstrip('/').count('/') == 1:
-                try_urls.extend([
-                    self.api_url.rstrip('/') + '/generate',
-                    self.api_url.rstrip('/') + '/v1/generate',
-                    self.api_url.rstrip('/') + '/api/generate',
-                ])
-
-        resp = None
-        last_exc = None
-        for u in try_urls:
-            tried_urls.append(u)
-            try:
-                # Choose payload shape heuristically based on endpoint
-                j = payload_tgi if any(p in u for p in ['/predict', '/generate']) else payload_generic
-                resp = requests.post(u, json=j, headers=headers, timeout=self.timeout)
-                # stop trying on any non-5xx response (i.e., 200/4xx)
-                if resp is not None:
-                    break
-            except requests.RequestException as e:
-                last_exc = e
-                resp = None
+                base = self.api_url.rstrip('/')
+                urls.extend([base + '/generate', base + '/v1/generate', base + '/api/generate'])
+        # Choose payload shape heuristically based on endpoint
+        return [(u, 'tgi' if any(p in u for p in ['/predict', '/generate']) else 'generic') for u in urls]
 
-        if resp is None:
-            raise RuntimeError(f"DeepSeak request failed: {last_exc} (tried: {tried_urls})")
+    def _health(self, url: str) -> EndpointHealth:
+        return endpoint_health(url, self.failure_threshold, self.reset_timeout)
 
-        # Log non-200 responses for diagnosis
+    @staticmethod
+    def _payload(shape: str, prompt: str, max_tokens: int, temperature: float, extra: Optional[Dict[str, Any]]):
+        if shape == 'tgi':
+            payload = {"inputs": prompt, "parameters": {"max_new_tokens": max_tokens, "temperature": temperature}}
+        else:
+            payload = {"prompt": prompt, "max_tokens": max_tokens, "temperature": temperature}
+        if isinstance(extra, dict):
+            # Merge extras (shallow) into the payload
+            payload.update(extra)
+        return payload
+
+    def _ordered_candidates(self) -> List[Tuple[str, str]]:
+        """Discovered endpoint first, then the rest; endpoints with an open circuit are skipped.
+
+        Only filters with ``available()``: the caller takes the trial with ``allow()`` when it
+        actually sends to an endpoint.
+        """
+        key = tuple(url for url, _ in self.candidates)
+        with _state_lock:
+            known = _discovered.get(key)
+        ordered = [known] if known else []
+        ordered += [c for c in self.candidates if not known or c[0] != known[0]]
+        return [c for c in ordered if self._health(c[0]).available()]
+
+    def _remember(self, url: str, shape: str):
+        with _state_lock:
+            _discovered[tuple(u for u, _ in self.candidates)] = (url, shape)
+
+    def _forget(self, tried: List[str]):
+        key = tuple(u for u, _ in self.candidates)
+        with _state_lock:
+            if _discovered.get(key) and _discovered[key][0] in tried:
+                del _discovered[key]  # rediscover next time
+
+    def _check_response(self, resp, url: str, shape: str, attempt_shape: str, tried: List[str]):
+        """(verdict, error) for one endpoint answer: OK, RETRY_SHAPE or NEXT_URL; other 4xx raise"""
+        if resp.status_code in NOT_THIS_ENDPOINT:
+            self._health(url).release()
+            return NEXT_URL, f"{resp.status_code} from {url}"
+        if resp.status_code in WRONG_SHAPE and attempt_shape == shape:
+            return RETRY_SHAPE, f"{resp.status_code} from {url} ({attempt_shape} payload)"
+        if resp.status_code >= 500:
+            self._health(url).record_failure()
+            self.log.write(f"DeepSeak error {resp.status_code} on {url}: {resp.text[:500]}")
+            return NEXT_URL, f"{resp.status_code} from {url}"
         if resp.status_code >= 400:
-            diag = f"DeepSeak error {resp.status_code} on {resp.url}: {resp.text} (tried: {tried_urls})"
-            _log_diag(diag)
+            # Log non-200 responses for diagnosis
+            diag = f"DeepSeak error {resp.status_code} on {resp.url}: {resp.text} (tried: {tried})"
+            self.log.write(diag)
+            self._health(url).release()  # the endpoint answered; the request was at fault
             raise RuntimeError(diag)
+        return OK, None
+
+    def generate(self, prompt: str, max_tokens: int = 256, temperature: float = 0.7, extra: Optional[Dict[str, Any]] = None) -> str:
+        """Send a generation request and return the result text.
 
+        The exact payload shape is intentionally generic; adjust per DeepSeak API docs.
+        """
+        tried = []
+        last_error = None
+        for url, shape in self._ordered_candidates():
+            health = self._health(url)
+            if not health.allow():
+                continue  # another request took the half-open trial
+            shapes = [shape, 'generic' if shape == 'tgi' else 'tgi']
+            for attempt_shape in shapes:
+                tried.append(url)
+                started = time.monotonic()
+                try:
+                    resp = self.session.post(
+                        url, json=self._payload(attempt_shape, prompt, max_tokens, temperature, extra),
+                        timeout=(CONNECT_TIMEOUT, self.timeout)
+                    )
+                except requests.RequestException as e:
+                    health.record_failure()
+                    last_error = e
+                    self.log.write(f"DeepSeak request to {url} failed: {e}")
+                    break  # endpoint unreachable: next url
+                latency = time.monotonic() - started
+
+                verdict, last_error = self._check_response(resp, url, shape, attempt_shape, tried)
+                if verdict == RETRY_SHAPE:
+                    continue  # same url, other payload shape
+                if verdict == NEXT_URL:
+                    break
+
+                health.record_success(latency)
+                self._remember(url, attempt_shape)
+                return self._extract_text(resp)
+
+        self._forget(tried)
+        raise RuntimeError(f"DeepSeak request failed: {last_error} (tried: {tried or 'all endpoints circuit-open'})")
+
+    @staticmethod
+    def _extract_text(resp) -> str:
+        """Text from a ``requests`` or ``httpx`` response (same .json() / .text interface)"""
         try:
             data = resp.json()
         except ValueError:
@@ -113,6 +378,8 @@ class DeepSeakClient:
             raise RuntimeError("DeepSeak returned non-JSON response")
 
         # Common shapes: {"generated_text": "..."} or {"choices": [{"text": "..."}]}
+        if isinstance(data, list) and data and isinstance(data[0], dict):
+            data = data[0]  # TGI /generate may wrap the result in a list
         if isinstance(data, dict):
             if "generated_text" in data and isinstance(data["generated_text"], str):
                 return data["generated_text"].strip()
@@ -125,3 +392,14 @@ class DeepSeakClient:
                     return first["text"].strip()
         # Fallback: try raw text
         return resp.text.strip()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Discovered endpoint and per-endpoint health (latency percentiles, error rate, circuit state)"""
+        key = tuple(url for url, _ in self.candidates)
+        with _state_lock:
+            known = _discovered.get(key)
+        return {
+            'discovered': {'url': known[0], 'shape': known[1]} if known else None,
+            'endpoints': {url: self._health(url).stats() for url, _ in self.candidates},
+            'log_dropped': self.log.dropped,
+        }
@@ -0,0 +1,248 @@
+"""Embedding-based (semantic) match scoring with an on-disk vector cache.
+
+Vectors live in a memory-mapped float32 matrix (``vectors.f32``) next to an append-only
+JSON-lines index that maps content hashes to rows. A description is only embedded when its content hash is not
+in the cache, so re-ingesting or rescoring unchanged text never re-runs the encoder.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from django.conf import settings
+
+from .sentence_encoder import SentenceEncoder, get_sentence_encoder
+
+try:
+    import fcntl
+except ImportError:  # Windows: locking is per process only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+INITIAL_CAPACITY = 1024
+
+
+def content_hash(text: str) -> str:
+    """Stable hash of whitespace-normalized text."""
+    normalized = ' '.join((text or '').split())
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+class VectorCache:
+    """Memory-mapped matrix of unit vectors keyed by content hash, shared between processes.
+
+    ``index.jsonl`` is append-only: a header line (model name, dim) followed by one line
+    per stored vector (``{"k": hash, "r": row}``).
+    Writers hold an exclusive ``flock`` on ``index.lock`` and read the lines other workers
+    appended before assigning rows, so two processes never write the same matrix row.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, model_name: str = ''):
+        default_dir = Path(settings.BASE_DIR) / 'cache' / 'embeddings'
+        self.cache_dir = Path(cache_dir or getattr(settings, 'EMBEDDING_CACHE_DIR', default_dir))
+        self.model_name = model_name
+        self.vectors_path = self.cache_dir / 'vectors.f32'
+        self.index_path = self.cache_dir / 'index.jsonl'
+        self.lock_path = self.cache_dir / 'index.lock'
+        self._lock = threading.RLock()
+        self._matrix: Optional[np.memmap] = None
+        self.dim = 0
+        self.capacity = 0
+        self.rows: Dict[str, int] = {}
+        self._inode = None
+        self._offset = 0
+        self._foreign = False  # index written for another model (rebuilt on the next add)
+        self._refresh()
+
+    # ---- persistence ----
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock across threads and (where fcntl exists) worker processes"""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_path, 'a') as fh:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _refresh(self):
+        """Apply index lines appended since the last read (by this or another process)"""
+        with self._lock:
+            try:
+                stat = os.stat(self.index_path)
+            except FileNotFoundError:
+                return
+            if stat.st_ino != self._inode:
+                # first read, or the index was rebuilt: start over from its header
+                self._inode, self._offset = stat.st_ino, 0
+                self.rows = {}
+                self._matrix, self.dim, self.capacity, self._foreign = None, 0, 0, False
+            if stat.st_size <= self._offset:
+                return
+            try:
+                with open(self.index_path, 'rb') as fh:
+                    fh.seek(self._offset)
+                    data = fh.read()
+            except OSError as e:
+                logger.warning(f"Ignoring unreadable vector cache index: {e}")
+                return
+            end = data.rfind(b'\n') + 1  # a line still being written is read next time
+            self._offset += end
+            for line in data[:end].splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if self._foreign:
+                    continue
+                if 'model_name' in entry:
+                    if entry['model_name'] != self.model_name:
+                        logger.info('Vector cache built with a different model - starting fresh')
+                        self._foreign = True
+                        continue
+                    self.dim = int(entry.get('dim', 0))
+                elif 'r' in entry:  # vector row; project-link lines from older indexes are ignored
+                    self.rows[entry['k']] = int(entry['r'])
+            self._remap()
+
+    def _remap(self):
+        """(Re)open the matrix when the vectors file grew (possibly in another process)"""
+        if not self.dim or not self.vectors_path.exists():
+            return
+        capacity = self.vectors_path.stat().st_size // (self.dim * 4)
+        if self._matrix is None or capacity != self.capacity:
+            self.capacity = capacity
+            self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode='r+', shape=(capacity, self.dim))
+
+    def _append(self, entries: List[dict]):
+        """Append index lines in one write (caller holds the file lock), then read them back"""
+        with open(self.index_path, 'a', encoding='utf-8') as fh:
+            fh.write(''.join(json.dumps(entry) + '\n' for entry in entries))
+        self._refresh()
+
+    def _reset(self, dim: int):
+        """Start a new cache for this model / dim (caller holds the file lock)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._matrix = None
+        tmp = self.vectors_path.with_suffix('.tmp')
+        with open(tmp, 'wb') as fh:
+            fh.truncate(INITIAL_CAPACITY * dim * 4)
+        os.replace(tmp, self.vectors_path)
+        tmp = self.index_path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            fh.write(json.dumps({'model_name': self.model_name, 'dim': dim}) + '\n')
+        os.replace(tmp, self.index_path)  # new inode: other processes reload from the header
+        self._refresh()
+
+    def _ensure_capacity(self, needed: int):
+        if needed <= self.capacity:
+            return
+        new_capacity = max(needed, self.capacity * 2)
+        self._matrix.flush()
+        self._matrix = None
+        with open(self.vectors_path, 'r+b') as fh:
+            fh.truncate(new_capacity * self.dim * 4)
+        self._remap()
+
+    # ---- access ----
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            row = self.rows.get(key)
+            if row is None or self._matrix is None:
+                return None
+            return np.array(self._matrix[row])
+
+    def get_many(self, keys: Sequence[str]) -> np.ndarray:
+        """Vectors for ``keys`` (all must be present) as an ``(n, dim)`` array."""
+        with self._lock:
+            return np.array(self._matrix[[self.rows[k] for k in keys]])
+
+    def missing(self, keys: Sequence[str]) -> List[str]:
+        with self._lock:
+            self._refresh()  # vectors other workers added meanwhile
+            return [k for k in dict.fromkeys(keys) if k not in self.rows]
+
+    def add_many(self, keys: Sequence[str], vectors: np.ndarray):
+        if not len(keys):
+            return
+        with self._file_lock():
+            self._refresh()
+            if self._foreign or self.dim != vectors.shape[1]:
+                self._reset(vectors.shape[1])
+            new = {}
+            for key, vec in zip(keys, vectors):
+                if key not in self.rows and key not in new:
+                    new[key] = vec
+            if not new:
+                return
+            first_row = len(self.rows)
+            self._ensure_capacity(first_row + len(new))
+            entries = []
+            for row, (key, vec) in enumerate(new.items(), start=first_row):
+                self._matrix[row] = vec
+                entries.append({'k': key, 'r': row})
+            self._matrix.flush()  # vectors hit the file before the index points at them
+            self._append(entries)
+
+
+class EmbeddingMatchScorer:
+    """Semantic match scoring: cosine similarity between description and skill embeddings.
+
+    Scores are clipped to ``[0, 1]`` so they can be stored in ``Project.match_score``
+    alongside keyword scores.
+    """
+
+    def __init__(self, encoder: Optional[SentenceEncoder] = None, cache: Optional[VectorCache] = None):
+        self.encoder = encoder or get_sentence_encoder()
+        self.cache = cache or VectorCache(model_name=self.encoder.model_name)
+
+    def _vectors(self, texts: Sequence[str]) -> np.ndarray:
+        keys = [content_hash(t) for t in texts]
+        missing = self.cache.missing(keys)
+        if missing:
+            by_key = {}
+            for text, key in zip(texts, keys):
+                by_key.setdefault(key, text)
+            self.cache.add_many(missing, self.encoder.encode([by_key[k] for k in missing]))
+        return self.cache.get_many(keys)
+
+    def score_many(self, project_texts: Sequence[str], skills: str) -> np.ndarray:
+        """Batched cosine similarity of every text against ``skills`` (one matmul)."""
+        project_texts = [t or '' for t in project_texts]
+        if not project_texts or not (skills or '').strip():
+            return np.zeros(len(project_texts), dtype=np.float64)
+        skill_vec = self._vectors([skills])[0]
+        matrix = self._vectors(project_texts)
+        return np.clip(matrix @ skill_vec, 0.0, 1.0).astype(np.float64)
+
+    def compute(self, project_text: str, skills: str) -> float:
+        if not project_text or not skills:
+            return 0.0
+        return float(self.score_many([project_text], skills)[0])
+
+
+_embedding_scorer: Optional[EmbeddingMatchScorer] = None
+_embedding_lock = threading.Lock()
+
+
+def get_embedding_scorer() -> EmbeddingMatchScorer:
+    """Process-wide EmbeddingMatchScorer (the encoder loads on first scoring call)."""
+    global _embedding_scorer
+    if _embedding_scorer is None:
+        with _embedding_lock:
+            if _embedding_scorer is None:
+                _embedding_scorer = EmbeddingMatchScorer()
+    return _embedding_scorer
@@ -0,0 +1,141 @@
+"""
+Hedged cover letter routing: the first good letter from a ranked list of backends wins
+
+The same request goes to the backends in COVER_HEDGE_BACKENDS order, but a backend only
+starts when the one launched before it has not answered within its hedge delay (or has
+failed). The hedge delay is that backend's COVER_HEDGE_PERCENTILE latency over its recent
+successes, so a backend that is usually fast gets a short head start and a stalled one
+stops holding up the request. The first result passing ``is_valid_cover`` is returned and
+the others are cancelled (a local T5 generation already on the batcher finishes in the
+background and is dropped).
+
+Backends: 'local' (T5 in ai_cover_letters), 'tgi' / 'deepseak' (DeepSeakClient endpoints),
+'zephyr' (:8002) and 'template'. Latency / circuit state is kept per backend in the shared
+EndpointHealth table (projects/deepseak_client.py).
+"""
+import asyncio
+import logging
+import time
+from typing import Optional, Tuple
+
+from django.conf import settings
+
+from backend.model_preloader import model_preloader
+
+from .deepseak_client import endpoint_health
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKENDS = ['local', 'tgi', 'zephyr', 'template']
+# latency samples needed before the percentile replaces COVER_HEDGE_DEFAULT_DELAY
+MIN_SAMPLES = 5
+
+
+def is_valid_cover(text: Optional[str], min_chars: Optional[int] = None) -> bool:
+    """Long enough to be a letter and not an error message passed through as text"""
+    if not text or not text.strip():
+        return False
+    min_chars = getattr(settings, 'COVER_MIN_CHARS', 150) if min_chars is None else min_chars
+    text = text.strip()
+    return len(text) >= min_chars and not text.lower().startswith(('error', 'ai model is not loaded'))
+
+
+class HedgedCoverRouter:
+    """Runs one cover letter request across the ranked backends of a ``CoverGenerator``"""
+
+    def __init__(self, generator, backends=None):
+        self.generator = generator
+        self.backends = backends
+
+    def ranked_backends(self):
+        """Configured backends that are usable here and not circuit-open"""
+        from .async_cover_client import httpx
+
+        names = self.backends or getattr(settings, 'COVER_HEDGE_BACKENDS', DEFAULT_BACKENDS)
+        usable = []
+        for name in names:
+            if name in ('tgi', 'deepseak', 'zephyr') and (httpx is None or not self.generator.async_backends(name)):
+                continue
+            if self._health(name).available():
+                usable.append(name)
+        return usable
+
+    def _next_backend(self, queue):
+        """Pop the next backend that may run now; takes its half-open circuit trial
+
+        'local' is skipped (not counted as a failure) while the T5 model is not loaded.
+        """
+        while queue:
+            name = queue.pop(0)
+            if name == 'local' and not model_preloader.ensure('cover_letter'):
+                # T5 still loading (or evicted): ensure() started the load, skip it this time
+                continue
+            if self._health(name).allow():
+                return name
+        return None
+
+    @staticmethod
+    def _health(name):
+        return endpoint_health(f'cover-backend:{name}')
+
+    def hedge_delay(self, name: str) -> float:
+        """Seconds to wait for ``name`` before starting the next backend"""
+        health = self._health(name)
+        latency = health.percentile(getattr(settings, 'COVER_HEDGE_PERCENTILE', 0.9))
+        if latency is None or len(health.latencies) < MIN_SAMPLES:
+            latency = getattr(settings, 'COVER_HEDGE_DEFAULT_DELAY', 5.0)
+        low = getattr(settings, 'COVER_HEDGE_MIN_DELAY', 0.5)
+        high = getattr(settings, 'COVER_HEDGE_MAX_DELAY', 30.0)
+        return min(max(latency, low), high)
+
+    async def _run(self, name: str, http, job: dict) -> str:
+        if name == 'template':
+            return self.generator._template(job['project_description'], job['skills'],
+                                            job_title=job.get('job_title'), company_name=job.get('company_name'))
+        if name == 'local':
+            from ai_cover_letters.generation import COVER_MAX_TOKENS, COVER_TEMPERATURE, ai_manager, build_cover_prompt
+
+            prompt = build_cover_prompt(job.get('job_title') or '', job.get('company_name') or '', job['skills'])
+            return await asyncio.to_thread(ai_manager.generate, prompt, COVER_MAX_TOKENS, COVER_TEMPERATURE)
+        return await self.generator._generate_remote(http, name, job['project_description'], job['skills'],
+                                                     job.get('job_title'), job.get('company_name'))
+
+    async def generate(self, job: dict, http=None) -> Tuple[Optional[str], Optional[str]]:
+        """(text, backend) of the first valid letter, or (None, None) when every backend failed"""
+        queue = self.ranked_backends()
+        running = {}  # task -> (backend, started)
+        launch_next = True
+        try:
+            while queue or running:
+                if queue and launch_next:
+                    name = self._next_backend(queue)
+                    if name is not None:
+                        task = asyncio.create_task(self._run(name, http, job))
+                        running[task] = (name, time.monotonic())
+                        delay = self.hedge_delay(name)
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, timeout=delay if queue else None,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                # nothing answered within the hedge delay: start the next backend as well
+                launch_next = not done
+                for task in done:
+                    name, started = running.pop(task)
+                    error = task.exception()
+                    text = None if error else task.result()
+                    if error is None and is_valid_cover(text):
+                        self._health(name).record_success(time.monotonic() - started)
+                        return text.strip(), name
+                    self._health(name).record_failure()
+                    logger.warning(f"⚠️ Hedged cover backend '{name}' failed: {error or 'invalid letter'}")
+                    launch_next = True
+            return None, None
+        finally:
+            # hedged-away backends get no verdict; hand back any half-open trial they held
+            for task, (name, _) in running.items():
+                task.cancel()
+                self._health(name).release()
+
+    def get_stats(self):
+        return {name: {**self._health(name).stats(), 'hedge_delay': round(self.hedge_delay(name), 2)}
+                for name in (self.backends or getattr(settings, 'COVER_HEDGE_BACKENDS', DEFAULT_BACKENDS))}
@@ -3,7 +3,7 @@ from django.utils.html import strip_tags
 from django.conf import settings
 from django.utils import timezone
 from .models import Project
-from .compute_match import MatchScorer
+from .compute_match import MatchScorer, get_match_scorer
 from .inputs import normalize_skills
 from .project_text_extractor import ProjectTextExtractor
 
@@ -12,10 +12,19 @@ class JobIngestor:
     """Ingests job payloads into Project model, computes match score and returns the created instance."""
 
     def __init__(self, scorer=None):
-        # avoid importing services here to prevent circular imports; use MatchScorer directly
-        self.scorer = scorer or MatchScorer().compute
+        # avoid importing services here to prevent circular imports; use the configured engine directly
+        # (the embedding engine caches vectors by content hash, so re-ingesting unchanged text is free)
+        self.scorer = scorer or self._default_score
         self.extractor = ProjectTextExtractor()
 
+    @staticmethod
+    def _default_score(description: str, skills: str) -> float:
+        try:
+            return get_match_scorer().compute(description, skills)
+        except RuntimeError:
+            # embedding engine configured but encoder unavailable
+            return MatchScorer().compute(description, skills)
+
     def sanitize(self, text: Optional[str]) -> str:
         if not text:
             return ''
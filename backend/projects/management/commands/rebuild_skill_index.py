@@ -0,0 +1,23 @@
+"""
+Django management command to rebuild the inverted skill index
+Usage: python manage.py rebuild_skill_index
+"""
+from django.core.management.base import BaseCommand
+
+from projects.skill_index import skill_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild SkillPosting rows for all projects (needed after bulk imports that bypass signals)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of postings to insert per query',
+        )
+
+    def handle(self, *args, **options):
+        indexed = skill_index.rebuild(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} projects'))
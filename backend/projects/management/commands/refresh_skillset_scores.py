@@ -0,0 +1,25 @@
+"""
+Django management command to rebuild the precomputed project/skillset score matrix
+Usage: python manage.py refresh_skillset_scores [--skillset ID]
+"""
+from django.core.management.base import BaseCommand
+
+from projects.score_refresh import score_worker
+
+
+class Command(BaseCommand):
+    help = 'Recompute ProjectSkillsetScore rows from the inverted skill index'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--skillset',
+            type=int,
+            help='Only refresh rows of this skillset id',
+        )
+
+    def handle(self, *args, **options):
+        if options.get('skillset'):
+            stored = score_worker.refresh_skillset(options['skillset'])
+        else:
+            stored = score_worker.refresh_all()
+        self.stdout.write(self.style.SUCCESS(f'Stored {stored} project/skillset scores'))
@@ -0,0 +1,57 @@
+"""
+Django management command to bulk-rescore projects against a skill list
+Usage: python manage.py rescore_projects --skills "python, django" [--scraped-only]
+"""
+from django.core.management.base import BaseCommand
+
+from projects.compute_match import BatchMatchScorer
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = 'Recompute Project.match_score for many projects with one compiled skill matcher'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--skills',
+            type=str,
+            required=True,
+            help='Comma-separated skills to score against',
+        )
+        parser.add_argument(
+            '--scraped-only',
+            action='store_true',
+            help='Only rescore projects that came from scraping',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of projects scored and updated per batch',
+        )
+
+    def handle(self, *args, **options):
+        scorer = BatchMatchScorer(options['skills'])
+        qs = Project.objects.only('id', 'description', 'match_score').order_by('pk')
+        if options['scraped_only']:
+            qs = qs.filter(is_scraped=True)
+
+        batch_size = options['batch_size']
+        updated = 0
+        batch = []
+        for project in qs.iterator(chunk_size=batch_size):
+            batch.append(project)
+            if len(batch) >= batch_size:
+                updated += self._score_batch(scorer, batch)
+                batch = []
+        if batch:
+            updated += self._score_batch(scorer, batch)
+        self.stdout.write(self.style.SUCCESS(f'Rescored {updated} projects'))
+
+    def _score_batch(self, scorer, projects):
+        scores = scorer.score_many(p.description or '' for p in projects)
+        for project, score in zip(projects, scores):
+            project.match_score = float(score)
+        # one UPDATE per batch; descriptions are untouched so the skill index stays valid
+        Project.objects.bulk_update(projects, ['match_score'])
+        return len(projects)
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.4 on 2026-10-16 22:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_index(apps, schema_editor):
+    from projects.skill_index import SkillIndex
+
+    Project = apps.get_model("projects", "Project")
+    SkillPosting = apps.get_model("projects", "SkillPosting")
+    index = SkillIndex()
+    pending = []
+    for project in Project.objects.only("id", "description").iterator():
+        for term, count in index.terms_for_text(project.description or "").items():
+            pending.append(SkillPosting(term=term, project_id=project.pk, count=count))
+        if len(pending) >= 500:
+            SkillPosting.objects.bulk_create(pending)
+            pending = []
+    if pending:
+        SkillPosting.objects.bulk_create(pending)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0004_alter_project_options_project_is_scraped_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SkillPosting",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("term", models.CharField(max_length=128)),
+                ("count", models.PositiveIntegerField(default=1)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="skill_postings",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("term", "project")},
+            },
+        ),
+        migrations.RunPython(build_index, migrations.RunPython.noop),
+    ]
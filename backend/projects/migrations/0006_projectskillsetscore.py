@@ -0,0 +1,91 @@
+# Generated by Django 5.2.4 on 2026-10-16 22:37
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def compute_scores(apps, schema_editor):
+    from projects.skill_index import SkillIndex
+
+    Skillset = apps.get_model("projects", "Skillset")
+    SkillPosting = apps.get_model("projects", "SkillPosting")
+    ProjectSkillsetScore = apps.get_model("projects", "ProjectSkillsetScore")
+    index = SkillIndex()
+    for skillset in Skillset.objects.all():
+        terms = index.skill_terms(skillset.skills)
+        if not terms:
+            continue
+        rows = (
+            SkillPosting.objects.filter(term__in=set(terms))
+            .values("project_id")
+            .annotate(hits=Sum("count"))
+            .order_by()
+        )
+        ProjectSkillsetScore.objects.bulk_create(
+            [
+                ProjectSkillsetScore(
+                    project_id=row["project_id"],
+                    skillset_id=skillset.pk,
+                    score=min(1.0, row["hits"] / len(terms)),
+                )
+                for row in rows
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0005_skillposting"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectSkillsetScore",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("score", models.FloatField(default=0.0)),
+                (
+                    "computed_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="skillset_scores",
+                        to="projects.project",
+                    ),
+                ),
+                (
+                    "skillset",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="project_scores",
+                        to="projects.skillset",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-score"],
+                "indexes": [
+                    models.Index(
+                        fields=["skillset", "-score"], name="projects_skillset_rank_idx"
+                    )
+                ],
+                "unique_together": {("project", "skillset")},
+            },
+        ),
+        migrations.RunPython(compute_scores, migrations.RunPython.noop),
+    ]
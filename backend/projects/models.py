@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 class Project(models.Model):
     STATUS_CHOICES = [
@@ -54,3 +55,41 @@ class Skillset(models.Model):
 
     def __str__(self):
         return f"{self.name}: {self.skills}"
+
+
+class SkillPosting(models.Model):
+    """Inverted index entry: how often a term occurs in a project's description.
+
+    Rows are maintained by ``projects.skill_index.SkillIndex`` whenever a Project is saved,
+    so skill search can aggregate posting lists instead of rescanning every description.
+    """
+    term = models.CharField(max_length=128)
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='skill_postings')
+    count = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        # the unique (term, project) index doubles as the posting-list lookup index
+        unique_together = ['term', 'project']
+
+    def __str__(self):
+        return f"{self.term} -> {self.project_id} ({self.count})"
+
+
+class ProjectSkillsetScore(models.Model):
+    """Precomputed match score of a Project against a saved Skillset.
+
+    Filled by ``projects.score_refresh.ScoreRefreshWorker`` whenever a Project or Skillset
+    changes. Only positive scores are stored; a missing row means a score of 0.
+    """
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='skillset_scores')
+    skillset = models.ForeignKey(Skillset, on_delete=models.CASCADE, related_name='project_scores')
+    score = models.FloatField(default=0.0)
+    computed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        unique_together = ['project', 'skillset']
+        indexes = [models.Index(fields=['skillset', '-score'], name='projects_skillset_rank_idx')]
+        ordering = ['-score']
+
+    def __str__(self):
+        return f"{self.project_id} x {self.skillset_id}: {self.score:.2f}"
@@ -0,0 +1,132 @@
+"""Background refresh of the precomputed ProjectSkillsetScore matrix.
+
+Changes are queued by the Project/Skillset signal handlers and processed by a single daemon
+thread, so request threads never pay for rescoring. Only affected rows are recomputed:
+
+- a changed Project rescans its own postings against every Skillset (one row per skillset)
+- a changed Skillset re-aggregates the inverted index for that skillset only
+
+Repeated changes to the same object while it is still queued are coalesced.
+Set ``SCORE_REFRESH_ASYNC = False`` in settings to refresh inline (handy in scripts/tests).
+"""
+import logging
+import queue
+import threading
+from typing import List, Set, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .models import ProjectSkillsetScore, Skillset, SkillPosting
+from .skill_index import SkillIndex, skill_index
+
+logger = logging.getLogger(__name__)
+
+
+class ScoreRefreshWorker:
+    """Coalescing queue + daemon thread that keeps ProjectSkillsetScore up to date."""
+
+    def __init__(self, index: SkillIndex = skill_index):
+        self.index = index
+        self._queue: "queue.Queue[Tuple[str, int]]" = queue.Queue()
+        self._pending: Set[Tuple[str, int]] = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    # ---- queueing ----
+
+    def enqueue_project(self, project_id: int):
+        self._enqueue(('project', project_id))
+
+    def enqueue_skillset(self, skillset_id: int):
+        self._enqueue(('skillset', skillset_id))
+
+    def _enqueue(self, item: Tuple[str, int]):
+        if not getattr(settings, 'SCORE_REFRESH_ASYNC', True):
+            self._process(item)
+            return
+        with self._lock:
+            if item in self._pending:
+                return
+            self._pending.add(item)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='score-refresh', daemon=True)
+                self._thread.start()
+        self._queue.put(item)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            with self._lock:
+                self._pending.discard(item)
+            try:
+                self._process(item)
+            except Exception as e:
+                logger.error(f"Score refresh failed for {item[0]} {item[1]}: {e}")
+            finally:
+                close_old_connections()
+                self._queue.task_done()
+
+    def _process(self, item: Tuple[str, int]):
+        kind, pk = item
+        if kind == 'project':
+            self.refresh_project(pk)
+        else:
+            self.refresh_skillset(pk)
+
+    # ---- recompute ----
+
+    def refresh_project(self, project_id: int) -> int:
+        """Recompute one project's row for every skillset. Returns number of rows stored."""
+        term_counts = dict(SkillPosting.objects.filter(project_id=project_id).values_list('term', 'count'))
+        now = timezone.now()
+        rows: List[ProjectSkillsetScore] = []
+        zero_ids: List[int] = []
+        for skillset_id, skills in Skillset.objects.values_list('id', 'skills'):
+            score = self.index.score_terms(term_counts, skills)
+            if score > 0:
+                rows.append(ProjectSkillsetScore(project_id=project_id, skillset_id=skillset_id, score=score, computed_at=now))
+            else:
+                zero_ids.append(skillset_id)
+        with transaction.atomic():
+            if zero_ids:
+                ProjectSkillsetScore.objects.filter(project_id=project_id, skillset_id__in=zero_ids).delete()
+            if rows:
+                ProjectSkillsetScore.objects.bulk_create(
+                    rows,
+                    update_conflicts=True,
+                    unique_fields=['project', 'skillset'],
+                    update_fields=['score', 'computed_at'],
+                )
+        return len(rows)
+
+    def refresh_skillset(self, skillset_id: int, batch_size: int = 1000) -> int:
+        """Recompute all rows of one skillset from the inverted index. Returns rows stored."""
+        skills = Skillset.objects.filter(pk=skillset_id).values_list('skills', flat=True).first()
+        if skills is None:
+            # skillset deleted; its rows went with it (cascade)
+            return 0
+        now = timezone.now()
+        stored = 0
+        with transaction.atomic():
+            ProjectSkillsetScore.objects.filter(skillset_id=skillset_id).delete()
+            batch: List[ProjectSkillsetScore] = []
+            for project_id, score in self.index.iter_scores(skills):
+                batch.append(ProjectSkillsetScore(project_id=project_id, skillset_id=skillset_id, score=score, computed_at=now))
+                if len(batch) >= batch_size:
+                    ProjectSkillsetScore.objects.bulk_create(batch)
+                    stored += len(batch)
+                    batch = []
+            if batch:
+                ProjectSkillsetScore.objects.bulk_create(batch)
+                stored += len(batch)
+        return stored
+
+    def refresh_all(self) -> int:
+        """Rebuild the full matrix synchronously (one index aggregate per skillset)."""
+        return sum(self.refresh_skillset(pk) for pk in Skillset.objects.values_list('id', flat=True))
+
+
+# default instance shared by signals and management commands
+score_worker = ScoreRefreshWorker()
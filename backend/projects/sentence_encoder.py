@@ -0,0 +1,121 @@
+"""Small CPU sentence encoder used for semantic match scoring and chat topic classification.
+
+Loads a MiniLM-sized model through ``transformers`` on first use and produces
+L2-normalized float32 vectors (mean pooling over token embeddings), so cosine
+similarity is a plain dot product.
+
+``get_sentence_encoder()`` is the process-wide instance shared by all embedding users.
+Small ``encode`` calls (fewer texts than ``batch_size``) go through an InferenceBatcher
+(ai_cover_letters/batching.py), so concurrent callers share forward passes; larger
+calls are already batched and run directly.
+"""
+import logging
+import threading
+from typing import List, Optional
+
+import numpy as np
+from django.conf import settings
+
+try:
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+    TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    TRANSFORMERS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_NAME = 'sentence-transformers/all-MiniLM-L6-v2'
+MAX_SEQ_LENGTH = 256
+
+
+class SentenceEncoder:
+    """Lazy-loading mean-pooled sentence encoder (CPU only)."""
+
+    def __init__(self, model_name: Optional[str] = None, batch_size: int = 32):
+        self.model_name = model_name or getattr(settings, 'EMBEDDING_MODEL_NAME', DEFAULT_MODEL_NAME)
+        self.batch_size = batch_size
+        self.tokenizer = None
+        self.model = None
+        self._lock = threading.Lock()
+        self._batcher = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.model is not None
+
+    def load(self):
+        if self.model is not None:
+            return
+        if not TRANSFORMERS_AVAILABLE:
+            raise RuntimeError('transformers/torch are required for embedding scoring')
+        with self._lock:
+            if self.model is not None:
+                return
+            logger.info(f"🔢 Loading sentence encoder: {self.model_name}")
+            try:
+                self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+                model = AutoModel.from_pretrained(self.model_name)
+            except (OSError, ValueError) as e:
+                # model not cached / offline / bad model name: callers fall back on RuntimeError
+                raise RuntimeError(f'Sentence encoder {self.model_name} could not be loaded: {e}') from e
+            model.eval()
+            self.model = model
+
+    @property
+    def batcher(self):
+        if self._batcher is None:
+            from ai_cover_letters.batching import InferenceBatcher
+
+            with self._lock:
+                if self._batcher is None:
+                    self._batcher = InferenceBatcher(
+                        lambda texts, _max_tokens, _temperature: list(self._encode_now(texts)),
+                        max_batch_size=self.batch_size,
+                        window_ms=getattr(settings, 'EMBEDDING_BATCH_WINDOW_MS', 5),
+                    )
+        return self._batcher
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Encode ``texts`` into an ``(n, dim)`` float32 matrix of unit vectors."""
+        texts = list(texts)
+        if not texts or len(texts) >= self.batch_size:
+            return self._encode_now(texts)
+        self.load()
+        futures = [self.batcher.submit(text or '', 0, 0.0) for text in texts]
+        return np.vstack([future.result() for future in futures])
+
+    def _encode_now(self, texts: List[str]) -> np.ndarray:
+        self.load()
+        chunks = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = [t or '' for t in texts[start:start + self.batch_size]]
+            inputs = self.tokenizer(batch, padding=True, truncation=True, max_length=MAX_SEQ_LENGTH, return_tensors='pt')
+            with torch.no_grad():
+                hidden = self.model(**inputs).last_hidden_state
+            mask = inputs['attention_mask'].unsqueeze(-1).to(hidden.dtype)
+            pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+            pooled = torch.nn.functional.normalize(pooled, p=2, dim=1)
+            chunks.append(pooled.cpu().numpy().astype(np.float32))
+        if not chunks:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.vstack(chunks)
+
+    @property
+    def dimension(self) -> int:
+        self.load()
+        return int(self.model.config.hidden_size)
+
+
+_shared_encoder: Optional[SentenceEncoder] = None
+_shared_lock = threading.Lock()
+
+
+def get_sentence_encoder() -> SentenceEncoder:
+    """Process-wide encoder (one model copy and one batching queue for all embedding users)."""
+    global _shared_encoder
+    if _shared_encoder is None:
+        with _shared_lock:
+            if _shared_encoder is None:
+                _shared_encoder = SentenceEncoder()
+    return _shared_encoder
@@ -1,16 +1,23 @@
 """Thin delegator exposing service functions used by the API endpoints.
 
 This module keeps the same function-level API (compute_match_score,
-generate_cover_letter, generate_cover_letter_async, create_monday_task) but
-delegates implementation to classes in separate modules so each component
+compute_match_scores, generate_cover_letter, generate_cover_letter_async, generate_cover_letters_async,
+create_monday_task) but delegates implementation to classes in separate modules so each component
 can be developed and tested independently.
 """
-from .compute_match import MatchScorer
-from .cover_generator import CoverGenerator
+import logging
+
+from asgiref.sync import sync_to_async
+
+from .compute_match import BatchMatchScorer, MatchScorer, get_match_scorer
+from .cover_generator import TEMPLATE_PROVIDER, CoverGenerator
 from .monday_client import MondayClient
 from .job_ingest import JobIngestor
 from .project_text_extractor import ProjectTextExtractor
+from ai_cover_letters.generation_cache import generation_cache, make_cache_key
+
 
+logger = logging.getLogger(__name__)
 
 # default instances (can be swapped in tests)
 _scorer = MatchScorer()
@@ -18,17 +25,93 @@ _ai = CoverGenerator()
 _monday = MondayClient()
 
 
-def compute_match_score(project_text: str, skills: str) -> float:
-    return _scorer.compute(project_text, skills)
+def compute_match_score(project_text: str, skills: str, engine: str | None = None) -> float:
+    """Score one description. ``engine`` is 'keyword' or 'embedding' (default: settings.MATCH_SCORE_ENGINE).
 
-
-def generate_cover_letter(project_description: str, skills: str, mode: str | None = None, job_title: str | None = None, company_name: str | None = None) -> str:
+    The embedding engine falls back to keyword scoring when the encoder cannot be loaded.
+    """
+    scorer = get_match_scorer(engine)
+    if isinstance(scorer, MatchScorer):
+        return _scorer.compute(project_text, skills)
+    try:
+        return scorer.compute(project_text, skills)
+    except RuntimeError as e:
+        logger.warning(f"Embedding scoring unavailable, using keyword scorer: {e}")
+        return _scorer.compute(project_text, skills)
+
+
+def compute_match_scores(project_texts, skills: str, engine: str | None = None):
+    """Score many descriptions against one skill list; returns a NumPy array of scores."""
+    project_texts = list(project_texts)
+    scorer = get_match_scorer(engine)
+    if not isinstance(scorer, MatchScorer):
+        try:
+            return scorer.score_many(project_texts, skills)
+        except RuntimeError as e:
+            logger.warning(f"Embedding scoring unavailable, using keyword scorer: {e}")
+    return BatchMatchScorer(skills).score_many(project_texts)
+
+
+def generate_cover_letter(project_description: str, skills: str, mode: str | None = None, job_title: str | None = None, company_name: str | None = None, regenerate: bool = False) -> str:
+    """Cover letter for a project; identical inputs are served from the generation cache unless ``regenerate``.
+
+    Template fallbacks are not cached, so a later call retries the backends.
+    """
+    key = make_cache_key(
+        'project_cover', project_description or '',
+        skills=skills, mode=mode, job_title=job_title, company_name=company_name
+    )
+    cover = generation_cache.get(key, bypass=regenerate)
+    if cover is not None:
+        return cover
     # Use only_backend parameter to override backend choice
-    return _ai.generate(project_description, skills, job_title=job_title, company_name=company_name, only_backend=mode)
+    cover, provider = _ai.generate(project_description, skills, job_title=job_title, company_name=company_name,
+                                   only_backend=mode, return_provider=True)
+    if cover and provider != TEMPLATE_PROVIDER:
+        generation_cache.set(key, cover, 'project_cover')
+    return cover
+
+
+def _async_cover_key(job: dict, mode: str | None) -> str:
+    return make_cache_key(
+        'project_cover', job.get('project_description') or '',
+        skills=job.get('skills'), mode=f"async:{mode or 'auto'}",
+        job_title=job.get('job_title'), company_name=job.get('company_name')
+    )
 
 
-async def generate_cover_letter_async(project_description: str, skills: str, job_title: str | None = None) -> str:
-    return await _ai.generate_async(project_description, skills, job_title=job_title)
+async def generate_cover_letters_async(jobs, mode: str | None = None, regenerate: bool = False,
+                                       concurrency: int | None = None):
+    """(text, provider) per job dict (project_description, skills, job_title, company_name).
+
+    Cache misses are generated concurrently on the remote backends (bounded by ``concurrency``,
+    default settings.COVER_ASYNC_CONCURRENCY); cached letters come back with provider 'cache'.
+    Template fallbacks are not cached, so a later call retries the backends.
+    """
+    jobs = list(jobs)
+    keys = [_async_cover_key(job, mode) for job in jobs]
+    results = [None] * len(jobs)
+    for i, key in enumerate(keys):
+        cached = await sync_to_async(generation_cache.get)(key, bypass=regenerate)
+        if cached is not None:
+            results[i] = (cached, 'cache')
+
+    missing = [i for i, result in enumerate(results) if result is None]
+    generated = await _ai.generate_many_async([jobs[i] for i in missing], concurrency=concurrency, only_backend=mode)
+    for i, (text, provider) in zip(missing, generated):
+        results[i] = (text, provider)
+        if text and provider != TEMPLATE_PROVIDER:
+            await sync_to_async(generation_cache.set)(keys[i], text, namespace='project_cover')
+    return results
+
+
+async def generate_cover_letter_async(project_description: str, skills: str, job_title: str | None = None,
+                                      company_name: str | None = None, mode: str | None = None,
+                                      regenerate: bool = False) -> str:
+    job = {'project_description': project_description, 'skills': skills,
+           'job_title': job_title, 'company_name': company_name}
+    [(cover, _)] = await generate_cover_letters_async([job], mode=mode, regenerate=regenerate)
+    return cover
 
 
 def create_monday_task(title: str, deadline: str, assignee: str, api_key: str | None = None) -> dict:
@@ -0,0 +1,44 @@
+"""Model signal handlers for the projects app."""
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Project, Skillset
+from .score_refresh import score_worker
+from .skill_index import skill_index
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Project)
+def update_skill_index(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Keep the inverted skill index and skillset scores in sync with Project descriptions.
+
+    Covers ``JobIngestor.ingest``/``ingest_with_fetch`` (which use ``objects.create``) as well
+    as regular saves. Saves restricted to other fields skip reindexing entirely.
+    """
+    if raw:
+        return
+    if update_fields is not None and 'description' not in update_fields:
+        return
+    try:
+        changed = skill_index.index_project(instance)
+    except Exception as e:
+        logger.error(f"Failed to update skill index for project {instance.pk}: {e}")
+        return
+    if changed:
+        project_id = instance.pk
+        transaction.on_commit(lambda: score_worker.enqueue_project(project_id))
+
+
+@receiver(post_save, sender=Skillset)
+def refresh_skillset_scores(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Recompute the score column of a created/edited Skillset in the background."""
+    if raw:
+        return
+    if update_fields is not None and 'skills' not in update_fields:
+        return
+    skillset_id = instance.pk
+    transaction.on_commit(lambda: score_worker.enqueue_skillset(skillset_id))
@@ -0,0 +1,162 @@
+"""Inverted skill index for project search.
+
+Each Project description is tokenized into word n-grams (up to ``MAX_NGRAM`` words so
+multi-word skills like "google analytics" can be looked up directly) and stored as
+``SkillPosting`` rows (term -> project, count). A skill search then becomes a single
+aggregate over the posting lists of the requested terms, ordered and paginated in the DB.
+
+Scores follow the same formula as ``MatchScorer``: ``min(1, hits / number_of_skills)``.
+"""
+import re
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Sum
+
+from .models import Project, SkillPosting
+
+
+MAX_NGRAM = 3
+MAX_TERM_LENGTH = 128
+
+# keep characters that are meaningful inside skill names (c++, c#, node.js, .net)
+WORD_RE = re.compile(r"[\w+#.\-]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with sentence punctuation trimmed."""
+    if not text:
+        return []
+    words = []
+    for raw in WORD_RE.findall(text.lower()):
+        word = raw.rstrip('.-').lstrip('-')
+        if word:
+            words.append(word)
+    return words
+
+
+class SkillIndex:
+    """Maintains and queries the ``SkillPosting`` inverted index."""
+
+    def __init__(self, max_ngram: int = MAX_NGRAM):
+        self.max_ngram = max_ngram
+
+    def terms_for_text(self, text: str) -> Counter:
+        """Return term -> occurrence count for every n-gram of ``text``."""
+        words = tokenize(text)
+        counts: Counter = Counter()
+        for n in range(1, self.max_ngram + 1):
+            for i in range(len(words) - n + 1):
+                term = ' '.join(words[i:i + n])
+                if len(term) <= MAX_TERM_LENGTH:
+                    counts[term] += 1
+        return counts
+
+    def skill_terms(self, skills: str) -> List[str]:
+        """Map a comma separated skill list to index terms (one per skill, in order).
+
+        Skills longer than ``max_ngram`` words are looked up by their leading n-gram.
+        """
+        terms = []
+        for skill in (skills or '').split(','):
+            words = tokenize(skill)
+            if words:
+                terms.append(' '.join(words[:self.max_ngram]))
+        return terms
+
+    # ---- maintenance ----
+
+    def index_project(self, project: Project) -> bool:
+        """(Re)build postings for one project. Returns False when nothing changed."""
+        counts = self.terms_for_text(project.description or '')
+        existing = dict(SkillPosting.objects.filter(project_id=project.pk).values_list('term', 'count'))
+        if existing == dict(counts):
+            return False
+        with transaction.atomic():
+            SkillPosting.objects.filter(project_id=project.pk).delete()
+            SkillPosting.objects.bulk_create(
+                [SkillPosting(term=term, project_id=project.pk, count=count) for term, count in counts.items()],
+                batch_size=500,
+            )
+        return True
+
+    def rebuild(self, projects: Optional[Iterable[Project]] = None, batch_size: int = 500) -> int:
+        """Rebuild the whole index (or the given projects). Returns number of projects indexed."""
+        if projects is None:
+            SkillPosting.objects.all().delete()
+            projects = Project.objects.only('id', 'description').iterator(chunk_size=batch_size)
+            replace = False
+        else:
+            replace = True
+        indexed = 0
+        pending: List[SkillPosting] = []
+        for project in projects:
+            if replace:
+                SkillPosting.objects.filter(project_id=project.pk).delete()
+            for term, count in self.terms_for_text(project.description or '').items():
+                pending.append(SkillPosting(term=term, project_id=project.pk, count=count))
+            indexed += 1
+            if len(pending) >= batch_size:
+                SkillPosting.objects.bulk_create(pending, batch_size=batch_size)
+                pending = []
+        if pending:
+            SkillPosting.objects.bulk_create(pending, batch_size=batch_size)
+        return indexed
+
+    # ---- queries ----
+
+    def _hits_queryset(self, skills: str):
+        terms = self.skill_terms(skills)
+        if not terms:
+            return None, 0
+        unique_terms = list(dict.fromkeys(terms))
+        qs = (
+            SkillPosting.objects.filter(term__in=unique_terms)
+            .values('project_id')
+            .annotate(hits=Sum('count'))
+        )
+        return qs, len(terms)
+
+    def search(self, skills: str, limit: int = 50, offset: int = 0) -> List[Tuple[int, float]]:
+        """Top-k projects for ``skills`` as ``[(project_id, score), ...]`` ordered by score desc."""
+        qs, n_skills = self._hits_queryset(skills)
+        if qs is None:
+            return []
+        rows = qs.order_by('-hits', '-project_id')[offset:offset + limit]
+        return [(row['project_id'], min(1.0, row['hits'] / n_skills)) for row in rows]
+
+    def iter_scores(self, skills: str, batch_size: int = 2000) -> Iterator[Tuple[int, float]]:
+        """Yield ``(project_id, score)`` for every project with at least one hit (unordered)."""
+        qs, n_skills = self._hits_queryset(skills)
+        if qs is None:
+            return
+        for row in qs.order_by().iterator(chunk_size=batch_size):
+            yield row['project_id'], min(1.0, row['hits'] / n_skills)
+
+    def score_terms(self, term_counts: Dict[str, int], skills: str) -> float:
+        """Score a single project's term counts (e.g. its postings) against ``skills``."""
+        terms = self.skill_terms(skills)
+        if not terms:
+            return 0.0
+        hits = sum(term_counts.get(term, 0) for term in dict.fromkeys(terms))
+        return min(1.0, hits / len(terms))
+
+    def count_matches(self, skills: str) -> int:
+        """Number of projects with at least one hit for ``skills``."""
+        terms = list(dict.fromkeys(self.skill_terms(skills)))
+        if not terms:
+            return 0
+        return SkillPosting.objects.filter(term__in=terms).values('project_id').distinct().count()
+
+    def scores_for_projects(self, skills: str, project_ids: Iterable[int]) -> Dict[int, float]:
+        """Scores for specific projects; projects without hits are omitted."""
+        qs, n_skills = self._hits_queryset(skills)
+        if qs is None:
+            return {}
+        rows = qs.filter(project_id__in=list(project_ids))
+        return {row['project_id']: min(1.0, row['hits'] / n_skills) for row in rows}
+
+
+# default instance shared by signals and views
+skill_index = SkillIndex()
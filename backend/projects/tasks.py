@@ -0,0 +1,91 @@
+"""
+Projects Tasks
+task_queue handlers for bulk cover letter generation
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+from backend.model_preloader import model_preloader
+from task_queue.executor import task_handler
+
+from .models import Project
+
+logger = logging.getLogger(__name__)
+
+# how long a batch waits for the cover letter model to finish loading
+MODEL_WAIT_SECONDS = 600
+
+DEFAULT_SKILLS = 'Python, Django, React'
+
+
+def _wait_for_model(ctx):
+    deadline = time.monotonic() + MODEL_WAIT_SECONDS
+    while not model_preloader.ensure('cover_letter'):
+        if time.monotonic() > deadline:
+            raise RuntimeError('Cover letter model did not become ready')
+        ctx.update(2, 'Waiting for the cover letter model to load')
+        time.sleep(model_preloader.retry_after())
+
+
+@task_handler('generate_covers')
+def generate_covers(params, ctx):
+    """Generate cover letters for ``project_ids`` in model-sized batches.
+
+    Each batch is one batched model pass (cached letters are reused) followed by one
+    bulk_update of cover_letter/status, so finished batches survive a later failure.
+    """
+    from ai_cover_letters.views import generate_cover_letters
+
+    project_ids = params.get('project_ids') or []
+    regenerate = bool(params.get('regenerate'))
+    skills_override = params.get('skills')
+    by_id = Project.objects.only('id', 'title', 'client', 'skills_required').in_bulk(project_ids)
+    projects = [by_id[pid] for pid in project_ids if pid in by_id]
+    if not projects:
+        return {'success': True, 'generated': 0, 'cached': 0, 'failed': 0, 'project_ids': []}
+
+    ctx.update(1, f'Preparing {len(projects)} cover letters')
+    _wait_for_model(ctx)
+
+    batch_size = getattr(settings, 'AI_BATCH_MAX_SIZE', 8)
+    generated = cached = 0
+    failed = []
+    for start in range(0, len(projects), batch_size):
+        batch = projects[start:start + batch_size]
+        jobs = [(p.title, p.client or '', skills_override or p.skills_required or DEFAULT_SKILLS) for p in batch]
+        try:
+            results = generate_cover_letters(jobs, regenerate=regenerate)
+        except Exception as e:
+            logger.error(f"❌ Cover letter batch failed: {e}")
+            failed.extend(p.pk for p in batch)
+            continue
+
+        now = timezone.now()
+        updated = []
+        for project, (text, from_cache) in zip(batch, results):
+            if not text:
+                failed.append(project.pk)
+                continue
+            project.cover_letter = text
+            project.status = 'proposal_ready'
+            project.updated_at = now
+            updated.append(project)
+            cached += from_cache
+            generated += not from_cache
+        Project.objects.bulk_update(updated, ['cover_letter', 'status', 'updated_at'])
+
+        done = start + len(batch)
+        ctx.update(5 + int(95 * done / len(projects)), f'{done}/{len(projects)} cover letters')
+
+    logger.info(f"✅ Bulk cover letters: {generated} generated, {cached} cached, {len(failed)} failed")
+    return {
+        'success': not failed,
+        'generated': generated,
+        'cached': cached,
+        'failed': len(failed),
+        'failed_project_ids': failed,
+        'project_ids': [p.pk for p in projects],
+    }
@@ -1,5 +1,5 @@
 from rest_framework.routers import DefaultRouter
-from .views import ProjectViewSet, SkillsetViewSet, generate_cover_global
+from .views import ProjectViewSet, SkillsetViewSet, generate_cover_global, generate_covers_async
 from django.urls import path, include
 
 router = DefaultRouter()
@@ -9,6 +9,7 @@ router.register(r'skillsets', SkillsetViewSet, basename='skillset')
 
 urlpatterns = [
     path('', include(router.urls)),
-    path('generate-cover-letter/', generate_cover_global, name='generate_cover_global')
+    path('generate-cover-letter/', generate_cover_global, name='generate_cover_global'),
+    path('generate-covers-async/', generate_covers_async, name='generate_covers_async'),
    # path('', include('projects.ingest_job.ai_ingest.llm_urls')),
 ]
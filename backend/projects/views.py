@@ -4,7 +4,8 @@ from rest_framework.response import Response
 from .models import Project
 from .serializers import ProjectSerializer
 from . import services
-from .models import Skillset
+from .skill_index import skill_index
+from .models import Skillset, ProjectSkillsetScore
 from .serializers import SkillsetSerializer
 from rest_framework import viewsets
 from rest_framework.decorators import action
@@ -14,8 +15,19 @@ from django.views.decorators.csrf import csrf_exempt
 from rest_framework.permissions import AllowAny
 from rest_framework.decorators import api_view, permission_classes
 from django.http import JsonResponse
+from django.utils import timezone
+from task_queue.executor import task_executor
+from ai_cover_letters.generation_cache import wants_regenerate
 import json
 
+# default/maximum page sizes for skill search
+SEARCH_PAGE_SIZE = 50
+SEARCH_MAX_PAGE_SIZE = 500
+
+# default/maximum projects per bulk cover letter request
+BULK_COVER_DEFAULT = 20
+BULK_COVER_MAX = 100
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 @csrf_exempt
@@ -28,13 +40,15 @@ def generate_cover_global(request):
         company_name = data.get('company_name', '')
         job_description = data.get('job_description', '')
         skills = data.get('skills', 'Python, Django, React')
+        regenerate = wants_regenerate(data)
         
         # Use the cover generator service  
         cover = services.generate_cover_letter(
             project_description=job_description,
             skills=skills,
             job_title=job_title,
-            company_name=company_name
+            company_name=company_name,
+            regenerate=regenerate
         )
         
         return JsonResponse({
@@ -50,6 +64,54 @@ def generate_cover_global(request):
             'error': str(e)
         }, status=500)
 
+@csrf_exempt
+async def generate_covers_async(request):
+    """Generate cover letters for many projects concurrently on the remote backends (serve via ASGI).
+
+    Body: { project_ids: [...], skills?, mode?: 'tgi'|'deepseak'|'zephyr', regenerate?, save? (default true),
+    concurrency? }. Under WSGI it still works, but occupies the worker thread for the whole batch.
+    """
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'POST required'}, status=405)
+    try:
+        data = json.loads(request.body) if request.body else {}
+        project_ids = [int(pid) for pid in data.get('project_ids') or []]
+        concurrency = int(data['concurrency']) if data.get('concurrency') else None
+    except (TypeError, ValueError) as e:
+        return JsonResponse({'success': False, 'error': f'Invalid request: {e}'}, status=400)
+    if not project_ids or len(project_ids) > BULK_COVER_MAX:
+        return JsonResponse({'success': False, 'error': f'Send 1-{BULK_COVER_MAX} project_ids'}, status=400)
+
+    by_id = {p.pk: p async for p in Project.objects.filter(pk__in=project_ids)}
+    projects = [by_id[pid] for pid in project_ids if pid in by_id]
+    skills = data.get('skills')
+    jobs = [{
+        'project_description': p.description or '',
+        'skills': skills or p.skills_required or 'Python, Django, React',
+        'job_title': p.title,
+        'company_name': p.client or '',
+    } for p in projects]
+    results = await services.generate_cover_letters_async(
+        jobs, mode=data.get('mode'), regenerate=wants_regenerate(data), concurrency=concurrency
+    )
+
+    if data.get('save', True):
+        now = timezone.now()
+        for project, (cover, _) in zip(projects, results):
+            project.cover_letter = cover
+            project.status = 'proposal_ready'
+            project.updated_at = now
+        await Project.objects.abulk_update(projects, ['cover_letter', 'status', 'updated_at'])
+
+    return JsonResponse({
+        'success': True,
+        'results': [
+            {'project_id': p.pk, 'cover_letter': cover, 'provider': provider}
+            for p, (cover, provider) in zip(projects, results)
+        ],
+        'missing_project_ids': [pid for pid in project_ids if pid not in by_id],
+    })
+
 @method_decorator(csrf_exempt, name='dispatch')
 class ProjectViewSet(viewsets.ModelViewSet):
     queryset = Project.objects.all().order_by('-created_at')
@@ -64,9 +126,13 @@ class ProjectViewSet(viewsets.ModelViewSet):
     def compute_score(self, request, pk=None):
         project = self.get_object()
         skills = request.data.get('skills', project.skills_required)
-        score = services.compute_match_score(project.description or '', skills)
+        engine = request.data.get('engine')
+        try:
+            score = services.compute_match_score(project.description or '', skills, engine=engine)
+        except ValueError as e:
+            return Response({'error': 'invalid_engine', 'detail': str(e)}, status=400)
         project.match_score = score
-        project.save()
+        project.save(update_fields=['match_score', 'updated_at'])
         return Response({'match_score': score})
 
     @action(detail=True, methods=['post'])
@@ -74,13 +140,53 @@ class ProjectViewSet(viewsets.ModelViewSet):
         project = self.get_object()
         skills = request.data.get('skills', project.skills_required)
         mode = request.data.get('mode')
-        cover = services.generate_cover_letter(project.description or '', skills, mode=mode, job_title=project.title)
+        regenerate = wants_regenerate(request.data)
+        cover = services.generate_cover_letter(project.description or '', skills, mode=mode, job_title=project.title, regenerate=regenerate)
         # Ensure we never write NULL into the TextField (DB expects empty string when absent)
         project.cover_letter = cover or ''
         project.status = 'proposal_ready'
         project.save()
         return Response({'cover_letter': cover or '', 'generated': bool(cover)})
 
+    @action(detail=False, methods=['post'])
+    def generate_covers(self, request):
+        """Queue cover letters for the top N projects by match_score.
+
+        Body: { top_n?, min_score?, regenerate?, include_existing?, skills? }. Projects that
+        already have a letter are skipped unless include_existing. Returns 202 with the task;
+        progress and the per-batch results are at /api/tasks/<task_id>/.
+        """
+        try:
+            top_n = max(1, min(int(request.data.get('top_n', BULK_COVER_DEFAULT)), BULK_COVER_MAX))
+            min_score = request.data.get('min_score')
+            min_score = float(min_score) if min_score not in (None, '') else None
+        except (TypeError, ValueError):
+            return Response({'error': 'invalid_parameters'}, status=400)
+        regenerate = wants_regenerate(request.data)
+
+        queryset = Project.objects.filter(match_score__isnull=False)
+        if min_score is not None:
+            queryset = queryset.filter(match_score__gte=min_score)
+        if not (regenerate or request.data.get('include_existing')):
+            queryset = queryset.filter(cover_letter='')
+        project_ids = list(queryset.order_by('-match_score', '-created_at').values_list('id', flat=True)[:top_n])
+        if not project_ids:
+            return Response({'success': True, 'message': 'No projects need a cover letter', 'project_ids': []})
+
+        task = task_executor.submit('generate_covers', {
+            'project_ids': project_ids,
+            'regenerate': regenerate,
+            'skills': request.data.get('skills') or None,
+        })
+        return Response({
+            'success': True,
+            'message': f'Generating {len(project_ids)} cover letters',
+            'task_id': str(task.task_id),
+            'status': task.status,
+            'status_url': f'/api/tasks/{task.task_id}/',
+            'project_ids': project_ids,
+        }, status=status.HTTP_202_ACCEPTED)
+
     @action(detail=True, methods=['post'])
     def send_to_monday(self, request, pk=None):
         project = self.get_object()
@@ -95,18 +201,37 @@ class ProjectViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['post'])
     def search(self, request):
-        """Search projects by skills (POST { skills: 'a,b,c' }). Returns projects ordered by computed match_score."""
+        """Search projects by skills (POST { skills: 'a,b,c', limit?, offset? }).
+
+        Returns projects with at least one skill hit, ordered by match score (computed from the
+        inverted skill index). The total number of matches is sent in the X-Total-Count header.
+        Passing ``skillset_id`` instead of ``skills`` reads the precomputed ProjectSkillsetScore rows.
+        """
         skills = request.data.get('skills', '')
-        qs = list(Project.objects.all())
-        results = []
-        for p in qs:
-            score = services.compute_match_score(p.description or '', skills)
-            results.append((score, p))
-        # sort desc by score
-        results.sort(key=lambda x: x[0], reverse=True)
-        projects_ordered = [r[1] for r in results]
+        skillset_id = request.data.get('skillset_id')
+        try:
+            limit = max(1, min(int(request.data.get('limit', SEARCH_PAGE_SIZE)), SEARCH_MAX_PAGE_SIZE))
+            offset = max(0, int(request.data.get('offset', 0)))
+            skillset_id = int(skillset_id) if skillset_id not in (None, '') else None
+        except (TypeError, ValueError):
+            return Response({'error': 'invalid_parameters',
+                             'detail': 'limit, offset and skillset_id must be integers'}, status=400)
+
+        if skillset_id is not None:
+            # saved skillset: read the precomputed, indexed score column
+            return _skillset_ranking_response(skillset_id, limit, offset)
+
+        if not skill_index.skill_terms(skills):
+            # no usable skills: fall back to the default listing order
+            total = Project.objects.count()
+            projects_ordered = list(Project.objects.all()[offset:offset + limit])
+        else:
+            ranked = skill_index.search(skills, limit=limit, offset=offset)
+            by_id = Project.objects.in_bulk([pid for pid, _ in ranked])
+            projects_ordered = [by_id[pid] for pid, _ in ranked if pid in by_id]
+            total = skill_index.count_matches(skills)
         serializer = ProjectSerializer(projects_ordered, many=True)
-        return Response(serializer.data)
+        return Response(serializer.data, headers={'X-Total-Count': str(total)})
 
     @action(detail=False, methods=['post'])
     def extract_text(self, request):
@@ -182,5 +307,27 @@ class SkillsetViewSet(viewsets.ModelViewSet):
     queryset = Skillset.objects.all()
     serializer_class = SkillsetSerializer
 
+    @action(detail=True, methods=['get'])
+    def projects(self, request, pk=None):
+        """Projects ranked by their precomputed score for this skillset (GET ?limit=&offset=)."""
+        skillset = self.get_object()
+        try:
+            limit = max(1, min(int(request.query_params.get('limit', SEARCH_PAGE_SIZE)), SEARCH_MAX_PAGE_SIZE))
+            offset = max(0, int(request.query_params.get('offset', 0)))
+        except (TypeError, ValueError):
+            return Response({'error': 'invalid_pagination'}, status=400)
+        return _skillset_ranking_response(skillset.pk, limit, offset)
+
+
+def _skillset_ranking_response(skillset_id, limit, offset):
+    """Serialize one page of ProjectSkillsetScore rows (score desc) with a ``skillset_score`` field."""
+    scores = ProjectSkillsetScore.objects.filter(skillset_id=skillset_id)
+    total = scores.count()
+    page = list(scores.select_related('project').order_by('-score', '-project_id')[offset:offset + limit])
+    data = ProjectSerializer([row.project for row in page], many=True).data
+    for item, row in zip(data, page):
+        item['skillset_score'] = row.score
+    return Response(data, headers={'X-Total-Count': str(total)})
+
 
 
@@ -0,0 +1,10 @@
+from django.contrib import admin
+from .models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ('task_id', 'kind', 'status', 'progress', 'created_at', 'finished_at')
+    list_filter = ('kind', 'status')
+    readonly_fields = ('task_id', 'created_at', 'started_at', 'finished_at', 'updated_at')
+    ordering = ('-created_at',)
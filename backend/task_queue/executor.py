@@ -0,0 +1,143 @@
+"""
+Task executor: runs persisted Task rows on a bounded thread pool.
+
+Handlers are registered per task kind with ``@task_handler('kind')`` and are called as
+``handler(params, ctx)``; ``ctx.update(progress, message)`` persists progress so the
+status endpoints (GET, long-poll, SSE) can report it. The handler's return value
+(JSON-serializable) is stored as the task result; an exception marks the task failed.
+
+Settings:
+    TASK_QUEUE_MAX_WORKERS  - concurrent tasks (default 2)
+    TASK_QUEUE_ASYNC        - False runs tasks inline in submit() (scripts/tests)
+    TASK_QUEUE_STALE_AFTER  - seconds without progress before an active task is
+                              considered orphaned (e.g. server restart), default 900
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+
+class TaskContext:
+    """Passed to handlers for progress reporting"""
+
+    def __init__(self, task: Task):
+        self.task = task
+        self.task_id = task.task_id
+
+    def update(self, progress: Optional[int] = None, message: Optional[str] = None):
+        fields = {'updated_at': timezone.now()}
+        if progress is not None:
+            fields['progress'] = max(0, min(100, int(progress)))
+        if message is not None:
+            fields['message'] = message[:500]
+        Task.objects.filter(pk=self.task.pk).update(**fields)
+
+
+class TaskExecutor:
+    """Bounded thread pool + handler registry for Task rows"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = max_workers
+        self._handlers: Dict[str, Callable] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    # ---- registry ----
+
+    def register(self, kind: str, handler: Callable):
+        self._handlers[kind] = handler
+
+    def handler(self, kind: str):
+        """Decorator form of register()"""
+        def decorator(func):
+            self.register(kind, func)
+            return func
+        return decorator
+
+    # ---- submission ----
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                workers = self._max_workers or getattr(settings, 'TASK_QUEUE_MAX_WORKERS', 2)
+                self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='task-queue')
+                logger.info(f"🧵 Task executor started with {workers} workers")
+                self.fail_stale()
+        return self._pool
+
+    def submit(self, kind: str, params: Optional[dict] = None) -> Task:
+        """Persist a task and schedule it; returns the Task row (status queued)"""
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown task kind '{kind}'")
+        task = Task.objects.create(kind=kind, params=params or {})
+        if not getattr(settings, 'TASK_QUEUE_ASYNC', True):
+            self._run(task.pk)
+            task.refresh_from_db()
+            return task
+        pool = self._get_pool()
+        # run after the surrounding transaction (if any) commits so the worker sees the row
+        transaction.on_commit(lambda: pool.submit(self._run, task.pk))
+        logger.info(f"📥 Queued task {task.task_id} ({kind})")
+        return task
+
+    def _run(self, pk: int):
+        close_old_connections()
+        try:
+            started = Task.objects.filter(pk=pk, status=Task.STATUS_QUEUED).update(
+                status=Task.STATUS_RUNNING, started_at=timezone.now(), updated_at=timezone.now()
+            )
+            if not started:
+                return
+            task = Task.objects.get(pk=pk)
+            handler = self._handlers[task.kind]
+            try:
+                result = handler(task.params, TaskContext(task))
+            except Exception as e:
+                logger.error(f"❌ Task {task.task_id} ({task.kind}) failed: {e}")
+                Task.objects.filter(pk=pk).update(
+                    status=Task.STATUS_FAILED, error=str(e), message='Failed', finished_at=timezone.now(), updated_at=timezone.now()
+                )
+                return
+            Task.objects.filter(pk=pk).update(
+                status=Task.STATUS_COMPLETED, result=result, progress=100, message='Completed',
+                finished_at=timezone.now(), updated_at=timezone.now()
+            )
+            logger.info(f"✅ Task {task.task_id} ({task.kind}) completed")
+        except Exception as e:
+            logger.error(f"❌ Task executor error for task {pk}: {e}")
+        finally:
+            close_old_connections()
+
+    # ---- queries ----
+
+    def fail_stale(self) -> int:
+        """Fail active tasks that stopped reporting (orphaned by a restart)"""
+        stale_after = getattr(settings, 'TASK_QUEUE_STALE_AFTER', 900)
+        cutoff = timezone.now() - timedelta(seconds=stale_after)
+        count = Task.objects.filter(status__in=Task.ACTIVE_STATUSES, updated_at__lt=cutoff).update(
+            status=Task.STATUS_FAILED, error='Task interrupted (no progress before timeout)',
+            finished_at=timezone.now(), updated_at=timezone.now()
+        )
+        if count:
+            logger.warning(f"Marked {count} stale tasks as failed")
+        return count
+
+    def has_active(self, kinds: Iterable[str]) -> bool:
+        """True when a task of one of ``kinds`` is queued or running"""
+        self.fail_stale()
+        return Task.objects.filter(kind__in=list(kinds), status__in=Task.ACTIVE_STATUSES).exists()
+
+
+# shared executor; apps register handlers in their tasks.py (imported from AppConfig.ready)
+task_executor = TaskExecutor()
+task_handler = task_executor.handler
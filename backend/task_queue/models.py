@@ -0,0 +1,73 @@
+"""
+Task Queue Models
+Persisted background tasks (scrapes, message extraction, chat analysis)
+"""
+import uuid
+
+from django.db import models
+from django.utils import timezone
+
+
+class Task(models.Model):
+    """One background task run by the TaskExecutor"""
+
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_COMPLETED, 'Completed'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+    ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+    FINISHED_STATUSES = (STATUS_COMPLETED, STATUS_FAILED)
+
+    task_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    kind = models.CharField(max_length=100)  # registered handler name, e.g. scrape_jobs
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+
+    # Progress reported by the handler
+    progress = models.IntegerField(default=0)  # 0-100
+    message = models.CharField(max_length=500, blank=True)
+
+    # Input / output
+    params = models.JSONField(default=dict, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    # Timestamps
+    created_at = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['kind', 'status'], name='task_queue_kind_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.task_id} ({self.status})"
+
+    @property
+    def is_finished(self):
+        return self.status in self.FINISHED_STATUSES
+
+    def to_dict(self):
+        return {
+            'task_id': str(self.task_id),
+            'kind': self.kind,
+            'status': self.status,
+            'progress': self.progress,
+            'message': self.message,
+            'params': self.params,
+            'result': self.result,
+            'error': self.error or None,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+        }
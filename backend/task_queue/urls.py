@@ -0,0 +1,9 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('', views.task_list, name='task_list'),
+    path('<uuid:task_id>/', views.task_detail, name='task_detail'),
+    path('<uuid:task_id>/wait/', views.task_wait, name='task_wait'),  # long-poll
+    path('<uuid:task_id>/events/', views.task_events, name='task_events'),  # Server-Sent Events
+]
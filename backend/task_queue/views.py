@@ -0,0 +1,106 @@
+"""
+Task Queue Views
+Status endpoints for background tasks: plain GET, long-poll and Server-Sent Events
+"""
+import json
+import logging
+import time
+
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+# long-poll / SSE tuning
+POLL_INTERVAL = 0.5  # seconds between DB checks
+MAX_WAIT_SECONDS = 30  # upper bound for ?timeout= on the long-poll endpoint
+SSE_HEARTBEAT_SECONDS = 15  # keep-alive comment so proxies don't close idle streams
+
+
+def _get_task(task_id):
+    return Task.objects.filter(task_id=task_id).first()
+
+
+# ========== 📋 list recent tasks ==========
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def task_list(request):
+    """Recent tasks, optionally filtered by ?kind= and ?status="""
+    try:
+        tasks = Task.objects.all()
+        if request.GET.get('kind'):
+            tasks = tasks.filter(kind=request.GET['kind'])
+        if request.GET.get('status'):
+            tasks = tasks.filter(status=request.GET['status'])
+        limit = min(int(request.GET.get('limit', 20)), 100)
+        return Response({
+            'success': True,
+            'tasks': [task.to_dict() for task in tasks[:limit]]
+        })
+    except ValueError:
+        return Response({'success': False, 'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+
+
+# ========== 🔎 task status ==========
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def task_detail(request, task_id):
+    task = _get_task(task_id)
+    if task is None:
+        return Response({'success': False, 'error': 'Task not found'}, status=status.HTTP_404_NOT_FOUND)
+    return Response({'success': True, 'task': task.to_dict()})
+
+
+# ========== ⏳ long-poll until the task changes ==========
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def task_wait(request, task_id):
+    """Return once the task changed since ?since=<updated_at> or finished (max ?timeout= seconds)"""
+    try:
+        timeout = min(float(request.GET.get('timeout', 25)), MAX_WAIT_SECONDS)
+    except ValueError:
+        return Response({'success': False, 'error': 'timeout must be a number'}, status=status.HTTP_400_BAD_REQUEST)
+    since = request.GET.get('since')
+    deadline = time.monotonic() + timeout
+    while True:
+        task = _get_task(task_id)
+        if task is None:
+            return Response({'success': False, 'error': 'Task not found'}, status=status.HTTP_404_NOT_FOUND)
+        changed = since is None or task.updated_at.isoformat() != since
+        if task.is_finished or changed or time.monotonic() >= deadline:
+            return Response({'success': True, 'changed': changed, 'task': task.to_dict()})
+        time.sleep(POLL_INTERVAL)
+
+
+# ========== 📡 SSE progress stream ==========
+def _task_event_stream(task_id):
+    last_seen = None
+    last_sent = time.monotonic()
+    while True:
+        task = _get_task(task_id)
+        if task is None:
+            yield f"event: error\ndata: {json.dumps({'error': 'Task not found'})}\n\n"
+            return
+        if task.updated_at != last_seen:
+            last_seen = task.updated_at
+            last_sent = time.monotonic()
+            yield f"event: task\ndata: {json.dumps(task.to_dict())}\n\n"
+        if task.is_finished:
+            return
+        if time.monotonic() - last_sent >= SSE_HEARTBEAT_SECONDS:
+            last_sent = time.monotonic()
+            yield ": keep-alive\n\n"
+        time.sleep(POLL_INTERVAL)
+
+
+def task_events(request, task_id):
+    """text/event-stream of task updates; closes after the final state"""
+    response = StreamingHttpResponse(_task_event_stream(task_id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
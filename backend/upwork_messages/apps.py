@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UpworkMessagesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "upwork_messages"
+
+    def ready(self):
+        # register task_queue handlers
+        from . import tasks  # noqa: F401
@@ -0,0 +1,43 @@
+"""
+Upwork Messages Tasks
+task_queue handlers for message extraction and active chat analysis
+"""
+import logging
+
+from notification_push.scraper_worker import scraper_worker
+from task_queue.executor import task_handler
+
+logger = logging.getLogger(__name__)
+
+
+@task_handler('extract_messages')
+def extract_messages(params, ctx):
+    """Extract inbox messages; the worker saves them via save_messages_to_database_api"""
+    ctx.update(5, 'Waiting for scraper worker')
+    result = scraper_worker.run(
+        'messages',
+        on_status=lambda s: ctx.update(20, 'Extracting messages') if s == 'running' else None,
+    ) or {}
+    saved = result.get('saved') or {}
+    return {
+        'success': True,
+        'messages_found': result.get('messages_found', 0),
+        'saved_messages': saved.get('saved_messages', 0),
+        'new_chats': saved.get('new_chats', 0),
+        'extraction_id': saved.get('extraction_id'),
+        'page_info': result.get('page_info'),
+    }
+
+
+@task_handler('analyze_active_chat')
+def analyze_active_chat(params, ctx):
+    """Scrape the open chat tab, then build AI suggestions and ingest interview context"""
+    from .views import _process_active_chat_result
+
+    ctx.update(5, 'Waiting for scraper worker')
+    chat_result = scraper_worker.run(
+        'active_chat',
+        on_status=lambda s: ctx.update(20, 'Reading active chat') if s == 'running' else None,
+    )
+    ctx.update(70, 'Generating AI suggestions')
+    return _process_active_chat_result(chat_result)
@@ -11,16 +11,124 @@ from rest_framework.response import Response
 from rest_framework import status
 from .models import Chat, Message, MessageExtractionLog
 from .ai_chat import chat_ai
+from task_queue.executor import task_executor
+from task_queue.models import Task
+from backend.listing import ListingError, cached_count, invalidate_counts, keyset_page
 import json
 import os
-import subprocess
 import uuid
 from django.utils import timezone
+from django.db import transaction
+from django.db.models import Count, Prefetch, Q, Sum
 from django.conf import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# rows per INSERT when bulk saving extracted messages
+BULK_BATCH_SIZE = 500
+
+
+def _parse_message_timestamp(msg_timestamp, default):
+    """Parse ISO timestamps from the extractor (trailing Z allowed)"""
+    if not msg_timestamp:
+        return default
+    try:
+        if msg_timestamp.endswith('Z'):
+            msg_timestamp = msg_timestamp[:-1] + '+00:00'
+        return timezone.datetime.fromisoformat(msg_timestamp)
+    except Exception:
+        return default
+
+
+def save_messages_bulk(messages_data):
+    """Save extracted messages in bulk; returns (saved_messages, new_chats)
+
+    Messages are grouped by conversation, missing chats are created with one
+    bulk_create, messages are bulk inserted skipping known message_ids, and each
+    touched chat gets its total/unread counts from one aggregate query.
+    """
+    now = timezone.now()
+
+    # group messages by conversation (first message of a chat provides its defaults)
+    by_chat = {}
+    for msg_data in messages_data:
+        if not isinstance(msg_data, dict):
+            continue  # malformed entry from the extractor: skip it, not the whole batch
+        chat_id = msg_data.get('conversationId') or f"chat_{msg_data.get('sender', 'unknown')}"
+        by_chat.setdefault(chat_id, []).append(msg_data)
+
+    with transaction.atomic():
+        # resolve chats: one lookup, one bulk insert for the missing ones
+        chats = {c.chat_id: c for c in Chat.objects.filter(chat_id__in=list(by_chat))}
+        missing = [
+            Chat(
+                chat_id=chat_id,
+                sender_name=msgs[0].get('sender') or 'Unknown',
+                chat_url=msgs[0].get('chatUrl') or '',
+                last_activity=now,
+            )
+            for chat_id, msgs in by_chat.items()
+            if chat_id not in chats
+        ]
+        if missing:
+            Chat.objects.bulk_create(missing, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+            chats.update({c.chat_id: c for c in Chat.objects.filter(chat_id__in=[c.chat_id for c in missing])})
+        new_chats = len(missing)
+
+        # build messages, skipping ids already stored or repeated in this batch
+        candidates = {}
+        for chat_id, msgs in by_chat.items():
+            chat = chats[chat_id]
+            for msg_data in msgs:
+                # the scraper sends null for missing fields; `or` keeps one bad value from
+                # failing the bulk insert (and the transaction with it)
+                message_id = msg_data.get('id') or f"msg_{uuid.uuid4()}"
+                if message_id in candidates:
+                    continue
+                candidates[message_id] = Message(
+                    message_id=message_id,
+                    chat=chat,
+                    sender=msg_data.get('sender') or 'Unknown',
+                    content=msg_data.get('content') or msg_data.get('text') or '',
+                    preview=(msg_data.get('preview') or '')[:500],
+                    timestamp=_parse_message_timestamp(msg_data.get('timestamp'), now),
+                    is_read=msg_data.get('isRead') is not False,
+                    selector_used=msg_data.get('selector_used') or '',
+                    html_snippet=(msg_data.get('html') or '')[:1000],
+                )
+        existing = set(Message.objects.filter(message_id__in=list(candidates)).values_list('message_id', flat=True))
+        new_messages = [m for message_id, m in candidates.items() if message_id not in existing]
+        saved_messages = 0
+        if new_messages:
+            Message.objects.bulk_create(new_messages, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+            saved_messages = Message.objects.filter(
+                message_id__in=[m.message_id for m in new_messages], extracted_at__gte=now
+            ).count()
+
+        # update chat metadata once per chat with aggregated counts
+        touched = list(chats.values())
+        counts = {
+            row['chat_id']: row
+            for row in Message.objects.filter(chat__in=touched).values('chat_id').annotate(
+                total=Count('id'), unread=Count('id', filter=Q(is_read=False))
+            )
+        }
+        for chat in touched:
+            row = counts.get(chat.pk, {})
+            chat.total_messages = row.get('total', 0)
+            chat.unread_count = row.get('unread', 0)
+            chat.last_activity = now
+            chat.updated_at = now
+        Chat.objects.bulk_update(
+            touched, ['total_messages', 'unread_count', 'last_activity', 'updated_at'], batch_size=BULK_BATCH_SIZE
+        )
+        # bulk writes send no post_save, so drop cached list counts explicitly
+        transaction.on_commit(lambda: invalidate_counts(Chat, Message))
+
+    return saved_messages, new_chats
+
+
 # ========= 💾 save from captured messages and chat to database ==========
 @api_view(['POST'])
 @permission_classes([AllowAny])
@@ -47,68 +155,7 @@ def save_messages_to_database_api(request):
             success=True
         )
         
-        saved_messages = 0
-        new_chats = 0
-        
-        # if success
-        # iterate through messages and save to DB
-        for msg_data in messages_data:
-            try:
-                # for every message create chat_id if not exists and save in models.Chat
-                chat_id = msg_data.get('conversationId') or f"chat_{msg_data.get('sender', 'unknown')}"
-                # Get or create chat
-                chat, created = Chat.objects.get_or_create(
-                    chat_id=chat_id,
-                    defaults={
-                        'sender_name': msg_data.get('sender', 'Unknown'),
-                        'chat_url': msg_data.get('chatUrl', ''),
-                        'last_activity': timezone.now(),
-                    }
-                )
-                # Increment new chat count if created
-                if created:
-                    new_chats += 1
-                
-                # Parse timestamp
-                msg_timestamp = msg_data.get('timestamp')
-                if msg_timestamp:
-                    try:
-                        if msg_timestamp.endswith('Z'):
-                            msg_timestamp = msg_timestamp[:-1] + '+00:00'
-                        parsed_time = timezone.datetime.fromisoformat(msg_timestamp)
-                    except:
-                        parsed_time = timezone.now()
-                else:
-                    parsed_time = timezone.now()
-                
-                # Create or update message
-                message_id = msg_data.get('id', f"msg_{uuid.uuid4()}")
-                message, created = Message.objects.get_or_create(
-                    message_id=message_id,
-                    chat=chat,
-                    defaults={
-                        'sender': msg_data.get('sender', 'Unknown'),
-                        'content': msg_data.get('content', msg_data.get('text', '')),
-                        'preview': msg_data.get('preview', '')[:500],
-                        'timestamp': parsed_time,
-                        'is_read': msg_data.get('isRead', True),
-                        'selector_used': msg_data.get('selector_used', ''),
-                        'html_snippet': msg_data.get('html', '')[:1000],
-                    }
-                )
-                
-                if created:
-                    saved_messages += 1
-                
-                # Update chat metadata
-                chat.total_messages = chat.messages.count()
-                chat.unread_count = chat.messages.filter(is_read=False).count()
-                chat.last_activity = timezone.now()
-                chat.save()
-                
-            except Exception as e:
-                logger.error(f"Error processing message {msg_data.get('id')}: {e}")
-                continue
+        saved_messages, new_chats = save_messages_bulk(messages_data)
         
         # Update extraction log
         extraction_log.new_messages_saved = saved_messages
@@ -139,53 +186,20 @@ def save_messages_to_database_api(request):
 @permission_classes([AllowAny])
 def extract_and_save_messages(request):
     try:
-        # Get path to message scraper = message_extractor.js
-        current_dir = os.path.dirname(__file__)
-        project_root = os.path.abspath(os.path.join(current_dir, '..', '..'))
-        scraper_dir = os.path.join(project_root, 'frontend', 'src', 'scraper')
-        message_script = os.path.join(scraper_dir, 'message_extractor.js')
-        # if not exists return error
-        if not os.path.exists(message_script):
-            return Response({
-                'success': False,
-                'message': f'Message extractor not found: {message_script}'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         # Log start
         logger.info(f"🎬 Frontend requested message extraction")
         
-        # Start scraper in background (scraper will call save_messages_to_database_api directly)
-        import threading
-        def run_extraction():
-            try:
-                result = subprocess.run(
-                    ['node', message_script],
-                    cwd=scraper_dir,
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    timeout=300  # 5 minutes timeout
-                )
-                
-                if result.returncode == 0:
-                    logger.info("✅ Message extraction orchestration completed successfully")
-                else:
-                    logger.error(f"❌ Message extraction failed: {result.stderr}")
-                
-            except subprocess.TimeoutExpired:
-                logger.error("❌ Message extraction timed out after 5 minutes")
-            except Exception as e:
-                logger.error(f"❌ Message extraction error: {str(e)}")
-        
-        # Start in background
-        extraction_thread = threading.Thread(target=run_extraction, daemon=True)
-        extraction_thread.start()
+        # Queue as a background task; it runs in the persistent scraper worker and the
+        # scraper saves through save_messages_to_database_api
+        task = task_executor.submit('extract_messages')
         
         return Response({
             'success': True,
             'message': 'Message extraction started. Scraper will save results directly to database.',
             'status': 'processing',
-            'approach': 'modernized_direct_api'
+            'task_id': str(task.task_id),
+            'status_url': f'/api/tasks/{task.task_id}/',
+            'approach': 'task_queue'
         }, status=status.HTTP_202_ACCEPTED)
         
     except Exception as e:
@@ -199,8 +213,32 @@ def extract_and_save_messages(request):
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_extraction_status(request):
-    """Get status of the most recent message extraction"""
+    """Get status of a message extraction task (?task_id=) or the most recent extraction"""
     try:
+        # ?task_id= reports that exact run instead of whichever log is newest
+        task_id = request.GET.get('task_id')
+        if task_id:
+            task = Task.objects.filter(task_id=task_id, kind='extract_messages').first()
+            if task is None:
+                return Response({
+                    'success': False,
+                    'error': 'Extraction task not found'
+                }, status=status.HTTP_404_NOT_FOUND)
+            result = task.result or {}
+            log = None
+            if result.get('extraction_id'):
+                log = MessageExtractionLog.objects.filter(extraction_id=result['extraction_id']).first()
+            return Response({
+                'success': True,
+                'status': task.status,
+                'task': task.to_dict(),
+                'extraction_id': result.get('extraction_id'),
+                'total_messages_found': log.total_messages_found if log else result.get('messages_found', 0),
+                'new_messages_saved': log.new_messages_saved if log else result.get('saved_messages', 0),
+                'page_url': log.page_url if log else None,
+                'error_message': task.error or None
+            })
+
         # Get the most recent extraction log
         latest_log = MessageExtractionLog.objects.order_by('-timestamp').first()
         
@@ -229,31 +267,64 @@ def get_extraction_status(request):
             'error': str(e)
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 # ========= 🗒️ last extraction status =========
+# columns the message serializers read (html_snippet stays unloaded)
+MESSAGE_LIST_FIELDS = (
+    'message_id', 'chat_id', 'sender', 'content', 'preview', 'timestamp',
+    'is_read', 'is_from_me', 'is_outgoing', 'extracted_at',
+)
+# latest messages embedded per chat in the chats list
+CHAT_PREVIEW_MESSAGES = 20
+
+
+def _message_to_dict(msg):
+    return {
+        'id': msg.id,
+        'message_id': msg.message_id,
+        'sender': msg.sender,
+        'content': msg.content,
+        'preview': msg.preview,
+        'timestamp': msg.timestamp.isoformat(),
+        'is_read': msg.is_read,
+        'is_from_me': msg.is_from_me,
+    }
+
+
 #=========  📱get last 200 messages =========
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_all_messages(request):
-    """Get all messages from database"""
+    """Get latest messages from database (?limit=, ?cursor= from the X-Next-Cursor header)"""
     try:
-        messages = Message.objects.all().order_by('-timestamp')[:200]  # Latest 200 messages
+        messages_query = Message.objects.only(*MESSAGE_LIST_FIELDS)
+        messages, next_cursor, _, _ = keyset_page(messages_query, request, 'timestamp', default_limit=200, max_limit=500)
         
         messages_data = []
         for message in messages:
             messages_data.append({
                 'id': message.id,
-                'chat_id': message.chat.id,
+                'chat_id': message.chat_id,
                 'content': message.content,
                 'sender': message.sender,
                 'timestamp': message.timestamp.isoformat(),
                 'is_outgoing': message.is_outgoing,
                 'is_read': message.is_read,
-                'conversation_id': message.chat.id,
-                'conversationId': message.chat.id,  # For backward compatibility
+                'conversation_id': message.chat_id,
+                'conversationId': message.chat_id,  # For backward compatibility
                 'preview': message.content[:100] + '...' if len(message.content) > 100 else message.content
             })
         
-        return Response(messages_data)
+        # body stays a plain list for existing clients; paging info goes in headers
+        response = Response(messages_data)
+        response['X-Total-Count'] = cached_count(messages_query)
+        if next_cursor:
+            response['X-Next-Cursor'] = next_cursor
+        return response
         
+    except ListingError as e:
+        return Response({
+            'error': 'Invalid pagination',
+            'message': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         logger.error(f"Error fetching messages: {str(e)}")
         return Response({
@@ -265,14 +336,21 @@ def get_all_messages(request):
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_chats_with_messages(request):
-    """Get all chats with their messages from database"""
+    """Get chats (most recent activity first, ?limit=/?cursor=) with their latest messages"""
     try:
-        chats = Chat.objects.all().prefetch_related('messages')
+        chats_query = Chat.objects.all()
+        # latest messages per chat in a single prefetch query (sliced prefetch, no per-chat queries)
+        latest_messages = Prefetch(
+            'messages',
+            queryset=Message.objects.only(*MESSAGE_LIST_FIELDS).order_by('-timestamp', '-id')[:CHAT_PREVIEW_MESSAGES],
+            to_attr='latest_messages'
+        )
+        chats, next_cursor, limit, offset = keyset_page(
+            chats_query.prefetch_related(latest_messages), request, 'last_activity', default_limit=100
+        )
         
         chats_data = []
         for chat in chats:
-            messages = chat.messages.all()[:20]  # Latest 20 messages per chat
-            
             chats_data.append({
                 'id': chat.id,
                 'chat_id': chat.chat_id,
@@ -282,28 +360,24 @@ def get_chats_with_messages(request):
                 'total_messages': chat.total_messages,
                 'unread_count': chat.unread_count,
                 'is_active': chat.is_active,
-                'messages': [
-                    {
-                        'id': msg.id,
-                        'message_id': msg.message_id,
-                        'sender': msg.sender,
-                        'content': msg.content,
-                        'preview': msg.preview,
-                        'timestamp': msg.timestamp.isoformat(),
-                        'is_read': msg.is_read,
-                        'is_from_me': msg.is_from_me,
-                    }
-                    for msg in messages
-                ]
+                'messages': [_message_to_dict(msg) for msg in chat.latest_messages]
             })
         
         return Response({
             'success': True,
             'chats': chats_data,
-            'total_chats': len(chats_data),
-            'total_unread': sum(chat['unread_count'] for chat in chats_data)
+            'total_chats': cached_count(chats_query),
+            'total_unread': chats_query.aggregate(total=Sum('unread_count'))['total'] or 0,
+            'limit': limit,
+            'offset': offset,
+            'next_cursor': next_cursor
         })
         
+    except ListingError as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         logger.error(f"Error getting chats: {str(e)}")
         return Response({
@@ -315,61 +389,55 @@ def get_chats_with_messages(request):
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_chat_messages(request, chat_id):
-    """Get all messages for specific chat"""
+    """Get messages for specific chat (oldest first, ?limit=/?cursor= for long conversations)"""
     try:
         chat = Chat.objects.get(chat_id=chat_id)
-        messages = chat.messages.all().order_by('timestamp')  # Chronological order (oldest first)
+        messages_query = Message.objects.filter(chat=chat).only(*MESSAGE_LIST_FIELDS)
+        # total/unread are kept up to date on the chat row by save_messages_bulk
+        chat_data = {
+            'id': chat.id,
+            'chat_id': chat.chat_id,
+            'conversation_id': chat.chat_id,
+            'other_participant': chat.sender_name,
+            'chat_url': chat.chat_url,
+            'total_messages': chat.total_messages,
+            'unread_count': chat.unread_count,
+        }
         
         # Vrati i informacije o chat-u
         if request.path.endswith(f'/chats/{chat_id}/'):
             # Request za chat info
+            last_message = messages_query.order_by('-timestamp', '-id').first()
+            chat_data['last_message'] = {
+                'content': last_message.content if last_message else '',
+                'timestamp': last_message.timestamp.isoformat() if last_message else '',
+                'sender': last_message.sender if last_message else ''
+            }
             return Response({
                 'success': True,
-                'chat': {
-                    'id': chat.id,
-                    'chat_id': chat.chat_id,
-                    'conversation_id': chat.conversation_id,
-                    'other_participant': chat.other_participant,
-                    'chat_url': chat.chat_url,
-                    'total_messages': messages.count(),
-                    'unread_count': messages.filter(is_read=False).count(),
-                    'last_message': {
-                        'content': messages.last().content if messages.exists() else '',
-                        'timestamp': messages.last().timestamp.isoformat() if messages.exists() else '',
-                        'sender': messages.last().sender if messages.exists() else ''
-                    }
-                }
+                'chat': chat_data
             })
         else:
-            # Request za messages
+            # Request za messages, chronological order (oldest first)
+            messages, next_cursor, limit, offset = keyset_page(
+                messages_query, request, 'timestamp', descending=False, default_limit=500, max_limit=1000
+            )
             messages_data = [
-                {
-                    'id': msg.id,
-                    'message_id': msg.message_id,
-                    'sender': msg.sender,
-                    'content': msg.content,
-                    'preview': msg.preview,
-                    'timestamp': msg.timestamp.isoformat(),
-                    'is_read': msg.is_read,
-                    'is_from_me': msg.is_from_me,
-                    'is_outgoing': msg.is_from_me,  # Add compatibility field
-                    'extracted_at': msg.extracted_at.isoformat(),
-                }
+                dict(
+                    _message_to_dict(msg),
+                    is_outgoing=msg.is_from_me,  # Add compatibility field
+                    extracted_at=msg.extracted_at.isoformat(),
+                )
                 for msg in messages
             ]
             
             return Response({
                 'success': True,
-                'chat': {
-                    'id': chat.id,
-                    'chat_id': chat.chat_id,
-                    'conversation_id': chat.conversation_id,
-                    'other_participant': chat.other_participant,
-                    'chat_url': chat.chat_url,
-                    'total_messages': messages.count(),
-                    'unread_count': messages.filter(is_read=False).count(),
-                },
-                'messages': messages_data
+                'chat': chat_data,
+                'messages': messages_data,
+                'limit': limit,
+                'offset': offset,
+                'next_cursor': next_cursor
             })
         
     except Chat.DoesNotExist:
@@ -377,6 +445,11 @@ def get_chat_messages(request, chat_id):
             'success': False,
             'error': 'Chat not found'
         }, status=status.HTTP_404_NOT_FOUND)
+    except ListingError as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         logger.error(f"Error getting chat messages: {str(e)}")
         return Response({
@@ -546,201 +619,109 @@ def open_message_in_chrome(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 # ========  🛸💬🗣️ active chat scraper =========
+def _process_active_chat_result(chat_result):
+    """Turn active_chat_scraper output into the analyze_active_chat payload"""
+    chat_result = chat_result or {}
+    if not chat_result.get('success'):
+        return {
+            'success': False,
+            'error': chat_result.get('error', 'Unknown error from scraper'),
+            'details': chat_result.get('details')
+        }
+
+    # The scraper returns data directly in the main object
+    chat_data = {
+        'url': chat_result.get('url'),
+        'chatTitle': chat_result.get('chatTitle'),
+        'projectTitle': chat_result.get('projectTitle'),
+        'participants': chat_result.get('participants', []),
+        'messages': chat_result.get('messages', []),
+        'extractedAt': chat_result.get('extractedAt'),
+        'messageCount': chat_result.get('messageCount')
+    }
+
+    # Generate AI suggestions based on chat content
+    suggestions = generate_ai_suggestions(chat_data)
+
+    # 🤖 AI INTERVIEW INTEGRATION 🤖
+    # Send chat data to AI Interview Chat system for context ingestion
+    interview_context_id = None
+    ai_interview_error = None
+    try:
+        from AI_interview_chat.views import ingest_chat_context
+        from django.test import RequestFactory
+
+        # Create a fake request to call ingest_chat_context
+        factory = RequestFactory()
+        interview_request = factory.post('/api/interview/ingest-chat-context/',
+                                         data=json.dumps(chat_data),
+                                         content_type='application/json')
+        interview_request.data = chat_data
+
+        logger.info(f"Calling AI Interview ingest_chat_context...")
+        logger.info(f"Messages count: {len(chat_data.get('messages', []))}")
+
+        # Call AI interview context ingestion
+        interview_response = ingest_chat_context(interview_request)
+        logger.info(f"AI Interview response status: {interview_response.status_code}")
+
+        if interview_response.status_code in [200, 201]:
+            interview_data = interview_response.data
+            if interview_data.get('success'):
+                interview_context_id = interview_data.get('data', {}).get('context_id')
+                logger.info(f"✅ Chat context ingested to AI Interview system: {interview_context_id}")
+            else:
+                ai_interview_error = interview_data.get('error', 'Unknown error from AI Interview system')
+                logger.warning(f"⚠️ AI Interview system returned error: {ai_interview_error}")
+        else:
+            ai_interview_error = f"HTTP {interview_response.status_code}"
+            logger.warning(f"⚠️ AI Interview HTTP error: {ai_interview_error}")
+
+    except Exception as e:
+        ai_interview_error = str(e)
+        logger.warning(f"⚠️ Failed to ingest chat context to AI Interview system: {ai_interview_error}")
+        import traceback
+        logger.warning(f"Traceback: {traceback.format_exc()}")
+
+    return {
+        'success': True,
+        'message': 'Active chat analyzed successfully',
+        'data': {
+            'chatData': chat_data,
+            'suggestions': suggestions,
+            'messageCount': len(chat_data.get('messages', [])),
+            'conversationId': chat_data.get('conversationId'),
+            'participants': chat_data.get('participants', []),
+            # 🎯 AI Interview Integration
+            'aiInterview': {
+                'contextIngested': interview_context_id is not None,
+                'contextId': interview_context_id,
+                'canCreateInterview': interview_context_id is not None,
+                'interviewApiBase': '/api/interview/',
+                'error': ai_interview_error if ai_interview_error else None
+            }
+        }
+    }
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def analyze_active_chat(request):
 
     try:
-        # start active chat scraper in path ../frontend/src/scraper/active_chat_scraper.js
-        current_dir = os.path.dirname(__file__)
-        project_root = os.path.abspath(os.path.join(current_dir, '..', '..'))
-        scraper_dir = os.path.join(project_root, 'frontend', 'src', 'scraper')
-        chat_script = os.path.join(scraper_dir, 'active_chat_scraper.js')
-        
-        if not os.path.exists(chat_script):
-            return Response({
-                'success': False,
-                'error': f'Active chat scraper not found: {chat_script}'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
-        logger.info(f"🤖 Running active chat analysis with: {chat_script}")
-        
-        # Run active chat scraper
-        cmd_args = ['node', chat_script]
-        
-        logger.info(f"Running scraper command: {' '.join(cmd_args)}")
-        logger.info(f"Working directory: {scraper_dir}")
-        
-        try:
-            result = subprocess.run(
-                cmd_args,
-                cwd=scraper_dir,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=120  # Povećano na 120 sekundi (2 minuta)
-            )
-        except subprocess.TimeoutExpired as e:
-            logger.error(f"❌ Scraper timeout after 120 seconds")
-            return Response({
-                'success': False,
-                'error': 'Chat analysis timed out after 2 minutes. Please try again.'
-            }, status=status.HTTP_408_REQUEST_TIMEOUT)
-        except Exception as e:
-            logger.error(f"❌ Scraper execution error: {str(e)}")
-            return Response({
-                'success': False,
-                'error': f'Scraper execution failed: {str(e)}'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
-        if result.returncode == 0:
-            logger.info("✅ Active chat analysis completed successfully")
-            logger.info(f"Output length: {len(result.stdout)}")
-            logger.info(f"Output: '{result.stdout}'")
-            logger.info(f"STDERR: '{result.stderr}'")
-            
-            try:
-                # Parse JSON output from scraper
-                import json
-                stripped_output = result.stdout.strip()
-                logger.info(f"Stripped output length: {len(stripped_output)}")
-                
-                # Extract JSON part from output (starts with '{')
-                json_start = stripped_output.find('{')
-                if json_start != -1:
-                    json_part = stripped_output[json_start:]
-                    logger.info(f"JSON part: '{json_part[:200]}...'")
-                    chat_result = json.loads(json_part)
-                else:
-                    logger.error("No JSON found in scraper output")
-                    return Response({
-                        'success': False,
-                        'error': 'No JSON found in scraper output',
-                        'debug': {'stdout': result.stdout}
-                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-                
-                if chat_result.get('success'):
-                    # The scraper returns data directly in the main object
-                    chat_data = {
-                        'url': chat_result.get('url'),
-                        'chatTitle': chat_result.get('chatTitle'),
-                        'projectTitle': chat_result.get('projectTitle'),
-                        'participants': chat_result.get('participants', []),
-                        'messages': chat_result.get('messages', []),
-                        'extractedAt': chat_result.get('extractedAt'),
-                        'messageCount': chat_result.get('messageCount')
-                    }
-                    
-                    # Generate AI suggestions based on chat content
-                    suggestions = generate_ai_suggestions(chat_data)
-                    
-                    # 🤖 AI INTERVIEW INTEGRATION 🤖
-                    # Send chat data to AI Interview Chat system for context ingestion
-                    interview_context_id = None
-                    ai_interview_error = None
-                    try:
-                        from AI_interview_chat.views import ingest_chat_context
-                        from django.test import RequestFactory
-                        import json
-                        
-                        # Create a fake request to call ingest_chat_context
-                        factory = RequestFactory()
-                        interview_request = factory.post('/api/interview/ingest-chat-context/', 
-                                                       data=json.dumps(chat_data), 
-                                                       content_type='application/json')
-                        interview_request.data = chat_data
-                        
-                        logger.info(f"Calling AI Interview ingest_chat_context...")
-                        logger.info(f"Chat data keys: {list(chat_data.keys())}")
-                        logger.info(f"Messages count: {len(chat_data.get('messages', []))}")
-                        
-                        # Call AI interview context ingestion
-                        interview_response = ingest_chat_context(interview_request)
-                        logger.info(f"AI Interview response status: {interview_response.status_code}")
-                        logger.info(f"AI Interview response data: {interview_response.data}")
-                        
-                        if interview_response.status_code in [200, 201]:
-                            interview_data = interview_response.data
-                            if interview_data.get('success'):
-                                interview_context_id = interview_data.get('data', {}).get('context_id')
-                                logger.info(f"✅ Chat context ingested to AI Interview system: {interview_context_id}")
-                            else:
-                                ai_interview_error = interview_data.get('error', 'Unknown error from AI Interview system')
-                                logger.warning(f"⚠️ AI Interview system returned error: {ai_interview_error}")
-                        else:
-                            ai_interview_error = f"HTTP {interview_response.status_code}"
-                            logger.warning(f"⚠️ AI Interview HTTP error: {ai_interview_error}")
-                        
-                    except Exception as e:
-                        ai_interview_error = str(e)
-                        logger.warning(f"⚠️ Failed to ingest chat context to AI Interview system: {ai_interview_error}")
-                        import traceback
-                        logger.warning(f"Traceback: {traceback.format_exc()}")
-                    
-                    return Response({
-                        'success': True,
-                        'message': 'Active chat analyzed successfully',
-                        'data': {
-                            'chatData': chat_data,
-                            'suggestions': suggestions,
-                            'messageCount': len(chat_data.get('messages', [])),
-                            'conversationId': chat_data.get('conversationId'),
-                            'participants': chat_data.get('participants', []),
-                            # 🎯 AI Interview Integration
-                            'aiInterview': {
-                                'contextIngested': interview_context_id is not None,
-                                'contextId': interview_context_id,
-                                'canCreateInterview': interview_context_id is not None,
-                                'interviewApiBase': '/api/interview/',
-                                'error': ai_interview_error if ai_interview_error else None,
-                                'debug': f'interview_context_id={interview_context_id}, ai_interview_error={ai_interview_error}'
-                            }
-                        }
-                    })
-                else:
-                    return Response({
-                        'success': False,
-                        'error': chat_result.get('error', 'Unknown error from scraper')
-                    }, status=status.HTTP_400_BAD_REQUEST)
-                    
-            except json.JSONDecodeError as parse_error:
-                logger.error(f"Error parsing chat scraper output: {parse_error}")
-                logger.error(f"Raw output length: {len(result.stdout)}")
-                logger.error(f"Raw output: '{result.stdout}'")
-                logger.error(f"Raw stderr: '{result.stderr}'")
-                return Response({
-                    'success': False,
-                    'error': f'Error parsing scraper output: {str(parse_error)}',
-                    'debug': {
-                        'stdout': result.stdout,
-                        'stderr': result.stderr,
-                        'stdout_length': len(result.stdout)
-                    }
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-                
-        else:
-            logger.error(f"❌ Active chat analysis failed with return code: {result.returncode}")
-            logger.error(f"STDOUT: {result.stdout}")
-            logger.error(f"STDERR: {result.stderr}")
-            
-            return Response({
-                'success': False,
-                'error': f'Chat analysis failed: {result.stderr or "Unknown error"}',
-                'debug': {
-                    'returncode': result.returncode,
-                    'stdout': result.stdout,
-                    'stderr': result.stderr
-                }
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            
-    except subprocess.TimeoutExpired:
-        logger.error("❌ Active chat analysis timed out")
+        # queue as a background task: the persistent scraper worker reads the open chat
+        # tab, then suggestions + AI interview ingestion run in the task
+        task = task_executor.submit('analyze_active_chat')
+        logger.info(f"🤖 Active chat analysis queued as task {task.task_id}")
+
         return Response({
-            'success': False,
-            'error': 'Chat analysis timed out after 30 seconds'
-        }, status=status.HTTP_408_REQUEST_TIMEOUT)
-        
+            'success': True,
+            'message': 'Active chat analysis started',
+            'task_id': str(task.task_id),
+            'status': task.status,
+            'status_url': f'/api/tasks/{task.task_id}/'
+        }, status=status.HTTP_202_ACCEPTED)
+
     except Exception as e:
         logger.error(f"❌ Unexpected error during chat analysis: {str(e)}")
         return Response({
@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import axios from 'axios';
+import { waitForTask } from '../utils/tasks';
 import './ActiveChatAnalysisPage.css';
 
 const ActiveChatAnalysisPage = ({ chatData: passedChatData, suggestions: passedSuggestions, onBack }) => {
@@ -53,25 +54,25 @@ const ActiveChatAnalysisPage = ({ chatData: passedChatData, suggestions: passedS
       setLoading(true);
       setError(null);
       
-      const response = await axios.post('/api/messages/ai/analyze-active-chat/', {}, {
-        timeout: 180000 // 3 minute timeout
-      });
+      const started = await axios.post('/api/messages/ai/analyze-active-chat/');
+      // wait for the background task (3 minute timeout)
+      const result = await waitForTask(started.data.task_id, { timeout: 180000 });
       
-      if (response.data.success) {
-        setChatData(response.data.data.chatData);
-        setSuggestions(response.data.data.suggestions || []);
+      if (result.success) {
+        setChatData(result.data.chatData);
+        setSuggestions(result.data.suggestions || []);
         
         // Check for AI Interview data
-        if (response.data.data.aiInterview) {
-          setAiInterviewData(response.data.data.aiInterview);
+        if (result.data.aiInterview) {
+          setAiInterviewData(result.data.aiInterview);
           // Don't automatically set session as created from analysis
           setInterviewSessionCreated(false);
         }
       } else {
-        setError(response.data.error || 'Failed to analyze chat');
+        setError(result.error || 'Failed to analyze chat');
       }
     } catch (err) {
-      setError(err.response?.data?.error || 'Network error occurred');
+      setError(err.response?.data?.error || err.message || 'Network error occurred');
       console.error('Analysis error:', err);
     } finally {
       setLoading(false);
@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react'
 import axios from 'axios'
 import { openInExternalBrowser, copyToClipboard } from '../utils/browserUtils'
 import AIChatPanel from './AIChatPanel'
+import { waitForTask } from '../utils/tasks'
 
 export default function MessagePanel({ onOpenChat, onOpenChatAnalysis }) {
   const [messages, setMessages] = useState([])
@@ -63,10 +64,11 @@ export default function MessagePanel({ onOpenChat, onOpenChatAnalysis }) {
       console.log('🤖 Analyzing active chat in Chrome debugger...')
       
       // Call endpoint to scrape active chat
-      const response = await axios.post('/api/messages/ai/analyze-active-chat/')
+      const started = await axios.post('/api/messages/ai/analyze-active-chat/')
+      const result = await waitForTask(started.data.task_id)
       
-      if (response.data.success) {
-        const responseData = response.data.data
+      if (result.success) {
+        const responseData = result.data
         console.log('✅ Active chat analyzed:', responseData)
         
         // Open new page with analysis data
@@ -77,7 +79,7 @@ export default function MessagePanel({ onOpenChat, onOpenChatAnalysis }) {
           })
         }
       } else {
-        alert(`❌ Failed to analyze chat: ${response.data.error}`)
+        alert(`❌ Failed to analyze chat: ${result.error}`)
       }
     } catch (error) {
       console.error('❌ Error analyzing active chat:', error)
@@ -93,13 +95,14 @@ export default function MessagePanel({ onOpenChat, onOpenChatAnalysis }) {
     
     try {
       setAiLoading(true)
-      const response = await axios.post('/api/messages/ai/analyze-active-chat/')
+      const started = await axios.post('/api/messages/ai/analyze-active-chat/')
+      const result = await waitForTask(started.data.task_id)
       
-      if (response.data.success) {
-        const responseData = response.data.data
+      if (result.success) {
+        const responseData = result.data
         setAiSuggestions(responseData.suggestions || [])
       } else {
-        alert(`❌ Failed to regenerate suggestions: ${response.data.error}`)
+        alert(`❌ Failed to regenerate suggestions: ${result.error}`)
       }
     } catch (error) {
       console.error('❌ Error regenerating suggestions:', error)
@@ -192,15 +195,15 @@ export default function MessagePanel({ onOpenChat, onOpenChatAnalysis }) {
       const response = await axios.post('http://localhost:8000/api/messages/extract/')
       
       if (response.data.success) {
-        const extractedMessages = response.data.messages || []
-        setMessages(extractedMessages)
-        groupMessagesByChat(extractedMessages)
+        // Wait for the background task, then reload what it saved
+        const result = await waitForTask(response.data.task_id, { timeout: 300000 })
         setLastExtracted(new Date().toLocaleString())
         
-        // Refresh chats from database
+        // Refresh messages and chats from database
+        await loadStoredMessages()
         await loadChatsFromDatabase()
         
-        console.log('✅ Uspešno ekstraktovano', extractedMessages.length, 'poruka')
+        console.log('✅ Uspešno ekstraktovano', result.messages_found, 'poruka')
       } else {
         alert(`Message extraction failed: ${response.data.message}`)
       }
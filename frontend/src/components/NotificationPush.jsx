@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react'
 import axios from 'axios'
+import { waitForTask } from '../utils/tasks'
 
 export default function NotificationPush() {
   const [jobs, setJobs] = useState([])
@@ -21,6 +22,26 @@ export default function NotificationPush() {
     checkStatus()
   }, [])
 
+  // Live notifications: new jobs are pushed over SSE instead of polling
+  useEffect(() => {
+    const source = new EventSource('/api/notification-push/notifications/stream/')
+    source.addEventListener('notifications', (event) => {
+      const data = JSON.parse(event.data)
+      data.notifications.forEach(notif => addLog('info', notif.title))
+      addLog('info', `${data.unread_count} unread notifications`)
+    })
+    source.addEventListener('jobs', (event) => {
+      const data = JSON.parse(event.data)
+      // same list get_jobs returns: jobs saved by the latest scrape session
+      setJobs(data.jobs || [])
+      checkExistingJobs(data.jobs || [])
+      addLog('success', `Received ${data.jobs?.length || 0} new jobs`)
+    })
+    // stream could not continue from the last event (server restart) - refetch once
+    source.addEventListener('resync', () => fetchJobs())
+    return () => source.close()
+  }, [])
+
   const checkStatus = async () => {
     try {
       const response = await axios.get('/api/notification-push/status/')
@@ -71,8 +92,9 @@ export default function NotificationPush() {
       addLog('info', 'Manual scrape (logged-in) triggered')
       const response = await axios.post('/api/notification-push/manual-scrape/')
       addLog('info', response.data.message || 'Manual scrape triggered')
-      // Refresh jobs after manual scrape
-      setTimeout(fetchJobs, 2000)
+      // Wait for the background task; new jobs arrive on the notification stream
+      const result = await waitForTask(response.data.task_id)
+      addLog('success', result.message)
     } catch (error) {
       addLog('error', `Manual scrape failed: ${error.message}`)
     }
@@ -83,8 +105,9 @@ export default function NotificationPush() {
       addLog('info', 'Universal DOM scrape triggered')
       const response = await axios.post('/api/notification-push/universal-scrape/')
       addLog('info', response.data.message || 'Universal scrape triggered')
-      // Refresh jobs after universal scrape
-      setTimeout(fetchJobs, 2000)
+      // Wait for the background task; new jobs arrive on the notification stream
+      const result = await waitForTask(response.data.task_id)
+      addLog('success', result.message)
     } catch (error) {
       addLog('error', `Universal scrape failed: ${error.message}`)
     }
@@ -101,29 +124,28 @@ export default function NotificationPush() {
       if (extractResponse.data.success) {
         addLog('info', 'Message extraction started in background...')
         
-        // Wait a bit for extraction to complete, then fetch messages
-        setTimeout(async () => {
-          try {
-            const messagesResponse = await axios.get('/api/messages/messages/')
-            const extractedMessages = messagesResponse.data || []
-            setMessages(extractedMessages)
-            addLog('success', `✅ Extracted ${extractedMessages.length} messages from Upwork`)
-            
-            // Log message details
-            if (extractedMessages.length > 0) {
-              extractedMessages.slice(0, 3).forEach((msg, index) => {
-                addLog('info', `Message ${index + 1}: ${msg.sender} - ${msg.preview.substring(0, 50)}...`)
-              })
-              if (extractedMessages.length > 3) {
-                addLog('info', `... and ${extractedMessages.length - 3} more messages`)
-              }
+        try {
+          // Wait for the background task to finish, then fetch messages
+          await waitForTask(extractResponse.data.task_id, { timeout: 300000 })
+          const messagesResponse = await axios.get('/api/messages/messages/')
+          const extractedMessages = messagesResponse.data || []
+          setMessages(extractedMessages)
+          addLog('success', `✅ Extracted ${extractedMessages.length} messages from Upwork`)
+          
+          // Log message details
+          if (extractedMessages.length > 0) {
+            extractedMessages.slice(0, 3).forEach((msg, index) => {
+              addLog('info', `Message ${index + 1}: ${msg.sender} - ${msg.preview.substring(0, 50)}...`)
+            })
+            if (extractedMessages.length > 3) {
+              addLog('info', `... and ${extractedMessages.length - 3} more messages`)
             }
-          } catch (fetchError) {
-            addLog('error', `Failed to fetch extracted messages: ${fetchError.message}`)
-          } finally {
-            setScrapingMessages(false)
           }
-        }, 5000) // Wait 5 seconds for extraction to complete
+        } catch (fetchError) {
+          addLog('error', `Failed to fetch extracted messages: ${fetchError.message}`)
+        } finally {
+          setScrapingMessages(false)
+        }
         
       } else {
         addLog('error', `Message extraction failed: ${extractResponse.data.message}`)
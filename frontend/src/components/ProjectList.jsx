@@ -4,6 +4,7 @@ import ProjectModal from './ProjectModal'
 import SkillsInput from './SkillsInput'
 import SkillsetsPanel from './SkillsetsPanel'
 import ManualIngest from './ManualIngest'
+import { waitForTask } from '../utils/tasks'
 
 export default function ProjectList(){
   const [projects, setProjects] = useState([])
@@ -17,12 +18,17 @@ export default function ProjectList(){
   const [hasNext, setHasNext] = useState(false)
   const [hasPrevious, setHasPrevious] = useState(false)
   const [loading, setLoading] = useState(false)
+  const [bulkStatus, setBulkStatus] = useState('')
+  // What the pager pages through: null = all jobs, { skills } = skill search, { skillset } = saved skillset
+  const [searchSource, setSearchSource] = useState(null)
   
   const jobsPerPage = 20
+  const bulkCoverCount = 20
 
   // Load jobs from notification-push database
   const loadJobs = async (page = 1) => {
     setLoading(true)
+    setSearchSource(null)
     try {
       const offset = (page - 1) * jobsPerPage
       const res = await axios.get(`/api/notification-push/jobs/all/?limit=${jobsPerPage}&offset=${offset}`)
@@ -63,22 +69,71 @@ export default function ProjectList(){
     loadJobs(1)
   }, [])
 
-  const doSearch = async (skillsStr)=>{
+  // Search results are paged on the backend; X-Total-Count carries the number of matches
+  const showSearchPage = (res, rows, page, offset)=>{
+    const total = Number(res.headers['x-total-count'] ?? rows.length)
+    setProjects(rows)
+    setCurrentPage(page)
+    setTotalCount(total)
+    setHasNext(offset + rows.length < total)
+    setHasPrevious(offset > 0)
+  }
+
+  const doSearch = async (skillsStr, page = 1)=>{
+    setLoading(true)
     try{
-      const res = await axios.post('/api/projects/search/', { skills: skillsStr })
-      setProjects(res.data)
-      // Reset pagination when searching
-      setCurrentPage(1)
-      setTotalCount(res.data.length)
-      setHasNext(false)
-      setHasPrevious(false)
+      const offset = (page - 1) * jobsPerPage
+      const res = await axios.post('/api/projects/search/', { skills: skillsStr, limit: jobsPerPage, offset })
+      setSearchSource({ skills: skillsStr })
+      showSearchPage(res, res.data, page, offset)
     }catch(e){
       console.error('Error searching projects:', e.message)
     }
+    setLoading(false)
   }
 
-  const onUseSkillset = (skillset)=>{
-    doSearch(skillset.skills)
+  const onUseSkillset = async (skillset, page = 1)=>{
+    // Saved skillsets have precomputed scores - read them ranked from the backend
+    setLoading(true)
+    try{
+      const offset = (page - 1) * jobsPerPage
+      const res = await axios.get(`/api/skillsets/${skillset.id}/projects/?limit=${jobsPerPage}&offset=${offset}`)
+      setSearchSource({ skillset })
+      showSearchPage(res, res.data.map(p => ({...p, match_score: p.skillset_score})), page, offset)
+    }catch(e){
+      console.error('Error loading skillset ranking:', e.message)
+      doSearch(skillset.skills, page)
+    }
+    setLoading(false)
+  }
+
+  const loadPage = (page)=>{
+    if (searchSource?.skillset) {
+      onUseSkillset(searchSource.skillset, page)
+    } else if (searchSource) {
+      doSearch(searchSource.skills, page)
+    } else {
+      loadJobs(page)
+    }
+  }
+
+  // Queue cover letters for the best-matching projects and follow the task's progress
+  const generateTopCovers = async ()=>{
+    setBulkStatus('Queuing cover letters...')
+    try{
+      const started = await axios.post('/api/projects/generate_covers/', { top_n: bulkCoverCount })
+      if(!started.data.task_id){
+        setBulkStatus(started.data.message)
+        return
+      }
+      const result = await waitForTask(started.data.task_id, {
+        timeout: 900000,
+        onProgress: (task) => setBulkStatus(`${task.message || 'Working'} (${task.progress}%)`)
+      })
+      setBulkStatus(`Done: ${result.generated} generated, ${result.cached} from cache, ${result.failed} failed`)
+    }catch(e){
+      setBulkStatus(`Cover letter batch failed: ${e.message}`)
+    }
   }
 
   const onManualSearch = ()=>{
@@ -87,13 +142,13 @@ export default function ProjectList(){
 
   const handlePreviousPage = () => {
     if (hasPrevious && currentPage > 1) {
-      loadJobs(currentPage - 1)
+      loadPage(currentPage - 1)
     }
   }
 
   const handleNextPage = () => {
     if (hasNext) {
-      loadJobs(currentPage + 1)
+      loadPage(currentPage + 1)
     }
   }
 
@@ -117,6 +172,10 @@ export default function ProjectList(){
             <button onClick={() => loadJobs(1)} style={{marginLeft: 10}}>
               Load All Jobs
             </button>
+            <button onClick={generateTopCovers} style={{marginLeft: 10}} title="Generate cover letters for the best-matching projects">
+              Cover letters for top {bulkCoverCount}
+            </button>
+            {bulkStatus && <span style={{marginLeft: 8, color: '#555'}}>{bulkStatus}</span>}
           </div>
           <div style={{marginTop:12}}>
             <ManualIngest onIngested={(p)=> {
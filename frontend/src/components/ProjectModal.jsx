@@ -1,11 +1,17 @@
-import React, {useState, useEffect} from 'react'
+import React, {useState, useEffect, useRef} from 'react'
 import axios from 'axios'
+import { postEventStream } from '../utils/stream'
 
 export default function ProjectModal({project, onClose, onSaved}){
   const [cover, setCover] = useState(project.cover_letter || '')
   const [loading, setLoading] = useState(false)
   const [mode, setMode] = useState('zephyr') // general | local | openai | deepseak | ollama | zephyr
   const [loadingText, setLoadingText] = useState('Generating...')
+  const [streaming, setStreaming] = useState(false)
+  const streamRef = useRef(null)
+
+  // closing the modal aborts a running stream so the backend stops generating
+  useEffect(() => () => streamRef.current?.abort(), [])
 
   // Load scraped jobs when modal opens
   useEffect(() => {
@@ -15,7 +21,8 @@ export default function ProjectModal({project, onClose, onSaved}){
   // Remove scraped jobs functions since we don't need browse functionality
   // Jobs are now saved directly from NotificationPush component
 
-  const generate = async ()=>{
+  // regenerate=true skips the backend generation cache and samples a new letter
+  const generate = async (regenerate = false)=>{
     setLoading(true)
     const modelNames = {
       general: 'General AI',
@@ -28,32 +35,52 @@ export default function ProjectModal({project, onClose, onSaved}){
     setLoadingText(`Generating with ${modelNames[mode] || 'AI'} model...`)
     
     if (mode === 'zephyr') {
-      // Use new Django AI endpoint instead of old Zephyr API proxy
+      // Stream the letter token by token from the Django AI endpoint
+      const controller = new AbortController()
+      streamRef.current = controller
+      let text = ''
       try {
-        const res = await axios.post('/api/ai/generate-cover-letter/', {
+        await postEventStream('/api/ai/generate-cover-letter/stream/', {
           job_title: project.title,
           company_name: project.client || '',
           job_description: project.description || '',
-          skills: project.skills_required || 'Python, React, JavaScript'
+          skills: project.skills_required || 'Python, React, JavaScript',
+          regenerate
+        }, {
+          signal: controller.signal,
+          onEvent: (type, data) => {
+            if (type === 'status') {
+              setLoadingText('Loading T5 Cover Genie model...')
+            } else if (type === 'token') {
+              if (!text) {
+                // first token: hide the overlay and show the letter as it is written
+                setLoading(false)
+                setStreaming(true)
+              }
+              text += data.text
+              setCover(text)
+            } else if (type === 'done') {
+              setCover(data.cover_letter)
+              onSaved({...project, cover_letter: data.cover_letter, status: 'proposal_ready'})
+            } else if (type === 'error') {
+              throw new Error(data.error)
+            }
+          }
         })
-        
-        if (res.data && res.data.success) {
-          setCover(res.data.cover_letter)
-          onSaved({...project, cover_letter: res.data.cover_letter, status: 'proposal_ready'})
-        } else {
+      } catch (error) {
+        if (error.name !== 'AbortError') {
           // Show error in textarea instead of just loading text
-          const errorMessage = res.data?.error || 'AI Cover Letter generation failed. Please try again.'
-          setCover(`Error: ${errorMessage}`)
+          setCover(`Error: ${error.message || 'AI Cover Letter generation failed. Please try again.'}`)
           setLoadingText('T5 Cover Genie generation failed. Please try again.')
           setTimeout(() => setLoadingText('Generating...'), 3000)
         }
-      } catch (error) {
-        setLoadingText('Django AI endpoint connection failed. Please ensure backend is running on port 8000.')
-        setTimeout(() => setLoadingText('Generating...'), 3000)
+      } finally {
+        streamRef.current = null
+        setStreaming(false)
       }
     } else {
       // Use existing Django backend
-      const res = await axios.post(`/api/projects/${project.id}/generate_cover/`, {skills: project.skills_required, mode}).catch(()=>null)
+      const res = await axios.post(`/api/projects/${project.id}/generate_cover/`, {skills: project.skills_required, mode, regenerate}).catch(()=>null)
       if(res && res.data){
         setCover(res.data.cover_letter)
         onSaved({...project, cover_letter: res.data.cover_letter, status: 'proposal_ready'})
@@ -145,9 +172,14 @@ export default function ProjectModal({project, onClose, onSaved}){
 
             <textarea value={cover} onChange={(e)=>setCover(e.target.value)} rows={8} style={{width:'100%'}} />
             <div style={{marginTop:10}}>
-              <button onClick={generate} disabled={loading}>
+              <button onClick={() => generate()} disabled={loading || streaming}>
                 {loading ? 'Generating...' : 'Generate cover letter'}
               </button>
+              {cover && (
+                <button onClick={() => generate(true)} disabled={loading || streaming} style={{marginLeft:8}} title="Skip the cached letter and generate a new one">
+                  Regenerate
+                </button>
+              )}
               <button onClick={()=>{onSaved({...project, cover_letter:cover}); alert('Saved locally')}} style={{marginLeft:8}}>Save</button>
               <button onClick={sendToMonday} style={{marginLeft:8}}>Send to Monday</button>
             </div>
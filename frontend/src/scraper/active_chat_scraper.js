@@ -8,14 +8,15 @@
 const puppeteerCore = require('puppeteer-core');
 
 // ================================= 🛸💬scrape active chat ==============================
-async function scrapeActiveChatContent() {
+// sharedBrowser: optional already-connected browser (scraper_worker.js keeps one open)
+async function scrapeActiveChatContent(sharedBrowser = null) {
     try {
         // log
         console.log('🤖 Connecting to Chrome debugger for active chat analysis...');
         
         // variable to hold browser and retry
-        let browser;
-        let retries = 3;
+        let browser = sharedBrowser;
+        let retries = sharedBrowser ? 0 : 3;
         
         // 3 tries to connect to Chrome debugger
         while (retries > 0) {
@@ -81,7 +82,7 @@ async function scrapeActiveChatContent() {
                 chatData: null
             };
             console.log(JSON.stringify(result));
-            return;
+            return result;
         }
 
         console.log('✅ Found active chat page:', activeChatPage.url());
@@ -203,7 +204,8 @@ async function scrapeActiveChatContent() {
         // Output the result as JSON
         console.log(JSON.stringify(chatData, null, 2));
         
-        await browser.disconnect();
+        if (!sharedBrowser) await browser.disconnect();
+        return chatData;
 
     } catch (error) {
         console.error('Error in scrapeActiveChatContent:', error);
@@ -213,6 +215,7 @@ async function scrapeActiveChatContent() {
             details: error.message
         };
         console.log(JSON.stringify(errorResult));
+        if (sharedBrowser) return errorResult;
         process.exit(1);
     }
 }
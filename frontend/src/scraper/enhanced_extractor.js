@@ -71,14 +71,15 @@ async function saveJobsToDatabase(extractedData, mode) {
 }
 
 //================================ 🛸 Mode 1: Logged-in Scraper ==============================
-async function extractFromLoggedInChrome() {
+// sharedBrowser: optional already-connected browser (scraper_worker.js keeps one open)
+async function extractFromLoggedInChrome(sharedBrowser = null) {
     try {
         console.log('🔗 Mode 1: Connecting to your logged-in Chrome...');
         
         // in the browser variable add: 
         // gets the first to resolve
         // puppeteer-core library .connect method to connect to a running instance of Chrome
-        const browser = await Promise.race([ 
+        const browser = sharedBrowser || await Promise.race([ 
             puppeteerCore.connect({
                 browserURL: 'http://localhost:9222',// browser debugging port
                 defaultViewport: null, // use full size of the window
@@ -225,7 +226,7 @@ async function extractFromLoggedInChrome() {
             return results;
         });
         
-        await browser.disconnect();
+        if (!sharedBrowser) await browser.disconnect();
         return jobData;
         
     } catch (error) {
@@ -235,7 +236,7 @@ async function extractFromLoggedInChrome() {
 }
 
 //================================ 🌐 Mode 2: Universal DOM Scraper ==============================
-async function extractFromAnyPage() {
+async function extractFromAnyPage(sharedBrowser = null) {
     try {// logging start
         console.log('🌐 Mode 2: Universal DOM scraper...');
         
@@ -244,7 +245,7 @@ async function extractFromAnyPage() {
         // puppeteer-core library .connect method to connect to a running instance of Chrome
         // Add timeout to connection
         console.log('🔗 Attempting to connect to Chrome de-bugging...');
-        const browser = await Promise.race([
+        const browser = sharedBrowser || await Promise.race([
             puppeteerCore.connect({
                 browserURL: 'http://localhost:9222',
                 defaultViewport: null,
@@ -468,7 +469,7 @@ async function extractFromAnyPage() {
             return { jobs: results, pageInfo: pageInfo };
         });
         
-        await browser.disconnect();
+        if (!sharedBrowser) await browser.disconnect();
         return pageData;
         
     } catch (error) {
@@ -552,4 +553,4 @@ if (require.main === module) {
     main();
 }
 
-module.exports = { extractFromLoggedInChrome, extractFromAnyPage };
\ No newline at end of file
+module.exports = { extractFromLoggedInChrome, extractFromAnyPage, saveJobsToDatabase, checkChromeAvailable };
\ No newline at end of file
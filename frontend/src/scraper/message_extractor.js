@@ -73,12 +73,13 @@ async function saveMessagesToDatabase(messagesData, pageInfo) {
 
 //================================ 🗨️ Message Scraper Functions ==============================
 
-async function extractMessagesFromLoggedInChrome() {
+// sharedBrowser: optional already-connected browser (scraper_worker.js keeps one open)
+async function extractMessagesFromLoggedInChrome(sharedBrowser = null) {
     // ====================== 🧱🔨 connect to Chrome and extract pages ======================
     
     // Retry logic for Chrome connection
-    let browser;
-    for (let attempt = 1; attempt <= 3; attempt++) {
+    let browser = sharedBrowser;
+    for (let attempt = 1; !browser && attempt <= 3; attempt++) {
         try {
             console.log(`🔗 Connecting to your logged-in Chrome for messages... (attempt ${attempt}/3)`);
 
@@ -508,7 +509,7 @@ async function extractMessagesFromLoggedInChrome() {
         console.log(`⏱️ Extraction completed in ${extractionTime}ms`);
 
         // Close browser connection
-        await browser.disconnect();
+        if (!sharedBrowser) await browser.disconnect();
 
         return {
             messages,
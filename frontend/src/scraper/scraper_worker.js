@@ -0,0 +1,157 @@
+#!/usr/bin/env node
+/**
+ * Scraper Worker - long-lived node process that runs scrape jobs for Django
+ *
+ * Django (notification_push/scraper_worker.py) connects over a local TCP socket and
+ * sends one JSON object per line:
+ *     {"id": "<job id>", "task": "jobs" | "messages" | "active_chat", "params": {...}}
+ * The worker answers with JSON lines for the same id:
+ *     {"id": ..., "event": "started"}
+ *     {"id": ..., "event": "done", "result": {...}}   or   {"id": ..., "event": "error", "error": "..."}
+ *
+ * One CDP connection to Chrome (port 9222) is kept open and reused by every job, and jobs
+ * run one at a time so two scrapes never fight over the same tab.
+ * Jobs/messages are still saved through the Django save endpoints, exactly like the CLI scripts.
+ */
+
+const net = require('net');
+const puppeteerCore = require('puppeteer-core');
+const { extractFromLoggedInChrome, extractFromAnyPage, saveJobsToDatabase, checkChromeAvailable } = require('./enhanced_extractor');
+const { extractMessagesFromLoggedInChrome, saveMessagesToDatabase } = require('./message_extractor');
+const { scrapeActiveChatContent } = require('./active_chat_scraper');
+
+const HOST = '127.0.0.1';
+const PORT = parseInt(process.env.SCRAPER_WORKER_PORT || process.argv[2] || '9333', 10);
+
+// ================================= 🔗 shared Chrome connection ==============================
+let browser = null;
+
+async function getBrowser() {
+    // reuse the open CDP connection while Chrome is alive
+    if (browser && browser.isConnected()) {
+        return browser;
+    }
+    console.log('🔗 Connecting worker to Chrome debugger...');
+    browser = await puppeteerCore.connect({
+        browserURL: 'http://localhost:9222',
+        defaultViewport: null,
+        timeout: 15000
+    });
+    // drop the cached connection when Chrome closes so the next job reconnects
+    browser.on('disconnected', () => {
+        console.log('⚠️ Chrome connection closed');
+        browser = null;
+    });
+    console.log('✅ Worker connected to Chrome');
+    return browser;
+}
+
+// ================================= 🛸 task handlers ==============================
+const handlers = {
+    // job scrape: mode 'universal' or 'logged-in', results saved via /api/notification-push/save-jobs/
+    async jobs(params) {
+        const mode = params.mode || 'logged-in';
+        if (!(await checkChromeAvailable())) {
+            throw new Error('Chrome debugging not available on port 9222. Please start Chrome with debugging enabled.');
+        }
+        const shared = await getBrowser();
+        const extractedData = mode === 'universal'
+            ? await extractFromAnyPage(shared)
+            : await extractFromLoggedInChrome(shared);
+        const jobs = Array.isArray(extractedData) ? extractedData : extractedData.jobs || [];
+        const saved = await saveJobsToDatabase(extractedData, mode);
+        return {
+            mode: mode,
+            jobs_found: jobs.length,
+            saved_count: saved ? saved.saved_count : 0,
+            session_id: saved ? saved.session_id : null,
+            page_info: Array.isArray(extractedData) ? null : extractedData.pageInfo || null
+        };
+    },
+
+    // message extraction, results saved via /api/messages/save-messages/
+    async messages() {
+        const shared = await getBrowser();
+        const result = await extractMessagesFromLoggedInChrome(shared);
+        let saved = null;
+        if (result.messages.length > 0) {
+            saved = await saveMessagesToDatabase(result.messages, result.pageInfo);
+        }
+        return {
+            messages_found: result.messages.length,
+            saved: saved && saved.response ? saved.response.data : null,
+            page_info: result.pageInfo
+        };
+    },
+
+    // active chat content, returned to Django for AI analysis
+    async active_chat() {
+        const shared = await getBrowser();
+        return await scrapeActiveChatContent(shared);
+    }
+};
+
+// ================================= 📬 job queue (one at a time) ==============================
+let queue = Promise.resolve();
+
+function send(socket, payload) {
+    if (!socket.destroyed) {
+        socket.write(JSON.stringify(payload) + '\n');
+    }
+}
+
+function enqueue(socket, request) {
+    queue = queue.then(async () => {
+        const handler = handlers[request.task];
+        if (!handler) {
+            send(socket, { id: request.id, event: 'error', error: `Unknown task: ${request.task}` });
+            return;
+        }
+        send(socket, { id: request.id, event: 'started' });
+        const startTime = Date.now();
+        try {
+            const result = await handler(request.params || {});
+            send(socket, { id: request.id, event: 'done', result: result, duration_ms: Date.now() - startTime });
+            console.log(`✅ Job ${request.id} (${request.task}) done in ${Date.now() - startTime}ms`);
+        } catch (error) {
+            console.error(`❌ Job ${request.id} (${request.task}) failed:`, error.message);
+            send(socket, { id: request.id, event: 'error', error: error.message });
+        }
+    });
+}
+
+// ================================= 🚀 socket server ==============================
+const server = net.createServer((socket) => {
+    console.log('🔌 Django connected to scraper worker');
+    socket.setEncoding('utf8');
+    let buffer = '';
+    socket.on('data', (chunk) => {
+        buffer += chunk;
+        let newline;
+        while ((newline = buffer.indexOf('\n')) !== -1) {
+            const line = buffer.slice(0, newline).trim();
+            buffer = buffer.slice(newline + 1);
+            if (!line) continue;
+            let request;
+            try {
+                request = JSON.parse(line);
+            } catch (error) {
+                console.error('⚠️ Ignoring malformed request:', line.slice(0, 200));
+                continue;
+            }
+            if (request.task === 'ping') {
+                send(socket, { id: request.id, event: 'done', result: { pong: true } });
+                continue;
+            }
+            enqueue(socket, request);
+        }
+    });
+    socket.on('error', (error) => console.log(`⚠️ Socket error: ${error.message}`));
+});
+
+server.listen(PORT, HOST, () => {
+    console.log(`🛸 Scraper worker listening on ${HOST}:${PORT}`);
+});
+
+// keep the worker alive on stray errors from a single scrape
+process.on('unhandledRejection', (error) => console.error('⚠️ Unhandled rejection:', error));
@@ -0,0 +1,54 @@
+/**
+ * POST a JSON body to a Server-Sent Events endpoint and dispatch each event as it arrives.
+ * EventSource only supports GET, so the stream is read from fetch() directly.
+ * Aborting `signal` closes the connection, which makes the backend stop generating.
+ * @param {string} url - streaming endpoint (e.g. /api/ai/generate-cover-letter/stream/)
+ * @param {object} body - JSON request body
+ * @param {object} options - onEvent(type, data) callback, signal from an AbortController
+ * @returns {Promise<void>} resolves when the stream ends
+ */
+export async function postEventStream(url, body, { onEvent, signal } = {}) {
+  const response = await fetch(url, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(body),
+    signal
+  })
+  if (!response.ok) {
+    let error = `Request failed with status ${response.status}`
+    try {
+      error = (await response.json()).error || error
+    } catch (e) {
+      // non-JSON error body
+    }
+    throw new Error(error)
+  }
+
+  const reader = response.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+  while (true) {
+    const { value, done } = await reader.read()
+    if (done) {
+      break
+    }
+    buffer += decoder.decode(value, { stream: true })
+    let boundary
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const raw = buffer.slice(0, boundary)
+      buffer = buffer.slice(boundary + 2)
+      let type = 'message'
+      let data = ''
+      for (const line of raw.split('\n')) {
+        if (line.startsWith('event: ')) {
+          type = line.slice(7)
+        } else if (line.startsWith('data: ')) {
+          data += line.slice(6)
+        }
+      }
+      if (data && onEvent) {
+        onEvent(type, JSON.parse(data))
+      }
+    }
+  }
+}
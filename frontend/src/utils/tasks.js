@@ -0,0 +1,30 @@
+import axios from 'axios'
+
+/**
+ * Wait for a background task (task_queue) to finish.
+ * Scrape/extraction/analysis endpoints return 202 with { task_id }; this long-polls
+ * /api/tasks/<task_id>/wait/ so the browser gets the result as soon as it is stored.
+ * @param {string} taskId - id returned by the endpoint
+ * @param {object} options - { timeout } in ms, onProgress(task) callback
+ * @returns {Promise<object>} task result (same payload the endpoint used to return)
+ */
+export async function waitForTask(taskId, { timeout = 180000, onProgress } = {}) {
+  const deadline = Date.now() + timeout
+  let since = null
+  while (Date.now() < deadline) {
+    const params = since ? { since, timeout: 25 } : { timeout: 0 }
+    const response = await axios.get(`/api/tasks/${taskId}/wait/`, { params })
+    const task = response.data.task
+    since = task.updated_at
+    if (onProgress) {
+      onProgress(task)
+    }
+    if (task.status === 'completed') {
+      return task.result
+    }
+    if (task.status === 'failed') {
+      throw new Error(task.error || 'Task failed')
+    }
+  }
+  throw new Error('Task timed out')
+}